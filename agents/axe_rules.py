@@ -0,0 +1,126 @@
+"""
+Maps the enabled agents to the axe-core rules they actually consume, so the
+page capture scripts only run (and only return) what the agents will read,
+and locates the local axe-core bundle they inject.
+
+    python -m agents.axe_rules semantic axe > axe_options.json
+
+prints the axe `run` options for a set of agents, for the node runners.
+"""
+import os
+import sys
+import json
+from pathlib import Path
+
+# ─── LOCAL BUNDLE ───────────────────────────────────────────────────────────────
+AXE_VERSION = "4.10.3"
+REPO_ROOT   = Path(__file__).resolve().parent.parent
+AXE_SCRIPT_CANDIDATES = [
+    REPO_ROOT / "vendor" / "axe-core" / "axe.min.js",
+    REPO_ROOT / "node_modules" / "axe-core" / "axe.min.js",
+]
+
+def find_axe_script(path=None) -> Path:
+    """
+    Resolve the axe-core bundle: an explicit path, then $AXE_CORE_PATH, then
+    vendor/axe-core/axe.min.js, then the copy npm installed for the node runners.
+    """
+    explicit = path or os.environ.get("AXE_CORE_PATH")
+    if explicit:
+        return Path(explicit)
+    for candidate in AXE_SCRIPT_CANDIDATES:
+        if candidate.is_file():
+            return candidate
+    raise FileNotFoundError(
+        f"axe-core bundle not found in {[str(c) for c in AXE_SCRIPT_CANDIDATES]}; "
+        f"run `python scripts/fetch_axe_core.py` or `npm install axe-core@{AXE_VERSION}`, "
+        "or set AXE_CORE_PATH"
+    )
+
+def load_axe_source(path=None) -> str:
+    return find_axe_script(path).read_text(encoding="utf-8")
+
+# ─── RULE SELECTION ─────────────────────────────────────────────────────────────
+# every axe rule carries exactly one of these category tags
+ALL_CATEGORIES = [
+    "cat.aria",
+    "cat.color",
+    "cat.forms",
+    "cat.keyboard",
+    "cat.language",
+    "cat.name-role-value",
+    "cat.parsing",
+    "cat.semantics",
+    "cat.sensory-and-visual-cues",
+    "cat.structure",
+    "cat.tables",
+    "cat.text-alternatives",
+    "cat.time-and-media",
+]
+
+# Which axe categories each agent reads from `viewports[i].axe.violations`.
+# AxeViolationsAgent summarises every violation; SemanticAgent filters on
+# cat.semantics; ContrastAgent and ImageCaptioningAgent work off the
+# `contrast` / `image_captioning` capture and never look at axe.
+AGENT_AXE_TAGS = {
+    "axe":      ALL_CATEGORIES,
+    "semantic": ["cat.semantics"],
+    "contrast": [],
+    "caption":  [],
+}
+DEFAULT_AGENTS = list(AGENT_AXE_TAGS)
+
+def tags_for(agents) -> list[str]:
+    unknown = set(agents) - set(AGENT_AXE_TAGS)
+    if unknown:
+        raise ValueError(f"Unknown agents {sorted(unknown)}; expected {DEFAULT_AGENTS}")
+    tags = {t for a in agents for t in AGENT_AXE_TAGS[a]}
+    return [t for t in ALL_CATEGORIES if t in tags]
+
+def axe_run_options(agents=DEFAULT_AGENTS, *, timings: bool = True) -> dict | None:
+    """
+    axe.run() options for `agents`: restrict to their categories, only fully
+    report violations, and optionally turn on axe's performance timer.
+    None when no agent in `agents` reads axe results, i.e. axe needn't run.
+    """
+    tags = tags_for(agents)
+    if not tags:
+        return None
+    return {
+        "runOnly": {"type": "tag", "values": tags},
+        "resultTypes": ["violations"],
+        "performanceTimer": timings,
+    }
+
+# Runs axe with the given context/options, drops the result types we discard
+# and attaches per-rule durations (ms) collected from axe's performance
+# timer, which emits a `rule_<id>` measure per rule.
+AXE_RUN_JS = r"""
+async ({ scope, options }) => {
+  performance.clearMarks();
+  performance.clearMeasures();
+  const r = await axe.run({ include: [[scope]] }, options);
+  delete r.passes;
+  delete r.incomplete;
+  delete r.inapplicable;
+  if (options && options.performanceTimer) {
+    const timings = {};
+    for (const m of performance.getEntriesByType('measure')) {
+      if (!m.name.startsWith('rule_')) continue;
+      const id = m.name.slice(5);
+      timings[id] = (timings[id] || 0) + m.duration;
+    }
+    r.ruleTimings = Object.fromEntries(
+      Object.entries(timings).sort((a, b) => b[1] - a[1])
+    );
+  }
+  return r;
+}
+"""
+
+def slowest_rules(axe_result: dict | None, n: int = 5) -> list[tuple[str, float]]:
+    return list(((axe_result or {}).get("ruleTimings") or {}).items())[:n]
+
+if __name__ == "__main__":
+    json.dump(axe_run_options(sys.argv[1:] or DEFAULT_AGENTS), sys.stdout, indent=2)
+    print()
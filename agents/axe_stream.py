@@ -0,0 +1,242 @@
+"""
+Violations-only reader for page JSON.
+
+AxeViolationsAgent needs `viewports[i].axe.violations` and nothing else, but
+a merged page can carry megabytes of semantic / contrast blocks and
+passes / incomplete / inapplicable arrays around it.  `read_violations`
+walks the document structure without building it: values it does not need
+are skipped, and only the violations arrays of the requested viewports are
+handed to `json.loads`.  It stops as soon as the last requested viewport's
+violations are read.
+
+Skipping a container is a `find` when the document is indented the way
+json.dump / JSON.stringify write it (the closing bracket sits on its own
+line at the opener's indentation, and JSON strings can't hold a raw
+newline).  The hit is only taken once the brackets between opener and
+closer, strings aside, balance out; irregularly indented documents fall
+back to skipping bracket by bracket.  Compact documents (phase3_and_4's
+default) go straight to `json.loads`: a bracket-by-bracket skip of the
+whole file measured about twice as slow as the C parser.  Files are
+mmapped, so an indented document itself never lands on the Python heap.
+`.pagesnap` input goes through PageSnapshot, which decodes only the
+violations frames.
+"""
+import re
+import json
+import mmap
+from pathlib import Path
+
+from agents.page_snapshot import MAGIC, PageSnapshot
+
+def _patterns(kind):
+    enc = (lambda s: s.encode()) if kind is bytes else (lambda s: s)
+    return {
+        'ws':     re.compile(enc(r'[ \t\r\n]*')),
+        'indent': re.compile(enc(r'[ \t]*')),
+        'string': re.compile(enc(r'"(?:[^"\\]|\\.)*"'), re.S),
+        'scalar': re.compile(enc(r'[^,\]}\s]+')),
+        # everything up to the next bracket outside a string, possessively
+        'token':  re.compile(enc(r'(?:[^"\[\]{}]++|"(?:[^"\\]++|\\.)*+")*+([\[\]{}])'), re.S),
+        'chars':  {c: enc(c) for c in '{}[]":,\n'},
+    }
+
+_PATTERNS = {str: _patterns(str), bytes: _patterns(bytes)}
+_BOM      = {True: '\ufeff', False: b'\xef\xbb\xbf'}
+
+_CHUNK    = 1 << 20
+_KEEP     = bytes(set(range(256)) - set(b'{}[]"'))     # translate() deletes all but these
+_QUOTED   = re.compile(rb'"[^"]*"')
+
+def _brackets(chunk) -> bytes:
+    """The brackets of a stretch of JSON that starts and ends outside a string."""
+    if isinstance(chunk, str):
+        chunk = chunk.encode('utf-8')
+    for escape in (b'\\\\', b'\\"'):          # the only escapes that hide a kept byte
+        if escape in chunk:
+            chunk = chunk.replace(escape, b'')
+    # most strings hold no bracket and are left as '""'; dropping adjacent
+    # quotes (an empty string, or two strings with nothing between) is safe
+    return _QUOTED.sub(b'', chunk.translate(None, _KEEP).replace(b'""', b''))
+
+def _reduce(brackets: bytes) -> bytes:
+    """Cancel matched pairs until none are left; '' means balanced."""
+    while True:
+        shorter = brackets.replace(b'{}', b'').replace(b'[]', b'')
+        if len(shorter) == len(brackets):
+            return brackets
+        brackets = shorter
+
+class _Scanner:
+    def __init__(self, buf):
+        self.buf = buf
+        p = _PATTERNS[str if isinstance(buf, str) else bytes]
+        self._ws, self._indent = p['ws'], p['indent']
+        self._string, self._scalar, self._token = p['string'], p['scalar'], p['token']
+        self.c = p['chars']
+
+    def at(self, pos):
+        return self.buf[pos:pos + 1]
+
+    def match(self, pattern, pos):
+        m = pattern.match(self.buf, pos)
+        if m is None or m.end() == pos:
+            raise ValueError(f"malformed JSON at offset {pos}")
+        return m.end()
+
+    def ws(self, pos):
+        return self._ws.match(self.buf, pos).end()
+
+    def expect(self, pos, ch):
+        if self.at(pos) != self.c[ch]:
+            raise ValueError(f"expected {ch!r} at offset {pos}")
+        return pos + 1
+
+    def decode(self, start, end=None):
+        if end is None:
+            end = self.skip(start)
+        return json.loads(self.buf[start:end])
+
+    def skip(self, pos):
+        """Offset just past the JSON value starting at `pos`."""
+        ch, c = self.at(pos), self.c
+        if ch == c['"']:
+            return self.match(self._string, pos)
+        if ch not in (c['{'], c['[']):
+            return self.match(self._scalar, pos)
+
+        closer = c['}'] if ch == c['{'] else c[']']
+        nxt = self.at(pos + 1)
+        if nxt == closer:
+            return pos + 2
+        if nxt == c['\n']:
+            line = self.buf.rfind(c['\n'], 0, pos) + 1
+            marker = c['\n'] + self.buf[line:self._indent.match(self.buf, line).end()] + closer
+            end = self.buf.find(marker, pos)
+            if end >= 0 and self.closes(pos, end + len(marker)):
+                return end + len(marker)
+
+        depth, opens = 0, (c['{'], c['['])
+        for m in self._token.finditer(self.buf, pos):
+            if m.group(1) in opens:
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return m.end()
+        raise ValueError(f"unterminated container at offset {pos}")
+
+    def closes(self, start, end):
+        """
+        Whether the container opened at `start` ends exactly at `end`: the
+        brackets in between, strings aside, must balance without ever
+        closing it early.  Guards the indentation shortcut against documents
+        whose nested lines don't follow the usual layout.  Works through the
+        span in newline-bounded chunks (an indented document has no raw
+        newline inside a string), so it costs a few C passes over the bytes
+        and about one chunk of memory.
+        """
+        pending, pos, last = b'', start + 1, end - 1
+        while pos < last:
+            stop = self.buf.find(self.c['\n'], pos + _CHUNK, last) if pos + _CHUNK < last else -1
+            stop = last if stop < 0 else stop
+            pending = _reduce(pending + _brackets(self.buf[pos:stop]))
+            pos = stop
+        return not pending
+
+    def fields(self, pos, wanted):
+        """
+        Start offsets of the `wanted` keys of the object at `pos`.  Returns
+        as soon as the last one is found, without skipping its value.
+        """
+        pos = self.ws(self.expect(pos, '{'))
+        found, wanted = {}, set(wanted)
+        while self.at(pos) != self.c['}']:
+            end = self.match(self._string, pos)
+            key = json.loads(self.buf[pos:end])
+            pos = self.ws(self.expect(self.ws(end), ':'))
+            if key in wanted:
+                found[key] = pos
+                wanted.discard(key)
+                if not wanted:
+                    return found
+            pos = self.ws(self.skip(pos))
+            if self.at(pos) == self.c[',']:
+                pos = self.ws(pos + 1)
+        return found
+
+    def items(self, pos):
+        """Start offset of each element of the array at `pos`."""
+        pos = self.ws(self.expect(pos, '['))
+        while self.at(pos) != self.c[']']:
+            yield pos
+            pos = self.ws(self.skip(pos))
+            if self.at(pos) == self.c[',']:
+                pos = self.ws(pos + 1)
+
+def _scan(buf, viewports):
+    s = _Scanner(buf)
+    bom = _BOM[isinstance(buf, str)]
+    start = s.ws(len(bom) if buf[:len(bom)] == bom else 0)
+    if s.at(start + 1) != s.c['\n']:
+        raise ValueError("not an indented document")
+    vps_at = s.fields(start, {'viewports'}).get('viewports')
+    if vps_at is None or s.at(vps_at) != s.c['[']:
+        return []
+
+    wanted, last = set(viewports), max(viewports)
+    out = []
+    for i, vp_at in enumerate(s.items(vps_at)):
+        if i > last:
+            break
+        if i not in wanted:
+            continue
+        f = s.fields(vp_at, ('viewport', 'axe'))
+        name = s.decode(f['viewport']) if 'viewport' in f else None
+        violations = []
+        if 'axe' in f and s.at(f['axe']) == s.c['{']:
+            at = s.fields(f['axe'], {'violations'}).get('violations')
+            if at is not None:
+                violations = s.decode(at)
+        out.append({'index': i, 'viewport': name, 'violations': violations})
+    return out
+
+def _from_doc(doc, viewports):
+    vps = doc.get('viewports') or []
+    return [{'index': i, 'viewport': vps[i].get('viewport'),
+             'violations': (vps[i].get('axe') or {}).get('violations', [])}
+            for i in sorted(set(viewports)) if i < len(vps)]
+
+def _read(buf, viewports):
+    try:
+        return _scan(buf, viewports)
+    except ValueError:
+        # compact, or a layout the scanner doesn't understand: full parse
+        data = buf[:]
+        if isinstance(data, str):
+            data = data.removeprefix(_BOM[True])
+        return _from_doc(json.loads(data), viewports)
+
+def read_violations(source, viewports=(0,)) -> list:
+    """
+    `[{'index', 'viewport', 'violations'}]` for each requested viewport index
+    that exists in the page.  `source` is a page JSON string, JSON or
+    snapshot bytes, or a `Path` to a `.json` / `.pagesnap` file; a `str` is
+    always the document itself, never a file name.
+    """
+    if isinstance(source, Path):
+        with open(source, 'rb') as f:
+            is_snap = f.read(len(MAGIC)) == MAGIC
+            if not is_snap:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return _read(mm, viewports)
+        source = source.read_bytes()
+    if not isinstance(source, str) and bytes(source[:len(MAGIC)]) == MAGIC:
+        snap, out = PageSnapshot(source), []
+        for i in sorted(set(viewports)):
+            if i >= snap.n_viewports:
+                break
+            has_name = 'viewport' in snap.layout['viewports'][i]['keys']
+            out.append({'index': i, 'viewport': snap.section(i, 'viewport') if has_name else None,
+                        'violations': snap.axe(i, 'violations', [])})
+        return out
+    return _read(source, viewports)
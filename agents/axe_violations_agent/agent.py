@@ -1,4 +1,7 @@
-import json
+from pathlib import Path
+
+from agents.axe_stream import read_violations
+from agents.tracing import span
 
 class AxeViolationsAgent:
     """
@@ -10,28 +13,42 @@ class AxeViolationsAgent:
     def __init__(self):
         pass
 
-    def preprocess(self, raw_json: str) -> str:
+    def preprocess(self, raw_json, viewports=(0,)) -> str:
         """
-        1) Parse the JSON.
-        2) Navigate to viewports[0].axe.violations.
-        3) For each violation, extract:
+        1) Stream the page (JSON string, bytes, snapshot or a `Path`) and
+           materialise only viewports[i].axe.violations for `viewports`.
+        2) For each violation, extract:
            - id, impact
            - tags starting with "cat."
            - description, help
            - combined failureSummary of all nodes
-        4) Return a compact multi‑line summary.
+        3) Return a compact multi‑line summary, one block per viewport
+           when more than one is requested.
         """
         try:
-            doc = json.loads(raw_json)
-            vps = doc.get("viewports", [])
-            if not vps:
+            with span("axe_extract", agent="axe"):
+                found = read_violations(raw_json, viewports)
+            if not found:
                 return "No viewports in JSON."
-            violations = vps[0].get("axe", {}).get("violations", [])
-            if not violations:
+            if not any(vp["violations"] for vp in found):
                 return "No axe violations found."
         except Exception as e:
             return f"Error parsing JSON: {e}"
 
+        if len(found) == 1:
+            return self.summarize(found[0]["violations"])
+        return "\n".join(
+            f"Viewport {vp['viewport'] or vp['index']}:\n" + self.summarize(vp["violations"])
+            for vp in found
+        )
+
+    def summarize(self, violations: list) -> str:
+        if not violations:
+            return "No axe violations found."
+        with span("prompt_build", agent="axe"):
+            return self._summarize(violations)
+
+    def _summarize(self, violations: list) -> str:
         lines = []
         for viol in violations:
             vid        = viol.get("id", "<no-id>")
@@ -64,4 +81,8 @@ class AxeViolationsAgent:
         Main entrypoint: takes the raw UI JSON string and returns the
         preprocessed axe‑violations summary.
         """
-        return self.preprocess(raw_json)
\ No newline at end of file
+        return self.preprocess(raw_json)
+
+    def handle_file(self, path, viewports=(0,)) -> str:
+        """Same as `handle`, reading a page `.json` / `.pagesnap` from disk."""
+        return self.preprocess(Path(path), viewports)
@@ -1,7 +1,9 @@
-import json
 import torch
 from transformers import T5Tokenizer, T5ForConditionalGeneration
 
+from agents.page_snapshot import load_page
+from agents.tracing import span, model_name
+
 class ContrastAgent:
     def __init__(self, model_dir: str = "virajns2/contrast-violation-t5", device: str = None):
         self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
@@ -10,23 +12,28 @@ class ContrastAgent:
         self.model.to(self.device)
         self.model.eval()
 
+    def _span(self, stage: str):
+        return span(stage, agent="contrast", model=model_name(self.model))
+
     def preprocess(self, raw_json: str) -> list[str]:
         """
         Parse the JSON and return a list of input strings (only for contrast violations).
         """
-        doc = json.loads(raw_json)
+        with self._span("json_parse"):
+            doc = load_page(raw_json)
         prompts = []
 
-        for vp in doc.get("viewports", []):
-            for c in vp.get("contrast", []):
-                contrast_val = c.get("contrast", 1.0)
-                # Only keep if below WCAG minimum contrast ratio (e.g., 4.5 for normal text)
-                if contrast_val < 4.5:
-                    role = c.get("role", "unknown")
-                    fg = ",".join(map(str, c.get("fg", [0, 0, 0])))
-                    bg = ",".join(map(str, c.get("bg", [255, 255, 255])))
-                    prompt = f"role: {role}, fg: {fg}, bg: {bg}, contrast: {contrast_val:.2f}"
-                    prompts.append(prompt)
+        with self._span("prompt_build"):
+            for vp in doc.get("viewports", []):
+                for c in vp.get("contrast", []):
+                    contrast_val = c.get("contrast", 1.0)
+                    # Only keep if below WCAG minimum contrast ratio (e.g., 4.5 for normal text)
+                    if contrast_val < 4.5:
+                        role = c.get("role", "unknown")
+                        fg = ",".join(map(str, c.get("fg", [0, 0, 0])))
+                        bg = ",".join(map(str, c.get("bg", [255, 255, 255])))
+                        prompt = f"role: {role}, fg: {fg}, bg: {bg}, contrast: {contrast_val:.2f}"
+                        prompts.append(prompt)
 
         if not prompts:
             raise ValueError("No contrast violations found in JSON.")
@@ -34,23 +41,33 @@ class ContrastAgent:
         return prompts
 
     def generate_description(self, prompt: str, max_input_len: int = 64, max_output_len: int = 64, num_beams: int = 1) -> str:
-        inputs = self.tokenizer(
-            prompt,
-            max_length=max_input_len,
-            truncation=True,
-            padding="longest",
-            return_tensors="pt"
-        ).to(self.device)
-
-        with torch.no_grad():
-            out = self.model.generate(
-                input_ids=inputs.input_ids,
-                attention_mask=inputs.attention_mask,
-                max_length=max_output_len,
-                num_beams=num_beams,
-                early_stopping=True
-            )
-        return self.tokenizer.decode(out[0], skip_special_tokens=True)
+        return self.generate_descriptions([prompt], max_input_len, max_output_len, num_beams)[0]
+
+    def generate_descriptions(self, prompts: list[str], max_input_len: int = 64, max_output_len: int = 64,
+                              num_beams: int = 1, batch_size: int = 32) -> list[str]:
+        """Batched generate_description, `batch_size` prompts per generate call."""
+        out_texts = []
+        for i in range(0, len(prompts), batch_size):
+            with self._span("tokenize"):
+                inputs = self.tokenizer(
+                    prompts[i:i + batch_size],
+                    max_length=max_input_len,
+                    truncation=True,
+                    padding="longest",
+                    return_tensors="pt"
+                ).to(self.device)
+
+            with torch.no_grad(), self._span("generate"):
+                out = self.model.generate(
+                    input_ids=inputs.input_ids,
+                    attention_mask=inputs.attention_mask,
+                    max_length=max_output_len,
+                    num_beams=num_beams,
+                    early_stopping=True
+                )
+            with self._span("decode"):
+                out_texts.extend(self.tokenizer.batch_decode(out, skip_special_tokens=True))
+        return out_texts
 
     def handle(self, raw_json: str) -> str:
         """
@@ -58,5 +75,5 @@ class ContrastAgent:
         Returns a concatenated string of all descriptions.
         """
         prompts = self.preprocess(raw_json)
-        descriptions = [self.generate_description(p) for p in prompts]
+        descriptions = self.generate_descriptions(prompts)
         return " ".join(descriptions)
\ No newline at end of file
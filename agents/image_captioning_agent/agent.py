@@ -1,4 +1,4 @@
-import json, os
+import os
 from pathlib import Path
 from typing import List, Dict, Optional
 
@@ -6,6 +6,9 @@ import torch
 from PIL import Image
 from transformers import BlipProcessor, BlipForConditionalGeneration
 
+from agents.page_snapshot import load_page
+from agents.tracing import span, model_name
+
 
 class ImageCaptioningAgent:
     """
@@ -34,6 +37,9 @@ class ImageCaptioningAgent:
         )
 
     # ------------------------------------------------------------ helpers
+    def _span(self, stage: str):
+        return span(stage, agent="caption", model=model_name(self.model))
+
     def _abs_path(self, path: str) -> str:
         p = Path(path)
         if p.is_absolute() or self.root is None:
@@ -42,7 +48,8 @@ class ImageCaptioningAgent:
 
     # ------------------------------------------------------------ stage 1
     def preprocess(self, raw_json: str) -> List[Dict]:
-        doc = json.loads(raw_json)
+        with self._span("json_parse"):
+            doc = load_page(raw_json)
         crops: list[dict] = []
         for vp in doc.get("viewports", []):
             sc_path = vp.get("screenshot")
@@ -50,24 +57,26 @@ class ImageCaptioningAgent:
                 continue
             full_path = self._abs_path(sc_path)
             try:
-                screenshot = Image.open(full_path).convert("RGB")
+                with self._span("screenshot_decode"):
+                    screenshot = Image.open(full_path).convert("RGB")
             except FileNotFoundError as exc:
                 raise FileNotFoundError(f"Screenshot not found: {full_path}") from exc
 
-            for obj in vp.get("image_captioning", []):
-                bbox = obj.get("bbox", {})
-                x, y = bbox.get("x", 0), bbox.get("y", 0)
-                w, h = bbox.get("width", 0), bbox.get("height", 0)
-                if w <= 0 or h <= 0:
-                    continue
-                crop = screenshot.crop((x, y, x + w, y + h))
-                crops.append(
-                    {
-                        "nodeId": obj.get("nodeId"),
-                        "alt": obj.get("alt", ""),
-                        "image": crop,
-                    }
-                )
+            with self._span("crop"):
+                for obj in vp.get("image_captioning", []):
+                    bbox = obj.get("bbox", {})
+                    x, y = bbox.get("x", 0), bbox.get("y", 0)
+                    w, h = bbox.get("width", 0), bbox.get("height", 0)
+                    if w <= 0 or h <= 0:
+                        continue
+                    crop = screenshot.crop((x, y, x + w, y + h))
+                    crops.append(
+                        {
+                            "nodeId": obj.get("nodeId"),
+                            "alt": obj.get("alt", ""),
+                            "image": crop,
+                        }
+                    )
         if not crops:
             raise ValueError("No valid bounding boxes found in the JSON input.")
         return crops
@@ -88,11 +97,14 @@ class ImageCaptioningAgent:
                 dtype=torch.float16,
                 enabled=self.device == "cuda",
             ):
-                enc = self.processor(
-                    images=imgs, return_tensors="pt", padding=True
-                ).to(self.device)
-                ids = self.model.generate(**enc, max_new_tokens=max_tokens)
-                caps = self.processor.batch_decode(ids, skip_special_tokens=True)
+                with self._span("tokenize"):
+                    enc = self.processor(
+                        images=imgs, return_tensors="pt", padding=True
+                    ).to(self.device)
+                with self._span("generate"):
+                    ids = self.model.generate(**enc, max_new_tokens=max_tokens)
+                with self._span("decode"):
+                    caps = self.processor.batch_decode(ids, skip_special_tokens=True)
 
             for itm, cap in zip(batch, caps):
                 out.append((itm["nodeId"], itm["alt"], cap.strip()))
@@ -0,0 +1,276 @@
+"""
+Compact on-disk format for page JSON (see json_structure.txt).
+
+Layout of a `.pagesnap` file:
+
+    b'APGS' | version u8 | flags u8 | index_len u32 | index (JSON) | frames…
+
+  strings   every string value in the page, stored once (interned)
+  nodes     axe node records (entries of any `nodes` array), stored once
+            however many rules / viewports report the same element
+  root      top-level keys other than `viewports`
+  vp/<i>/<key>        one viewport block (semantic, contrast, …)
+  vp/<i>/axe/<key>    one axe report section (violations, passes, …)
+
+Frames hold JSON token streams in which a string is replaced by its index
+into `strings` and a node by `-(index + 1)` into `nodes`; real numbers are
+written as `<int>E0` / float repr so they never collide with those refs.
+That keeps decoding inside the C json scanner (with int/float hooks), and
+because each block is its own frame, reading `viewports[0].axe.violations`
+never touches `passes` or `inapplicable`.  Frames are zlib-compressed when
+flag bit 0 is set.
+
+Conversion is lossless: `loads(dumps(doc)) == doc`, key order included.
+Node records decoded from the same frame are shared objects, so copy them
+before mutating.
+
+    python -m agents.page_snapshot to-snap page.json [page.pagesnap]
+    python -m agents.page_snapshot to-json page.pagesnap [page.json]
+"""
+import sys
+import json
+import math
+import zlib
+import struct
+from pathlib import Path
+
+MAGIC     = b'APGS'
+VERSION   = 1
+SUFFIX    = '.pagesnap'
+F_ZLIB    = 0x01
+_HEADER   = struct.Struct('<4sBBI')
+AXE_KEY   = 'axe'
+NODES_KEY = 'nodes'
+
+# ─── ENCODER ────────────────────────────────────────────
+class _Encoder:
+    def __init__(self):
+        self.strings = {}
+        self.node_ids = {}
+        self.node_texts = []
+
+    def _str(self, s):
+        idx = self.strings.get(s)
+        if idx is None:
+            idx = self.strings[s] = len(self.strings)
+        return str(idx)
+
+    def emit(self, v, out, in_nodes=False):
+        if isinstance(v, str):
+            out.append(self._str(v))
+        elif v is None:
+            out.append('null')
+        elif v is True:
+            out.append('true')
+        elif v is False:
+            out.append('false')
+        elif isinstance(v, int):
+            out.append(f'{v}E0')
+        elif isinstance(v, float):
+            if math.isfinite(v):
+                out.append(repr(v))
+            else:
+                out.append('NaN' if v != v else ('Infinity' if v > 0 else '-Infinity'))
+        elif isinstance(v, dict):
+            if in_nodes:
+                out.append(self._node(v))
+                return
+            out.append('{')
+            first = True
+            for k, item in v.items():
+                if not first:
+                    out.append(',')
+                first = False
+                out.append(json.dumps(k))
+                out.append(':')
+                self.emit(item, out, in_nodes=(k == NODES_KEY and isinstance(item, list)))
+            out.append('}')
+        elif isinstance(v, (list, tuple)):
+            out.append('[')
+            for i, item in enumerate(v):
+                if i:
+                    out.append(',')
+                self.emit(item, out, in_nodes)
+            out.append(']')
+        else:
+            raise TypeError(f"not JSON serializable: {type(v).__name__}")
+
+    def _node(self, node):
+        parts = []
+        self.emit(node, parts)
+        text = ''.join(parts)
+        idx = self.node_ids.get(text)
+        if idx is None:
+            idx = self.node_ids[text] = len(self.node_texts)
+            self.node_texts.append(text)
+        return str(-(idx + 1))
+
+    def frame(self, v):
+        out = []
+        self.emit(v, out)
+        return ''.join(out).encode('utf-8')
+
+def dumps(doc: dict, compress: bool = True) -> bytes:
+    enc = _Encoder()
+    frames, layout = {}, {'root': [], 'viewports': []}
+
+    root = {k: v for k, v in doc.items() if k != 'viewports'}
+    layout['root'] = list(doc.keys())
+    frames['root'] = enc.frame(root)
+    for i, vp in enumerate(doc.get('viewports', [])):
+        keys = list(vp.keys())
+        axe_keys = None
+        for key in keys:
+            if key == AXE_KEY and isinstance(vp[key], dict):
+                axe_keys = list(vp[key].keys())
+                for akey in axe_keys:
+                    frames[f'vp/{i}/axe/{akey}'] = enc.frame(vp[key][akey])
+            else:
+                frames[f'vp/{i}/{key}'] = enc.frame(vp[key])
+        layout['viewports'].append({'keys': keys, 'axe': axe_keys})
+
+    # tables last: they are only complete once every frame is encoded
+    frames['strings'] = json.dumps(list(enc.strings), ensure_ascii=False).encode('utf-8', 'surrogatepass')
+    frames['nodes'] = json.dumps(enc.node_texts, ensure_ascii=False).encode('utf-8', 'surrogatepass')
+
+    body, offsets, pos = [], {}, 0
+    for name, data in frames.items():
+        if compress:
+            data = zlib.compress(data, 6)
+        offsets[name] = [pos, len(data)]
+        body.append(data)
+        pos += len(data)
+    index = json.dumps({'frames': offsets, 'layout': layout,
+                        'counts': {'strings': len(enc.strings), 'nodes': len(enc.node_texts)}},
+                       separators=(',', ':')).encode('utf-8')
+    header = _HEADER.pack(MAGIC, VERSION, F_ZLIB if compress else 0, len(index))
+    return b''.join([header, index, *body])
+
+# ─── DECODER ────────────────────────────────────────────
+def _number(s):
+    return int(s[:-2]) if s.endswith('E0') else float(s)
+
+class PageSnapshot:
+    """Lazy reader: frames are decompressed and decoded on first access."""
+
+    def __init__(self, data: bytes):
+        magic, version, flags, index_len = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError('not a page snapshot')
+        if version > VERSION:
+            raise ValueError(f'page snapshot version {version} is newer than this reader')
+        self._data = memoryview(data)
+        self._compressed = bool(flags & F_ZLIB)
+        start = _HEADER.size
+        index = json.loads(bytes(self._data[start:start + index_len]))
+        self._body = start + index_len
+        self._frames = index['frames']
+        self.layout = index['layout']
+        self.counts = index['counts']
+        self._strings = None
+        self._node_texts = None
+        self._nodes = {}
+
+    @classmethod
+    def open(cls, path):
+        return cls(Path(path).read_bytes())
+
+    def _raw(self, name) -> str:
+        off, length = self._frames[name]
+        data = self._data[self._body + off:self._body + off + length]
+        data = zlib.decompress(data) if self._compressed else bytes(data)
+        return data.decode('utf-8', 'surrogatepass')
+
+    def _ref(self, s):
+        i = int(s)
+        if i >= 0:
+            return self._strings[i]
+        return self._node(~i)
+
+    def _node(self, k):
+        node = self._nodes.get(k)
+        if node is None:
+            if self._node_texts is None:
+                self._node_texts = json.loads(self._raw('nodes'))
+            node = self._nodes[k] = json.loads(self._node_texts[k], parse_int=self._ref,
+                                               parse_float=_number)
+        return node
+
+    def _decode(self, name):
+        if self._strings is None:
+            self._strings = json.loads(self._raw('strings'))
+        return json.loads(self._raw(name), parse_int=self._ref, parse_float=_number)
+
+    # ── access ──────────────────────────────────────────
+    @property
+    def n_viewports(self) -> int:
+        return len(self.layout['viewports'])
+
+    def root(self) -> dict:
+        return self._decode('root')
+
+    def section(self, vp: int, key: str):
+        """One block of viewport `vp`, e.g. 'semantic' or 'contrast'."""
+        if key == AXE_KEY and self.layout['viewports'][vp]['axe'] is not None:
+            return {k: self.axe(vp, k) for k in self.layout['viewports'][vp]['axe']}
+        return self._decode(f'vp/{vp}/{key}')
+
+    def axe(self, vp: int, key: str = 'violations', default=None):
+        """One section of a viewport's axe report without decoding the others."""
+        axe_keys = self.layout['viewports'][vp]['axe']
+        if axe_keys is None or key not in axe_keys:
+            return default
+        return self._decode(f'vp/{vp}/axe/{key}')
+
+    def viewport(self, vp: int) -> dict:
+        return {k: self.section(vp, k) for k in self.layout['viewports'][vp]['keys']}
+
+    def to_dict(self) -> dict:
+        root = self.root()
+        doc = {}
+        for key in self.layout['root']:
+            if key == 'viewports':
+                doc[key] = [self.viewport(i) for i in range(self.n_viewports)]
+            else:
+                doc[key] = root[key]
+        return doc
+
+def is_snapshot(data) -> bool:
+    return bytes(data[:4]) == MAGIC
+
+def loads(data: bytes) -> dict:
+    return PageSnapshot(data).to_dict()
+
+def dump(doc: dict, path, compress: bool = True):
+    Path(path).write_bytes(dumps(doc, compress))
+
+def load(path) -> dict:
+    return PageSnapshot.open(path).to_dict()
+
+def load_page(source) -> dict:
+    """
+    What the agents parse their input with: a page JSON string, JSON or
+    snapshot bytes, or a `Path` to either.  A `str` is always JSON text,
+    never a file name.
+    """
+    if isinstance(source, Path):
+        source = source.read_bytes()
+    elif isinstance(source, str):
+        return json.loads(source)
+    if is_snapshot(source):
+        return loads(source)
+    return json.loads(source)
+
+# ─── CLI ────────────────────────────────────────────────
+if __name__ == '__main__':
+    if len(sys.argv) not in (3, 4) or sys.argv[1] not in ('to-snap', 'to-json'):
+        sys.exit(__doc__.rsplit('\n\n', 1)[-1])
+    cmd, src = sys.argv[1], Path(sys.argv[2])
+    if cmd == 'to-snap':
+        dst = Path(sys.argv[3]) if len(sys.argv) == 4 else src.with_suffix(SUFFIX)
+        dump(json.loads(src.read_text(encoding='utf-8')), dst)
+    else:
+        dst = Path(sys.argv[3]) if len(sys.argv) == 4 else src.with_suffix('.json')
+        with open(dst, 'w', encoding='utf-8') as f:
+            json.dump(load(src), f, indent=2, ensure_ascii=False)
+    print(f"✅ {src} ({src.stat().st_size / 1024:.0f} KB) → {dst} ({dst.stat().st_size / 1024:.0f} KB)")
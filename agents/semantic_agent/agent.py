@@ -3,6 +3,9 @@ import json
 import torch
 from transformers import T5Tokenizer, T5ForConditionalGeneration
 
+from agents.page_snapshot import load_page
+from agents.tracing import span, model_name
+
 class SemanticAgent:
     def __init__(self, model_dir: str, device: str = None):
         """
@@ -11,10 +14,13 @@ class SemanticAgent:
           - tokenizer files (vocab etc)
         """
         self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
-        self.tokenizer = T5Tokenizer.from_pretrained("trusha88/t5-semantic-agent")
-        self.model     = T5ForConditionalGeneration.from_pretrained("trusha88/t5-semantic-agent")
+        self.tokenizer = T5Tokenizer.from_pretrained(model_dir)
+        self.model     = T5ForConditionalGeneration.from_pretrained(model_dir)
         self.model.to(self.device)
 
+    def _span(self, stage: str):
+        return span(stage, agent="semantic", model=model_name(self.model))
+
     def preprocess(self, raw_json: str) -> str:
         """
         1) Parse the full page JSON (one page may have multiple viewports).
@@ -28,7 +34,8 @@ class SemanticAgent:
         If there are multiple viewports with violations, this example simply takes the first.
         You can easily extend it to loop over all and concatenate.
         """
-        doc = json.loads(raw_json)
+        with self._span("json_parse"):
+            doc = load_page(raw_json)
         page_id = doc.get("page_id")
 
         records = []
@@ -41,7 +48,7 @@ class SemanticAgent:
 
             # filter only the semantic-category violations
             sem_viol = [
-                viol for viol in vp.get("axe", {}).get("violations", [])
+                viol for viol in (vp.get("axe") or {}).get("violations", [])
                 if any(tag.startswith("cat.semantics") for tag in viol.get("tags", []))
             ]
             if not sem_viol:
@@ -65,11 +72,12 @@ class SemanticAgent:
         rec = records[0]
 
         # build the prompt identical to your training's make_source()
-        prompt = (
-            f"Page: {rec['page_id']} | Viewport: {rec['viewport']}\n"
-            f"Semantic Context: {json.dumps(rec['semantic'], ensure_ascii=False)}\n"
-            f"Violations: {json.dumps(rec['violations'], ensure_ascii=False)}"
-        )
+        with self._span("prompt_build"):
+            prompt = (
+                f"Page: {rec['page_id']} | Viewport: {rec['viewport']}\n"
+                f"Semantic Context: {json.dumps(rec['semantic'], ensure_ascii=False)}\n"
+                f"Violations: {json.dumps(rec['violations'], ensure_ascii=False)}"
+            )
         return prompt
 
     def generate_summary(
@@ -79,22 +87,35 @@ class SemanticAgent:
         max_output_len: int = 256,
         num_beams: int     = 4
     ) -> str:
-        inputs = self.tokenizer(
-            prompt,
-            max_length=max_input_len,
-            truncation=True,
-            padding="longest",
-            return_tensors="pt"
-        ).to(self.device)
+        return self.generate_summaries([prompt], max_input_len, max_output_len, num_beams)[0]
+
+    def generate_summaries(
+        self,
+        prompts: list[str],
+        max_input_len: int  = 512,
+        max_output_len: int = 256,
+        num_beams: int     = 4
+    ) -> list[str]:
+        """One padded generate for several prompts (e.g. from concurrent requests)."""
+        with self._span("tokenize"):
+            inputs = self.tokenizer(
+                prompts,
+                max_length=max_input_len,
+                truncation=True,
+                padding="longest",
+                return_tensors="pt"
+            ).to(self.device)
 
-        out = self.model.generate(
-            input_ids      = inputs.input_ids,
-            attention_mask = inputs.attention_mask,
-            max_length     = max_output_len,
-            num_beams      = num_beams,
-            early_stopping = True
-        )
-        return self.tokenizer.decode(out[0], skip_special_tokens=True)
+        with torch.no_grad(), self._span("generate"):
+            out = self.model.generate(
+                input_ids      = inputs.input_ids,
+                attention_mask = inputs.attention_mask,
+                max_length     = max_output_len,
+                num_beams      = num_beams,
+                early_stopping = True
+            )
+        with self._span("decode"):
+            return self.tokenizer.batch_decode(out, skip_special_tokens=True)
 
     def handle(self, raw_json: str) -> str:
         """
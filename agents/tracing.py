@@ -0,0 +1,58 @@
+"""
+Stage tracing for the agents.
+
+    from agents.tracing import span
+
+    with span("generate", agent="contrast", model=model_id):
+        out = self.model.generate(...)
+
+`span` hands off to the installed tracer: anything with a
+`span(name, **attrs)` method returning a context manager.  The default does
+nothing, so agents used outside the API pay one call per stage.
+webapp/metrics.py installs one that feeds the /metrics histograms; scripts
+can install PrintTracer, or an adapter to OpenTelemetry et al.
+
+Stage names used by the agents:
+  json_parse  prompt_build  axe_extract  tokenize  generate  decode
+  screenshot_decode  crop  handle  llm_call
+"""
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+class NoopTracer:
+    def span(self, name: str, **attrs):
+        return nullcontext()
+
+class PrintTracer:
+    """One line per finished span on stderr."""
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stderr
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - t0) * 1000
+            labels = " ".join(f"{k}={v}" for k, v in attrs.items() if v)
+            print(f"⏱  {name:<18} {ms:9.1f} ms  {labels}", file=self.stream, flush=True)
+
+_tracer = NoopTracer()
+
+def set_tracer(tracer):
+    """Install `tracer` process-wide (None restores the no-op); returns the previous one."""
+    global _tracer
+    previous, _tracer = _tracer, tracer or NoopTracer()
+    return previous
+
+def get_tracer():
+    return _tracer
+
+def span(name: str, **attrs):
+    return _tracer.span(name, **attrs)
+
+def model_name(model) -> str:
+    """Hub id or local path of a transformers model, for the `model` attribute."""
+    return getattr(getattr(model, "config", None), "name_or_path", "") or type(model).__name__
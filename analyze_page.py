@@ -1,18 +1,80 @@
 #!/usr/bin/env python3
-import sys
 import json
 import asyncio
-import io
+import hashlib
+import argparse
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
-from PIL import Image
 from playwright.async_api import async_playwright
 
-def _js_contrast_function():
-    return r"""
+import asset_cache
+import screenshot_encoding
+from dom_snapshot import capture_snapshot
+from agents.axe_rules import (
+    AXE_RUN_JS, DEFAULT_AGENTS, axe_run_options, load_axe_source, slowest_rules,
+)
+
+# ─── VIEWPORTS ────────────────────────────────────────────────────────────────────
+# same names as the phase 1 dataset; "W-H" names are plain desktop viewports
+VIEWPORTS        = ["1280-720", "1366-768", "1536-864", "1920-1080", "iPad-Pro", "iPhone-13 Pro"]
+DEFAULT_VIEWPORT = "1920-1080"
+DEVICE_VIEWPORTS = {"iPad-Pro": "iPad Pro 11", "iPhone-13 Pro": "iPhone 13 Pro"}
+
+# ─── READINESS DEFAULTS ───────────────────────────────────────────────────────────
+WAIT_UNTIL  = 'load'    # playwright load state reached before the quiescence check
+QUIET_MS    = 500       # DOM must see no mutations for this long…
+MAX_WAIT_MS = 5000      # …but never wait longer than this after WAIT_UNTIL
+
+# Resolves once the DOM has been mutation-free for `quietMs` (or after `maxMs`),
+# after web fonts are ready, so screenshots and contrast see the settled page.
+_JS_WAIT_FOR_QUIET = r"""
+async ({ quietMs, maxMs }) => {
+  const start = performance.now();
+  if (document.fonts) {
+    await Promise.race([document.fonts.ready, new Promise(r => setTimeout(r, maxMs))]);
+  }
+  return await new Promise(resolve => {
+    let quiet, cap, mutations = 0;
+    const done = reason => {
+      obs.disconnect();
+      clearTimeout(quiet);
+      clearTimeout(cap);
+      resolve({ reason, mutations, waited: performance.now() - start });
+    };
+    const obs = new MutationObserver(list => {
+      mutations += list.length;
+      clearTimeout(quiet);
+      quiet = setTimeout(() => done('quiet'), quietMs);
+    });
+    obs.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+    quiet = setTimeout(() => done('quiet'), quietMs);
+    cap = setTimeout(() => done('cap'), Math.max(0, maxMs - (performance.now() - start)));
+  });
+}
+"""
+
+@contextmanager
+def _phase(timings: dict, name: str):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = (time.perf_counter() - t0) * 1000
+
+# One round trip for everything the agents need from the live DOM: the
+# serialized HTML, the semantic summary, text contrast and image boxes.
+# Background resolution is memoized per element, so each ancestor's computed
+# style is read at most once instead of once per descendant text element.
+_JS_EXTRACT = r"""
 () => {
+  const t0 = performance.now();
+  let styleLookups = 0;
+  const styleOf = el => { styleLookups++; return window.getComputedStyle(el); };
+
   const toRgb = s => {
     const m = s.match(/rgba?\((\d+),\s*(\d+),\s*(\d+)/);
     return m ? [ +m[1], +m[2], +m[3] ] : null;
@@ -29,202 +91,493 @@ def _js_contrast_function():
     return (Math.max(L1,L2) + 0.05)/(Math.min(L1,L2) + 0.05);
   };
 
-  const tags = ['p','span','a','h1','h2','h3','h4','h5','h6','li','label','button'];
-  return Array.from(document.querySelectorAll(tags.join(','))).map(el => {
-    const cs = window.getComputedStyle(el);
-    const fg = toRgb(cs.color);
-    if (!fg) return null;
-    let bg = toRgb(cs.backgroundColor);
-    let p = el.parentElement;
-    while((!bg || bg.every(c=>c===0)) && p){
-      bg = toRgb(window.getComputedStyle(p).backgroundColor);
-      p = p.parentElement;
+  // same text as BeautifulSoup's get_text(strip=True): every text node
+  // stripped and concatenated, script/style contents ignored
+  const SKIP_TEXT = new Set(['SCRIPT', 'STYLE']);
+  const stripText = el => {
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    let out = '';
+    for (let n = walker.nextNode(); n; n = walker.nextNode()) {
+      if (!SKIP_TEXT.has(n.parentElement && n.parentElement.tagName)) out += n.nodeValue.trim();
     }
-    if (!bg) bg = [255,255,255];
-    return {
-      role: el.tagName.toLowerCase(),
-      fg, bg,
-      contrast: contrastRatio(fg,bg)
-    };
-  }).filter(x => x);
+    return out;
+  };
+  const bbox = el => {
+    const r = el.getBoundingClientRect();
+    return { x: r.x, y: r.y, width: r.width, height: r.height };
+  };
+
+  // ── html (what page.content() returns) ──
+  const dt = document.doctype;
+  const doctype = dt
+    ? `<!DOCTYPE ${dt.name}` +
+      (dt.publicId ? ` PUBLIC "${dt.publicId}"` : '') +
+      (!dt.publicId && dt.systemId ? ' SYSTEM' : '') +
+      (dt.systemId ? ` "${dt.systemId}"` : '') + '>'
+    : '';
+  const html = doctype + document.documentElement.outerHTML;
+
+  // ── semantic ──
+  const lang = document.documentElement.getAttribute('lang') || '';
+  // grouped by level, document order within a level (sort is stable)
+  const headings = Array.from(document.querySelectorAll('h1,h2,h3,h4,h5,h6'))
+    .map(h => [ +h.tagName[1], stripText(h) ])
+    .sort((a, b) => a[0] - b[0]);
+
+  const images = [], missing_alt = [], image_captioning = [];
+  const imgEls = Array.from(document.images);
+  imgEls.forEach((el, i) => {
+    const nodeId = `img-${i}`;
+    const alt = el.getAttribute('alt') || '';
+    images.push({ nodeId, alt: alt.trim() });
+    if (!alt.trim()) missing_alt.push(nodeId);
+    image_captioning.push({ nodeId, alt, bbox: bbox(el) });
+  });
+  const svgEls = Array.from(document.querySelectorAll('svg'));
+  svgEls.forEach((el, i) => {
+    const nodeId = `svg-${i}`;
+    // svg elements never have alt attributes
+    images.push({ nodeId, alt: '' });
+    missing_alt.push(nodeId);
+    image_captioning.push({ nodeId, alt: '', bbox: bbox(el) });
+  });
+
+  const links = [], missing_name = [];
+  const linkEls = document.querySelectorAll('a');
+  linkEls.forEach((a, i) => {
+    const text = stripText(a);
+    links.push({ nodeId: String(i), text });
+    if (!text) missing_name.push(String(i));
+  });
+
+  // ── contrast ──
+  // First ancestor-or-self with a non-transparent, non-black background; if
+  // none, whatever the topmost element reports (white if unparsable).
+  const bgMemo = new Map();
+  const resolveBg = (el, cs) => {
+    const chain = [];
+    let node = el, bg;
+    while (node) {
+      if (bgMemo.has(node)) { bg = bgMemo.get(node); break; }
+      const own = toRgb((node === el ? cs : styleOf(node)).backgroundColor);
+      if (own && !own.every(c => c === 0)) { bg = own; bgMemo.set(node, own); break; }
+      chain.push(own);
+      bgMemo.set(node, null);          // placeholder, filled in below
+      node = node.parentElement;
+    }
+    if (bg === undefined) bg = chain[chain.length - 1] || [255,255,255];
+    for (let n = el; n && bgMemo.get(n) === null; n = n.parentElement) bgMemo.set(n, bg);
+    return bg;
+  };
+
+  const TEXT_TAGS = ['p','span','a','h1','h2','h3','h4','h5','h6','li','label','button'];
+  const textEls = document.querySelectorAll(TEXT_TAGS.join(','));
+  const contrast = [];
+  textEls.forEach(el => {
+    const cs = styleOf(el);
+    const fg = toRgb(cs.color);
+    if (!fg) return;
+    const bg = resolveBg(el, cs);
+    contrast.push({ role: el.tagName.toLowerCase(), fg, bg, contrast: contrastRatio(fg, bg) });
+  });
+
+  return {
+    html,
+    semantic: { lang, headings, images, missing_alt, links, missing_name },
+    contrast,
+    image_captioning,
+    stats: {
+      elements: document.getElementsByTagName('*').length,
+      textElements: textEls.length,
+      images: imgEls.length,
+      svgs: svgEls.length,
+      links: linkEls.length,
+      headings: headings.length,
+      styleLookups,
+      ms: performance.now() - t0,
+    },
+  };
 }
 """
 
-async def analyze(url: str, output_path: Path):
-    async with async_playwright() as pw:
-        browser = await pw.chromium.launch(headless=True)
-        page = await browser.new_page(viewport={'width':1920,'height':1080})
-
-        # ── 1) navigate & wait ───────────────────────────────
-        await page.goto(url, wait_until='domcontentloaded', timeout=60000)
-        await page.wait_for_load_state('networkidle')
-        await page.wait_for_timeout(500)
-
-        # ── 2) screenshot → WebP ─────────────────────────────
-        png_bytes = await page.screenshot(full_page=True)
-        webp_path = output_path.with_suffix('.webp')
-        img = Image.open(io.BytesIO(png_bytes))
-        img.save(webp_path, 'WEBP')
-
-        # ── 3) inject axe-core ───────────────────────────────
-        await page.add_script_tag(
-            url='https://cdnjs.cloudflare.com/ajax/libs/axe-core/4.10.3/axe.min.js'
-        )
-
-        # ── 4) grab HTML + parse with BS4 for semantic ──────
-        html = await page.content()
-        html_path = output_path.with_suffix('.html')
-        html_path.write_text(html, encoding='utf-8')
-
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # semantic: lang + headings
-        lang = (soup.html or {}).get('lang', '')
-        headings = []
-        for lvl in range(1,7):
-            for h in soup.find_all(f'h{lvl}'):
-                headings.append([lvl, h.get_text(strip=True)])
-
-        # semantic: images + svgs / missing_alt
-        images = []
-        missing_alt = []
-
-        # 1) all <img> tags
-        for idx, img_tag in enumerate(soup.find_all('img')):
-            alt = img_tag.get('alt', '').strip()
-            node_id = f"img-{idx}"
-            images.append({'nodeId': node_id, 'alt': alt})
-            if not alt:
-                missing_alt.append(node_id)
-
-        # 2) all inline <svg> tags
-        for idx, svg_tag in enumerate(soup.find_all('svg')):
-            node_id = f"svg-{idx}"
-            # svg elements never have alt attributes
-            images.append({'nodeId': node_id, 'alt': ''})
-            missing_alt.append(node_id)
-
-        # semantic: links / missing_name (unchanged)
-        links = []
-        missing_name = []
-        for idx, a in enumerate(soup.find_all('a')):
-            txt = a.get_text(strip=True)
-            node_id = str(idx)
-            links.append({'nodeId': node_id, 'text': txt})
-            if not txt:
-                missing_name.append(node_id)
-
-        semantic = {
-            'lang': lang,
-            'headings': headings,
-            'images': images,
-            'missing_alt': missing_alt,
-            'links': links,
-            'missing_name': missing_name
-        }
-
-        # ── 5) contrast via injected JS ──────────────────────
-        contrast = await page.evaluate(_js_contrast_function())
-
-        # ── 6) image_captioning via getBoundingClientRect() ──
-        #     now includes <img> and inline <svg> elements
-        image_captioning = await page.evaluate("""
-          () => {
-            const imgCaps = Array.from(document.images).map((el,i) => {
-              const r = el.getBoundingClientRect();
-              return {
-                nodeId: `img-${i}`,
-                alt: el.getAttribute('alt') || '',
-                bbox: { x: r.x, y: r.y, width: r.width, height: r.height }
-              };
-            });
-            const svgCaps = Array.from(document.querySelectorAll('svg')).map((el,i) => {
-              const r = el.getBoundingClientRect();
-              return {
-                nodeId: `svg-${i}`,
-                alt: '',
-                bbox: { x: r.x, y: r.y, width: r.width, height: r.height }
-              };
-            });
-            return imgCaps.concat(svgCaps);
-          }
-        """)
-
-        # ── 7) axe report, drop passes/incomplete/inapplicable ─
-        await page.wait_for_timeout(5000)
-
-        axe_raw = await page.evaluate("""
-          async () => {
-            const r = await axe.run(document);
-            delete r.passes;
-            delete r.incomplete;
-            delete r.inapplicable;
-            return r;
-          }
-        """)
-
-        await browser.close()
-
-        # ── 8) assemble + write JSON ─────────────────────────
-        out = {
-            'page_id': url,
-            'viewports': [{
-                'viewport': '1920-1080',
-                'semantic': semantic,
-                'contrast': contrast,
-                'image_captioning': image_captioning,
-                'axe': axe_raw,
-                'html_path': str(html_path),
-                'screenshot': str(webp_path)
-            }]
-        }
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(out, f, indent=2, ensure_ascii=False)
+@dataclass
+class CaptureOptions:
+    agents: list = field(default_factory=lambda: list(DEFAULT_AGENTS))
+    axe_script: str | None = None
+    wait_until: str = WAIT_UNTIL
+    quiet_ms: int = QUIET_MS
+    max_wait_ms: int = MAX_WAIT_MS
+    engine: str = 'js'              # 'js' (_JS_EXTRACT) or 'cdp' (DOMSnapshot)
+    screenshot_mode: str = 'full'   # see screenshot_encoding.MODES
+    image_format: str = 'webp'
+    quality: int = 80
+    lossless: bool = False
+    encode_workers: int | None = None
+    record_dir: str | None = None   # record subresources into an asset_cache store
+    replay_dir: str | None = None   # serve them from one, never touching the network
+    block: tuple = ()               # resource types to abort, e.g. ('image', 'media', 'font')
+
+    def __post_init__(self):
+        # None when no selected agent reads axe: capture then skips it entirely
+        self.axe_options = axe_run_options(self.agents)
+        self.axe_source = (load_axe_source(self.axe_script)
+                           if self.axe_options is not None else None)
+        if self.record_dir and self.replay_dir:
+            raise ValueError('record_dir and replay_dir are mutually exclusive')
+        self.assets = None
+        if self.record_dir:
+            self.assets = asset_cache.AssetStore(self.record_dir, 'record')
+        elif self.replay_dir:
+            self.assets = asset_cache.AssetStore(self.replay_dir, 'replay')
+
+    @property
+    def routed(self) -> bool:
+        return self.assets is not None or bool(self.block)
+
+def _context_options(pw, viewport: str) -> dict:
+    if viewport in DEVICE_VIEWPORTS:
+        return dict(pw.devices[DEVICE_VIEWPORTS[viewport]])
+    width, height = (int(v) for v in viewport.split('-'))
+    return {'viewport': {'width': width, 'height': height}}
+
+def _artifact_stem(output_path: Path, viewport: str, multi: bool) -> Path:
+    if not multi:
+        return output_path
+    return output_path.with_name(f"{output_path.stem}-{viewport.replace(' ', '_')}")
 
-    print(f"✅ JSON  → {output_path}")
-    print(f"✅ HTML  → {html_path}")
-    print(f"✅ WebP  → {webp_path}")
-
-    def count_violations_nodes(node):
-        if isinstance(node, dict):
-            for key, value in node.items():
-                if key == 'violations' and isinstance(value, list):
-                    return sum(len(item.get('nodes', [])) for item in value if isinstance(item, dict))
-                else:
-                    count = count_violations_nodes(value)
-                    if count is not None:
-                        return count
-        elif isinstance(node, list):
-            for value in node:
+def output_name(page_url: str) -> str:
+    u    = urlparse(page_url)
+    host = u.netloc.replace(':','-')
+    slug = u.path.strip('/').replace('/','-')
+    return host + (f'-{slug}' if slug else '') + '.json'
+
+def hashed_output_name(name: str, text: str) -> str:
+    """`name` with a short hash of `text` before the .json suffix."""
+    return f"{name[:-len('.json')]}-{hashlib.sha1(text.encode()).hexdigest()[:10]}.json"
+
+def page_output_name(url: str) -> str:
+    """output_name(), disambiguated for URLs that only differ in their query."""
+    query = urlparse(url).query
+    return hashed_output_name(output_name(url), query) if query else output_name(url)
+
+def output_names(urls) -> dict:
+    """
+    {url: file name} with no two URLs sharing a name: page_output_name(), plus
+    a hash of the full URL where that still collides (a trailing slash, or
+    '/a-b' vs '/a/b').
+    """
+    groups = {}
+    for url in dict.fromkeys(urls):
+        groups.setdefault(page_output_name(url), []).append(url)
+    return {url: name if len(group) == 1 else hashed_output_name(name, url)
+            for name, group in groups.items() for url in group}
+
+def missing_viewports(out: dict, viewports) -> list:
+    """Requested viewports that `analyze` had to leave out of `out`."""
+    captured = {vp['viewport'] for vp in out['viewports']}
+    return [vp for vp in viewports if vp not in captured]
+
+def count_violations_nodes(node):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == 'violations' and isinstance(value, list):
+                return sum(len(item.get('nodes', [])) for item in value if isinstance(item, dict))
+            else:
                 count = count_violations_nodes(value)
                 if count is not None:
                     return count
-        return None
+    elif isinstance(node, list):
+        for value in node:
+            count = count_violations_nodes(value)
+            if count is not None:
+                return count
+    return None
+
+async def capture_viewport(pw, browser, url: str, viewport: str, stem: Path,
+                           opts: CaptureOptions):
+    """
+    Capture one (url, viewport) pair in its own browser context.  Returns the
+    `viewports[i]` entry plus per-phase timings (ms) and readiness info.
+    """
+    timings = {}
+    ctx_options = _context_options(pw, viewport)
+    if opts.routed:
+        # service workers would fetch around context.route()
+        ctx_options['service_workers'] = 'block'
+    context = await browser.new_context(**ctx_options)
+    try:
+        await asset_cache.attach(context, opts.assets, opts.block)
+        # axe-core comes from the local bundle and is registered once per
+        # context; it is evaluated in every frame before page scripts run
+        if opts.axe_source is not None:
+            await context.add_init_script(script=opts.axe_source)
+        page = await context.new_page()
+
+        # ── 1) navigate & wait for a settled DOM ─────────────
+        with _phase(timings, 'navigate'):
+            await page.goto(url, wait_until=opts.wait_until, timeout=60000)
+        with _phase(timings, 'ready'):
+            ready = await page.evaluate(_JS_WAIT_FOR_QUIET,
+                                        {'quietMs': opts.quiet_ms, 'maxMs': opts.max_wait_ms})
+
+        # ── 2) semantic + contrast + image boxes, one pass ──
+        with _phase(timings, 'extract'):
+            if opts.engine == 'cdp':
+                extracted = await capture_snapshot(context, page)
+            else:
+                extracted = await page.evaluate(_JS_EXTRACT)
+            html_path = stem.with_suffix('.html')
+            html_path.write_text(extracted['html'], encoding='utf-8')
+        semantic         = extracted['semantic']
+        contrast         = extracted['contrast']
+        image_captioning = extracted['image_captioning']
+
+        # ── 3) screenshot, encoded off the event loop ────────
+        with _phase(timings, 'screenshot'):
+            shot_path = stem.with_suffix(screenshot_encoding.suffix(opts.image_format))
+            encoded = await screenshot_encoding.capture(
+                page, shot_path, mode=opts.screenshot_mode, fmt=opts.image_format,
+                quality=opts.quality, lossless=opts.lossless,
+                bboxes=[c['bbox'] for c in image_captioning], workers=opts.encode_workers,
+            )
+
+        # ── 4) axe report, only the rules our agents consume ─
+        #     (runs while the screenshot is still being encoded)
+        axe_raw = None
+        if opts.axe_options is not None:
+            with _phase(timings, 'axe'):
+                axe_raw = await page.evaluate(AXE_RUN_JS,
+                                              {'scope': 'html', 'options': opts.axe_options})
+    finally:
+        await context.close()
+
+    with _phase(timings, 'encode_wait'):
+        shot_bytes, encode_ms = await encoded
+    timings['encode'] = encode_ms
+
+    vp_entry = {
+        'viewport': viewport,
+        'semantic': semantic,
+        'contrast': contrast,
+        'image_captioning': image_captioning,
+        'axe': axe_raw,
+        'html_path': str(html_path),
+        'screenshot': str(shot_path)
+    }
+    return vp_entry, timings, {'ready': ready, 'extract': extracted['stats'],
+                               'screenshot_bytes': shot_bytes}
+
+async def analyze(url: str, output_path: Path, opts: CaptureOptions | None = None, *,
+                  viewports=(DEFAULT_VIEWPORT,), pw=None, browser=None, limit=None,
+                  verbose=True):
+    """
+    Capture `url` at every viewport in `viewports` and write one JSON in the
+    `{'page_id', 'viewports': [...]}` schema to `output_path`.
+
+    Pass `pw`/`browser` to reuse an already running Chromium, and `limit`
+    (an asyncio.Semaphore) to bound the number of open contexts across calls.
+    Returns the written document, the summed per-phase timings and the
+    screenshot bytes written.
+    """
+    opts = opts or CaptureOptions()
+    if browser is None:
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch(headless=True)
+            try:
+                return await analyze(url, output_path, opts, viewports=viewports,
+                                     pw=pw, browser=browser, limit=limit, verbose=verbose)
+            finally:
+                await browser.close()
+                screenshot_encoding.shutdown_pool()
+
+    t_start = time.perf_counter()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    multi = len(viewports) > 1
 
-    violations_node_count = count_violations_nodes(out)
-    print(f"Total number of nodes having violations: {violations_node_count}")
+    async def one(vp):
+        stem = _artifact_stem(output_path, vp, multi)
+        if limit is None:
+            return await capture_viewport(pw, browser, url, vp, stem, opts)
+        async with limit:
+            return await capture_viewport(pw, browser, url, vp, stem, opts)
+
+    results = await asyncio.gather(*(one(vp) for vp in viewports), return_exceptions=True)
+    vp_entries, timings, shot_bytes, errors = [], {}, 0, []
+    for vp, res in zip(viewports, results):
+        if isinstance(res, BaseException):
+            # quiet callers report them from the written document (missing_viewports)
+            errors.append(f"{vp}: {res}")
+            if verbose:
+                print(f"⚠️  {url} @ {vp} failed: {res}")
+            continue
+        vp_entry, vp_timings, info = res
+        vp_entries.append(vp_entry)
+        shot_bytes += info['screenshot_bytes']
+        for name, ms in vp_timings.items():
+            timings[name] = timings.get(name, 0.0) + ms
+        if verbose:
+            ready, stats = info['ready'], info['extract']
+            print(f"   [{vp}] ready: {ready['reason']} after {ready['waited']:.0f} ms, "
+                  f"{ready['mutations']} mutations")
+            print(f"   [{vp}] extract: {stats['ms']:.0f} ms in page, {stats['elements']} elements, "
+                  f"{stats['textElements']} text / {stats['images']} img / {stats['svgs']} svg / "
+                  f"{stats['links']} links, {stats['styleLookups']} style lookups")
+            print(f"   [{vp}] screenshot: {info['screenshot_bytes'] / 1024:.0f} KB "
+                  f"({opts.screenshot_mode}, {opts.image_format}), "
+                  f"encode {vp_timings['encode']:.0f} ms off-loop")
+    if not vp_entries:
+        raise RuntimeError(f"every viewport failed for {url} ({'; '.join(errors)})")
+
+    # ── 5) assemble + write JSON ─────────────────────────
+    out = {'page_id': url, 'viewports': vp_entries}
+    with _phase(timings, 'write'):
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(out, f, indent=2, ensure_ascii=False)
+
+    if verbose:
+        print(f"✅ JSON  → {output_path}")
+        for vp_entry in vp_entries:
+            print(f"✅ HTML  → {vp_entry['html_path']}")
+            print(f"✅ Image → {vp_entry['screenshot']}")
+
+        violations_node_count = sum(count_violations_nodes(v['axe']) or 0 for v in vp_entries)
+        print(f"Total number of nodes having violations: {violations_node_count}")
+        for rule_id, ms in slowest_rules(vp_entries[0]['axe']):
+            print(f"   axe rule {rule_id:<28} {ms:8.1f} ms")
+
+        total_ms = (time.perf_counter() - t_start) * 1000
+        print(f"⏱️  {total_ms:.0f} ms total")
+        for name, ms in timings.items():
+            print(f"   {name:<12} {ms:8.1f} ms")
+        if opts.assets is not None:
+            print(f"   {opts.assets.summary()}")
+    return out, timings, shot_bytes
+
+async def analyze_batch(urls, out_dir: Path, opts: CaptureOptions | None = None, *,
+                        viewports=(DEFAULT_VIEWPORT,), concurrency: int = 4):
+    """
+    Analyse every URL in `urls` with one shared Chromium and at most
+    `concurrency` open contexts, writing one JSON per URL into `out_dir`.
+    """
+    opts = opts or CaptureOptions()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    names = output_names(urls)
+    urls = list(names)
+    limit = asyncio.Semaphore(concurrency)
+    totals, done, failed, total_bytes, vp_failed = {}, 0, 0, 0, 0
+    t0 = time.perf_counter()
+
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+
+        async def one(url):
+            nonlocal done, failed, total_bytes, vp_failed
+            t_url = time.perf_counter()
+            try:
+                out, timings, shot_bytes = await analyze(url, out_dir / names[url], opts,
+                                             viewports=viewports, pw=pw, browser=browser,
+                                             limit=limit, verbose=False)
+            except Exception as e:
+                failed += 1
+                print(f"❌ {url}: {e}")
+                return
+            done += 1
+            total_bytes += shot_bytes
+            for name, ms in timings.items():
+                totals[name] = totals.get(name, 0.0) + ms
+            missing = missing_viewports(out, viewports)
+            vp_failed += len(missing)
+            print(f"✅ [{done + failed}/{len(urls)}] {url}  {len(out['viewports'])} viewports  "
+                  f"{time.perf_counter() - t_url:.1f}s"
+                  + (f"  ⚠️  failed: {', '.join(missing)}" if missing else ""))
+
+        try:
+            await asyncio.gather(*(one(u) for u in urls))
+        finally:
+            await browser.close()
+            screenshot_encoding.shutdown_pool()
+
+    elapsed = time.perf_counter() - t0
+    print(f"🏁 {done} pages ok, {failed} failed in {elapsed:.1f}s  "
+          f"→ {done / elapsed * 60 if elapsed else 0.0:.1f} pages/minute "
+          f"({concurrency} contexts, {len(viewports)} viewports)")
+    if vp_failed:
+        print(f"   ⚠️  {vp_failed} viewports failed on pages that were written")
+    if done:
+        print(f"   screenshots: {total_bytes / 1e6:.1f} MB total, "
+              f"{total_bytes / done / 1024:.0f} KB per page")
+        print("   mean per page:")
+        for name, ms in totals.items():
+            print(f"   {name:<12} {ms / done:8.1f} ms")
+    if opts.assets is not None:
+        print(f"   {opts.assets.summary()}")
+    return done, failed
 
 if __name__ == '__main__':
-    if len(sys.argv) != 3:
-        print("Usage:\n  python analyze_page.py <page-url> <out.json-or-out-dir/>")
-        sys.exit(1)
+    ap = argparse.ArgumentParser(usage="python analyze_page.py <page-url> <out.json-or-out-dir/>\n"
+                                       "       python analyze_page.py --urls urls.txt <out-dir/>")
+    ap.add_argument('page_url', nargs='?')
+    ap.add_argument('out')
+    ap.add_argument('--urls', help='file with one URL per line (batch mode)')
+    ap.add_argument('--viewports', nargs='+', default=[DEFAULT_VIEWPORT],
+                    help=f'viewports to capture, from {VIEWPORTS} or any W-H; "all" for every one')
+    ap.add_argument('--concurrency', type=int, default=4,
+                    help='max browser contexts open at once in batch mode')
+    ap.add_argument('--agents', nargs='+', default=DEFAULT_AGENTS,
+                    help='agents whose axe rules should run (default: all)')
+    ap.add_argument('--engine', default='js', choices=['js', 'cdp'],
+                    help='DOM extraction: injected JS or a CDP DOMSnapshot')
+    ap.add_argument('--screenshot', default='full', choices=screenshot_encoding.MODES,
+                    help='full page, viewport only, or only the image bbox regions')
+    ap.add_argument('--image-format', default='webp', choices=list(screenshot_encoding.FORMATS))
+    ap.add_argument('--quality', type=int, default=80, help='webp/jpeg quality')
+    ap.add_argument('--lossless', action='store_true', help='lossless webp')
+    ap.add_argument('--encode-workers', type=int, default=None,
+                    help='processes for screenshot encoding (default: CPU count)')
+    ap.add_argument('--axe-script', default=None,
+                    help='path to axe.min.js (default: vendor/axe-core or node_modules)')
+    ap.add_argument('--wait-until', default=WAIT_UNTIL,
+                    choices=['commit', 'domcontentloaded', 'load', 'networkidle'])
+    ap.add_argument('--quiet-ms', type=int, default=QUIET_MS,
+                    help='DOM mutation quiet period before capture')
+    ap.add_argument('--max-wait-ms', type=int, default=MAX_WAIT_MS,
+                    help='cap on the readiness wait')
+    cache = ap.add_mutually_exclusive_group()
+    cache.add_argument('--record', metavar='DIR', default=None,
+                       help='record every fetched asset into DIR for later --replay')
+    cache.add_argument('--replay', metavar='DIR', default=None,
+                       help='serve assets from a --record DIR; unrecorded requests are aborted')
+    ap.add_argument('--block', nargs='+', default=[],
+                    choices=['image', 'media', 'font', 'stylesheet', 'script', 'xhr', 'fetch'],
+                    help='resource types to abort instead of loading')
+    args = ap.parse_args()
+
+    if bool(args.page_url) == bool(args.urls):
+        ap.error('give either a page URL or --urls, not both')
 
-    page_url = sys.argv[1]
-    out_arg  = sys.argv[2]
+    viewports = VIEWPORTS if args.viewports == ['all'] else args.viewports
+    opts = CaptureOptions(agents=args.agents, axe_script=args.axe_script,
+                          wait_until=args.wait_until, quiet_ms=args.quiet_ms,
+                          max_wait_ms=args.max_wait_ms, engine=args.engine,
+                          screenshot_mode=args.screenshot, image_format=args.image_format,
+                          quality=args.quality, lossless=args.lossless,
+                          encode_workers=args.encode_workers, record_dir=args.record,
+                          replay_dir=args.replay, block=tuple(args.block))
+    out_arg  = args.out
     out_path = Path(out_arg)
 
-    # if it's a directory (or ends with '/'), auto‐name
-    if out_arg.endswith('/') or out_path.is_dir():
-        out_path.mkdir(parents=True, exist_ok=True)
-        u    = urlparse(page_url)
-        host = u.netloc.replace(':','-')
-        slug = u.path.strip('/').replace('/','-')
-        fname = host + (f'-{slug}' if slug else '') + '.json'
-        output_file = out_path / fname
+    if args.urls:
+        urls = [l.strip() for l in Path(args.urls).read_text(encoding='utf-8').splitlines()
+                if l.strip() and not l.startswith('#')]
+        asyncio.run(analyze_batch(urls, out_path, opts, viewports=viewports,
+                                  concurrency=args.concurrency))
     else:
-        output_file = out_path
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        # if it's a directory (or ends with '/'), auto‐name
+        if out_arg.endswith('/') or out_path.is_dir():
+            out_path.mkdir(parents=True, exist_ok=True)
+            output_file = out_path / output_name(args.page_url)
+        else:
+            output_file = out_path
+            output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    asyncio.run(analyze(page_url, output_file))
+        asyncio.run(analyze(args.page_url, output_file, opts, viewports=viewports))
@@ -0,0 +1,135 @@
+"""
+Record/replay cache for page subresources, used by analyze_page.py.
+
+    record   every response the page fetches is stored content-addressed
+             (blobs/<sha256>) with its status and headers in index.jsonl
+    replay   requests are answered from the store through request routing;
+             anything not recorded is aborted, so capture never touches the
+             network and re-analysis runs at local-disk speed
+
+Blobs are shared by every page and viewport recorded into the same
+directory, so assets common to a site are stored once.  Independently of the
+cache, resource types can be blocked outright, as run-axe-puppeteer.js does.
+"""
+import json
+import hashlib
+from pathlib import Path
+
+# headers that describe the wire encoding of the original body, which no
+# longer applies once we hand the browser the decoded bytes
+_DROP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+def request_key(request) -> str:
+    key = f"{request.method} {request.url}"
+    if request.method != 'GET' and request.post_data_buffer:
+        key += ' ' + hashlib.sha256(request.post_data_buffer).hexdigest()
+    return key
+
+class AssetStore:
+    def __init__(self, root, mode: str):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"mode must be 'record' or 'replay', not {mode!r}")
+        self.root = Path(root)
+        self.mode = mode
+        self.blobs = self.root / 'blobs'
+        self.index_path = self.root / 'index.jsonl'
+        self.index = {}
+        self.stats = {'hits': 0, 'misses': 0, 'recorded': 0, 'recorded_bytes': 0,
+                      'served_bytes': 0, 'blocked': 0, 'failed': 0}
+
+        self.blobs.mkdir(parents=True, exist_ok=True)
+        if self.index_path.exists():
+            with open(self.index_path, encoding='utf-8') as f:
+                for line in f:
+                    entry = json.loads(line)
+                    self.index[entry['key']] = entry    # last recording wins
+        elif mode == 'replay':
+            raise FileNotFoundError(f"No recording found at {self.index_path}")
+
+    # ── storage ─────────────────────────────────────────────
+    def _put_blob(self, body: bytes) -> str:
+        digest = hashlib.sha256(body).hexdigest()
+        path = self.blobs / digest
+        if not path.exists():
+            tmp = path.with_suffix('.tmp')
+            tmp.write_bytes(body)
+            tmp.replace(path)
+        return digest
+
+    def _record(self, key, status, headers, body):
+        entry = {
+            'key': key,
+            'status': status,
+            'headers': {k: v for k, v in headers.items() if k.lower() not in _DROP_HEADERS},
+            'sha256': self._put_blob(body),
+        }
+        # a page re-recorded into the same directory mostly fetches the same
+        # bytes again; only changed responses are appended, and on load the
+        # last line for a key wins
+        if self.index.get(key) != entry:
+            self.index[key] = entry
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+        self.stats['recorded'] += 1
+        self.stats['recorded_bytes'] += len(body)
+
+    # ── routing ─────────────────────────────────────────────
+    async def handle(self, route):
+        request = route.request
+        key = request_key(request)
+
+        if self.mode == 'replay':
+            entry = self.index.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                await route.abort('internetdisconnected')
+                return
+            body = (self.blobs / entry['sha256']).read_bytes()
+            self.stats['hits'] += 1
+            self.stats['served_bytes'] += len(body)
+            await route.fulfill(status=entry['status'], headers=entry['headers'], body=body)
+            return
+
+        # record: let redirects surface to the browser so each hop is stored
+        try:
+            response = await route.fetch(max_redirects=0)
+            body = await response.body()
+        except Exception:
+            # DNS failure, reset, timeout: nothing to record, and the page
+            # should see a failed request rather than hang on it
+            self.stats['failed'] += 1
+            await route.abort('failed')
+            return
+        self._record(key, response.status, response.headers, body)
+        await route.fulfill(response=response, body=body,
+                            headers={k: v for k, v in response.headers.items()
+                                     if k.lower() not in _DROP_HEADERS})
+
+    def summary(self) -> str:
+        s = self.stats
+        if self.mode == 'replay':
+            return (f"asset cache (replay {self.root}): {s['hits']} hits, {s['misses']} misses, "
+                    f"{s['served_bytes'] / 1e6:.1f} MB served, {s['blocked']} blocked")
+        return (f"asset cache (record {self.root}): {s['recorded']} responses, "
+                f"{s['recorded_bytes'] / 1e6:.1f} MB, {s['failed']} failed, {s['blocked']} blocked")
+
+async def attach(context, store: AssetStore | None = None, block=()):
+    """
+    Route every request of `context` through the blocklist and, if given, the
+    record/replay store.  No-op when there is nothing to do.
+    """
+    block = set(block)
+    if store is None and not block:
+        return
+
+    async def handler(route):
+        if route.request.resource_type in block:
+            if store is not None:
+                store.stats['blocked'] += 1
+            await route.abort()
+        elif store is not None:
+            await store.handle(route)
+        else:
+            await route.continue_()
+
+    await context.route('**/*', handler)
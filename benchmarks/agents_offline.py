@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark of every agent and pipeline stage.
+
+No network: the T5 (contrast, semantic) and BLIP (caption) agents load tiny
+randomly-initialised models built on the spot (a sentencepiece / wordpiece
+vocabulary trained on synthetic prompts, one-layer encoder/decoder), so the
+suite runs in CI on a CPU.  Their generate timings measure the pipeline's
+tokenising, batching and decoding at a given shape, not the real
+checkpoints' cost.
+
+Synthetic pages scale with `n` (default 10 … 100k): n contrast entries,
+n // 10 axe violations of 10 nodes each, n // 10 image bboxes tiled over a
+generated screenshot, and semantic context to match.  Per size and agent:
+
+  axe       preprocess (summary text), findings (pipeline.run_axe)
+  contrast  prepare, generate, finish       (pipeline.STAGES; generate runs on
+  semantic  prepare, generate, finish        the first --generate-max items,
+  caption   prepare, generate, finish        finish on all of them)
+  fixer     pipeline.run_fixer over every finding
+  phase1    parse_rgba, contrast_ratio, resolve_bg over an n-node AX tree
+
+Results go to `--out` as JSON with the commit they ran on; `--compare` a
+previous file to flag stages that got slower by more than `--tolerance`
+(exit status 1 if any did).
+
+Usage:
+  python benchmarks/agents_offline.py [--sizes 10 100 1000 10000 100000] [--repeat 3]
+                                      [--agents axe contrast …] [--generate-max 16]
+                                      [--out results.json] [--compare baseline.json]
+"""
+import sys
+import json
+import math
+import time
+import random
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "webapp"))
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+import pipeline
+from agents.axe_violations_agent.agent import AxeViolationsAgent
+
+AGENTS = ("axe", "contrast", "semantic", "caption", "fixer", "phase1")
+MODEL_AGENTS = ("contrast", "semantic", "caption")
+SCREEN = (1920, 1080)
+TILE   = 64
+ROLES  = ["staticText", "link", "heading", "text"]
+RULES  = [("color-contrast", "serious", ["cat.color", "wcag2aa", "wcag143"]),
+          ("image-alt", "critical", ["cat.text-alternatives", "wcag2a", "wcag111"]),
+          ("heading-order", "moderate", ["cat.semantics", "best-practice"]),
+          ("landmark-one-main", "moderate", ["cat.semantics", "best-practice"]),
+          ("link-name", "serious", ["cat.name-role-value", "wcag2a", "wcag412"]),
+          ("label", "critical", ["cat.forms", "wcag2a", "wcag412"]),
+          ("region", "moderate", ["cat.keyboard", "best-practice"])]
+
+# ─── synthetic inputs ───────────────────────────────────
+def synthetic_screenshot(path: Path):
+    from PIL import Image
+    Image.effect_noise(SCREEN, 64).convert("RGB").save(path)
+    return path
+
+def synthetic_page(n: int, screenshot: Path, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    def colour():
+        return [rng.randrange(256) for _ in range(3)]
+
+    contrast = []
+    for i in range(n):
+        fg, bg = colour(), colour()
+        contrast.append({"role": ROLES[i % len(ROLES)], "backendId": i, "fg": fg, "bg": bg,
+                         "contrast": pipeline.contrast_ratio(fg, bg)})
+
+    violations = []
+    for k in range(max(1, n // 10)):
+        rid, impact, tags = RULES[k % len(RULES)]
+        if k >= len(RULES):
+            rid = f"{rid}-{k // len(RULES)}"
+        nodes = []
+        for j in range(k * 10, k * 10 + 10):
+            message = f"Element does not satisfy {rid}"
+            nodes.append({"any": [{"id": f"{rid}-check", "data": None, "relatedNodes": [],
+                                   "impact": impact, "message": message}],
+                          "all": [], "none": [], "impact": impact,
+                          "html": f'<a href="/item/{j}" class="card-{j % 37}">Item {j}</a>',
+                          "target": [f"#el-{j}"],
+                          "failureSummary": f"Fix any of the following:\n  {message}"})
+        violations.append({"id": rid, "impact": impact, "tags": tags,
+                           "description": f"Ensures {rid} is satisfied by every element",
+                           "help": f"Elements must satisfy {rid}",
+                           "helpUrl": f"https://dequeuniversity.com/rules/axe/4.10/{rid}",
+                           "nodes": nodes})
+
+    cols, rows = SCREEN[0] // TILE, SCREEN[1] // TILE
+    images = []
+    for i in range(max(1, n // 10)):
+        slot = i % (cols * rows)
+        images.append({"nodeId": f"img-{i}", "alt": f"picture {i}" if i % 4 else "",
+                       "bbox": {"x": slot % cols * TILE, "y": slot // cols * TILE,
+                                "width": TILE, "height": TILE}})
+
+    return {"page_id": f"synthetic-{n}",
+            "viewports": [{
+                "viewport": "1920-1080",
+                "semantic": {"lang": "en",
+                             "headings": [[i % 6 + 1, f"Heading {i}"] for i in range(n // 20)],
+                             "images": [{"nodeId": im["nodeId"], "alt": im["alt"]} for im in images],
+                             "missing_alt": [im["nodeId"] for im in images if not im["alt"]],
+                             "links": [{"nodeId": str(i), "text": f"Item {i}"} for i in range(n // 2)],
+                             "missing_name": []},
+                "contrast": contrast,
+                "image_captioning": images,
+                "axe": {"violations": violations},
+                "screenshot": str(screenshot)}]}
+
+def synthetic_tree(n: int, seed: int = 0):
+    """
+    phase1 inputs: AX nodes chained parent → child in blocks of 32 with the
+    background set only on each block's root (every 5th node transparent),
+    so resolve_bg walks up to 31 ancestors.
+    """
+    rng = random.Random(seed)
+    nodes, styles = [], {}
+    for i in range(n):
+        bid = i + 1
+        nodes.append({"nodeId": str(i), "backendDOMNodeId": bid,
+                      "parentId": str(i - 1) if i % 32 else None, "role": {"value": "staticText"}})
+        r, g, b = (rng.randrange(256) for _ in range(3))
+        style = {"color": f"rgb({r}, {g}, {b})" if i % 2 else f"rgba({r}, {g}, {b}, 1)"}
+        if i % 32 == 0:
+            style["background-color"] = f"rgb({b}, {r}, {g})"
+        elif i % 5 == 0:
+            style["background-color"] = "rgba(0, 0, 0, 0)"
+        styles[str(bid)] = style
+    by_back = {node["backendDOMNodeId"]: node for node in nodes}
+    by_id   = {node["nodeId"]: node for node in nodes}
+    return styles, by_back, by_id
+
+# ─── tiny models ────────────────────────────────────────
+def corpus(sizes=(10, 100)) -> list:
+    """Tokenizer training text: contrast prompts and slices of the page JSON."""
+    lines = []
+    for n in sizes:
+        page = synthetic_page(n, Path("screenshot.png"))
+        raw = pipeline.page_json(page)
+        lines += [f"role: {c['role']}, fg: {','.join(map(str, c['fg']))}, bg: "
+                  f"{','.join(map(str, c['bg']))}, contrast: {c['contrast']:.2f}"
+                  for c in page["viewports"][0]["contrast"]]
+        lines += [raw[k:k + 200] for k in range(0, len(raw), 200)]
+    return lines
+
+def build_tiny_models(root: Path) -> dict:
+    """Random one-layer T5 + BLIP checkpoints under `root` → {agent: loaded agent}."""
+    import torch
+    import sentencepiece as spm
+    from transformers import (T5Config, T5Tokenizer, T5ForConditionalGeneration, BertTokenizer,
+                              BlipConfig, BlipImageProcessor, BlipProcessor,
+                              BlipForConditionalGeneration)
+    from agents.contrast_agent.agent import ContrastAgent
+    from agents.semantic_agent.agent import SemanticAgent
+    from agents.image_captioning_agent.agent import ImageCaptioningAgent
+
+    root.mkdir(parents=True, exist_ok=True)
+    lines = corpus()
+    torch.manual_seed(0)
+
+    # T5: sentencepiece with T5's ids (pad 0, eos 1, unk 2), + the 100 extra ids
+    spm.SentencePieceTrainer.train(sentence_iterator=iter(lines), model_prefix=str(root / "spiece"),
+                                   vocab_size=256, hard_vocab_limit=False, model_type="unigram",
+                                   pad_id=0, eos_id=1, unk_id=2, bos_id=-1)
+    t5_tok = T5Tokenizer(vocab_file=str(root / "spiece.model"))
+    t5_cfg = T5Config(vocab_size=len(t5_tok), d_model=32, d_ff=64, d_kv=8, num_layers=1,
+                      num_decoder_layers=1, num_heads=2, decoder_start_token_id=0,
+                      pad_token_id=0, eos_token_id=1)
+    t5_dir = root / "t5"
+    T5ForConditionalGeneration(t5_cfg).save_pretrained(t5_dir)
+    t5_tok.save_pretrained(t5_dir)
+
+    # BLIP: wordpiece vocabulary of the corpus' characters and words, 32×32 patches
+    words = sorted({w for line in lines for w in line.split() if w.isalnum()})[:2000]
+    chars = sorted({c for line in lines for c in line if not c.isspace()})
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + chars + [f"##{c}" for c in chars] + words
+    vocab = list(dict.fromkeys(vocab))
+    (root / "vocab.txt").write_text("\n".join(vocab) + "\n", encoding="utf-8")
+    bert_tok = BertTokenizer(vocab_file=str(root / "vocab.txt"))
+    cls, sep = vocab.index("[CLS]"), vocab.index("[SEP]")
+    blip_cfg = BlipConfig(
+        text_config={"vocab_size": len(vocab), "hidden_size": 32, "encoder_hidden_size": 32,
+                     "intermediate_size": 64, "num_hidden_layers": 1, "num_attention_heads": 2,
+                     "max_position_embeddings": 64, "bos_token_id": cls, "eos_token_id": sep,
+                     "sep_token_id": sep, "pad_token_id": 0},
+        vision_config={"hidden_size": 32, "intermediate_size": 64, "num_hidden_layers": 1,
+                       "num_attention_heads": 2, "image_size": 32, "patch_size": 16},
+        projection_dim=32, image_text_hidden_size=32)
+    blip_dir = root / "blip"
+    BlipForConditionalGeneration(blip_cfg).save_pretrained(blip_dir)
+    BlipProcessor(BlipImageProcessor(size={"height": 32, "width": 32}), bert_tok).save_pretrained(blip_dir)
+
+    return {"contrast": ContrastAgent(model_dir=str(t5_dir), device="cpu"),
+            "semantic": SemanticAgent(model_dir=str(t5_dir), device="cpu"),
+            "caption":  ImageCaptioningAgent(device="cpu", model_id=str(blip_dir))}
+
+# ─── measuring ──────────────────────────────────────────
+def measure(fn, repeat: int):
+    times, out = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        times.append((time.perf_counter() - t0) * 1000)
+    return out, times
+
+class Recorder:
+    def __init__(self, repeat: int):
+        self.repeat = repeat
+        self.rows = []
+
+    def __call__(self, size, agent, stage, fn, items=None):
+        out, times = measure(fn, self.repeat)
+        if items is None:
+            items = len(out) if isinstance(out, list) else 1
+        median = statistics.median(times)
+        self.rows.append({"size": size, "agent": agent, "stage": stage, "items": items,
+                          "median_ms": median, "min_ms": min(times), "times_ms": times,
+                          "per_item_us": median * 1000 / items if items else None})
+        per_item = f"{median * 1000 / items:10.1f} µs/item" if items else ""
+        print(f"{size:>7} {agent:<9} {stage:<15} {items:>7} {median:10.2f} ms {per_item}", flush=True)
+        return out
+
+def bench_size(n, args, record, models, shot):
+    page = synthetic_page(n, shot, args.seed)
+    raw = pipeline.page_json(page)
+    detectors = {}
+
+    if "axe" in args.agents:
+        axe = AxeViolationsAgent()
+        record(n, "axe", "preprocess", lambda: axe.preprocess(raw),
+               items=len(page["viewports"][0]["axe"]["violations"]))
+        detectors["axe"] = record(n, "axe", "findings", lambda: pipeline.run_axe(axe, page, raw))
+
+    for name in MODEL_AGENTS:
+        if name not in args.agents:
+            continue
+        agent = models[name]
+        prepare, generate, finish = pipeline.STAGES[name]
+        items = record(n, name, "prepare", lambda: prepare(agent, page, raw))
+        if not items:
+            continue
+        sample = items[:args.generate_max]
+        outputs = record(n, name, "generate", lambda: generate(agent, sample))
+        recycled = (outputs * math.ceil(len(items) / len(outputs)))[:len(items)]
+        detectors[name] = record(n, name, "finish", lambda: finish(agent, page, items, recycled))
+
+    if "fixer" in args.agents:
+        record(n, "fixer", "run_fixer", lambda: pipeline.run_fixer(detectors),
+               items=sum(len(v) for v in detectors.values()))
+
+    if "phase1" in args.agents:
+        import phase1_collect as phase1
+        styles, by_back, by_id = synthetic_tree(n, args.seed)
+        strings = [s["color"] for s in styles.values()]
+        colours = record(n, "phase1", "parse_rgba", lambda: [phase1.parse_rgba(s) for s in strings])
+        pairs = list(zip(colours, colours[1:] + colours[:1]))
+        record(n, "phase1", "contrast_ratio", lambda: [phase1.contrast_ratio(fg, bg) for fg, bg in pairs])
+        record(n, "phase1", "resolve_bg",
+               lambda: [phase1.resolve_bg(bid, styles, by_back, by_id) for bid in by_back])
+
+def compare(rows, baseline_path, tolerance, min_ms) -> list:
+    base = {(r["size"], r["agent"], r["stage"]): r
+            for r in json.loads(Path(baseline_path).read_text())["results"]}
+    slower = []
+    for r in rows:
+        b = base.get((r["size"], r["agent"], r["stage"]))
+        if b is None:
+            continue
+        ratio = r["median_ms"] / b["median_ms"] if b["median_ms"] else float("inf")
+        if ratio > 1 + tolerance and r["median_ms"] - b["median_ms"] > min_ms:
+            slower.append({"size": r["size"], "agent": r["agent"], "stage": r["stage"],
+                           "baseline_ms": b["median_ms"], "median_ms": r["median_ms"], "ratio": ratio})
+    return slower
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    env = {"commit": commit, "python": platform.python_version(), "platform": platform.platform(),
+           "processor": platform.processor()}
+    for mod in ("torch", "transformers"):
+        if mod in sys.modules:
+            env[mod] = sys.modules[mod].__version__
+    return env
+
+def main(args):
+    unknown = set(args.agents) - set(AGENTS)
+    if unknown:
+        sys.exit(f"unknown agents {sorted(unknown)}, expected some of {AGENTS}")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        models = {}
+        if set(args.agents) & set(MODEL_AGENTS):
+            t0 = time.perf_counter()
+            models = build_tiny_models(Path(args.models_dir) if args.models_dir else tmp / "models")
+            print(f"✅ tiny models ready in {time.perf_counter() - t0:.1f}s")
+        # the pipeline only reads screenshots under PAGE_ROOT, by relative path
+        pipeline.PAGE_ROOT = str(tmp)
+        if "caption" in args.agents:
+            synthetic_screenshot(tmp / "screenshot.png")
+        shot = Path("screenshot.png")
+
+        record = Recorder(args.repeat)
+        print(f"{'size':>7} {'agent':<9} {'stage':<15} {'items':>7} {'median':>13}")
+        for n in args.sizes:
+            bench_size(n, args, record, models, shot)
+
+    out = {"environment": environment(), "args": vars(args), "results": record.rows}
+    status = 0
+    if args.compare:
+        slower = compare(record.rows, args.compare, args.tolerance, args.min_ms)
+        out["regressions"] = slower
+        for s in slower:
+            print(f"❌ {s['agent']}/{s['stage']} @ {s['size']}: {s['baseline_ms']:.2f} → "
+                  f"{s['median_ms']:.2f} ms ({s['ratio']:.2f}×)")
+        if slower:
+            status = 1
+        else:
+            print(f"✅ no stage slower than {args.compare} by more than {args.tolerance:.0%}")
+    if args.out:
+        Path(args.out).write_text(json.dumps(out, indent=2))
+        print(f"✅ results → {args.out}")
+    return status
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000])
+    ap.add_argument("--agents", nargs="+", default=list(AGENTS), help=f"any of {', '.join(AGENTS)}")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--generate-max", type=int, default=16, help="items per generate measurement")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--models-dir", default=None, help="keep the tiny models here instead of a temp dir")
+    ap.add_argument("--compare", default=None, help="earlier --out file to check for regressions")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    ap.add_argument("--min-ms", type=float, default=1.0, help="ignore slowdowns smaller than this")
+    ap.add_argument("--out", default=None)
+    sys.exit(main(ap.parse_args()))
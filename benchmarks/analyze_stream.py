@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Time to first finding: /analyze vs /analyze/stream.
+
+Starts the API (models from the environment, as for the server), disables
+the result cache so every request runs the agents, and posts the page
+`--repeat` times to each endpoint.  For the stream, records when each
+agent's event arrived; for /analyze, the full response time (which is when
+the UI sees its first finding).
+
+Usage:
+  python benchmarks/analyze_stream.py [--page test_data/test_file.json] [--repeat 5]
+                                      [--sse] [--out results.json]
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+import httpx
+
+from api_batching import REPO_ROOT, WEBAPP, _free_port, _wait_healthy
+
+async def one_stream(client, url, page, sse):
+    headers = {"accept": "text/event-stream"} if sse else {}
+    arrivals = {}
+    t0 = time.perf_counter()
+    async with client.stream("POST", f"{url}/analyze/stream", json=page, headers=headers) as r:
+        r.raise_for_status()
+        async for line in r.aiter_lines():
+            if sse:
+                if not line.startswith("data: "):
+                    continue
+                line = line[len("data: "):]
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            name = event["agent"] if event["event"] == "agent" else event["event"]
+            arrivals[name] = (time.perf_counter() - t0) * 1000
+    return arrivals
+
+async def main(args):
+    page = json.loads(Path(args.page).read_text(encoding="utf-8"))
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}"
+    env = {**os.environ, "RESULT_CACHE_ITEMS": "0"}
+    proc = subprocess.Popen([sys.executable, "-m", "uvicorn", "app:app", "--port", str(port),
+                             "--log-level", "warning"], cwd=WEBAPP, env=env)
+    try:
+        await _wait_healthy(url, proc, args.health_timeout)
+        async with httpx.AsyncClient(timeout=600) as client:
+            await client.post(f"{url}/analyze", json=page)             # warm-up
+            full, streams = [], []
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                (await client.post(f"{url}/analyze", json=page)).raise_for_status()
+                full.append((time.perf_counter() - t0) * 1000)
+                streams.append(await one_stream(client, url, page, args.sse))
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+    first = [min(v for k, v in s.items() if k != "fixer") for s in streams]
+    summary = {"analyze_ms": statistics.median(full),
+               "stream_first_ms": statistics.median(first),
+               "stream_done_ms": statistics.median(s["fixer"] for s in streams),
+               "per_agent_ms": {name: statistics.median(s[name] for s in streams)
+                                for name in streams[0] if name != "fixer"}}
+    print(f"/analyze              {summary['analyze_ms']:8.0f} ms  (first finding = full response)")
+    print(f"/analyze/stream first {summary['stream_first_ms']:8.0f} ms")
+    for name, ms in sorted(summary["per_agent_ms"].items(), key=lambda kv: kv[1]):
+        print(f"    {name:<10} {ms:8.0f} ms")
+    print(f"/analyze/stream done  {summary['stream_done_ms']:8.0f} ms")
+    if args.out:
+        Path(args.out).write_text(json.dumps({"summary": summary, "analyze_ms": full,
+                                              "streams": streams}, indent=2))
+        print(f"✅ results → {args.out}")
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--page", default=str(REPO_ROOT / "test_data" / "test_file.json"))
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--sse", action="store_true", help="request text/event-stream instead of NDJSON")
+    ap.add_argument("--health-timeout", type=float, default=900)
+    ap.add_argument("--out", default=None)
+    asyncio.run(main(ap.parse_args()))
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Load test for cross-request micro-batching in webapp/app.py.
+
+Starts the API twice, once with batching off (BATCH_WINDOW_MS=0) and once
+with it on, and drives /analyze with 1, 8 and 32 concurrent clients posting
+the same page for a fixed duration.  Reports throughput, latency and the
+batch sizes / queue depths the server saw, plus the batched/unbatched
+throughput ratio per client count.
+
+Model ids and worker counts come from the environment as for the server
+(SEMANTIC_MODEL, AGENT_WORKERS, TORCH_THREADS, …).
+
+Usage:
+  python benchmarks/api_batching.py [--page test_data/test_file.json] [--clients 1 8 32]
+                                    [--duration 30] [--window-ms 5] [--out results.json]
+"""
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+import httpx
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+WEBAPP    = REPO_ROOT / "webapp"
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+async def _wait_healthy(url, proc, timeout):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                raise RuntimeError(f"server exited with {proc.returncode}")
+            try:
+                r = await client.get(f"{url}/health")
+                if r.status_code == 200:
+                    return r.json()
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.5)
+    raise TimeoutError("server did not become healthy (models still loading?)")
+
+async def drive(url, page, clients, duration):
+    latencies, errors = [], 0
+    stop = time.perf_counter() + duration
+
+    async def client_loop(client):
+        nonlocal errors
+        while time.perf_counter() < stop:
+            t0 = time.perf_counter()
+            try:
+                r = await client.post(f"{url}/analyze", json=page)
+                ok = r.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            if ok:
+                latencies.append((time.perf_counter() - t0) * 1000)
+            else:
+                errors += 1
+
+    t0 = time.perf_counter()
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(timeout=300, limits=limits) as client:
+        await asyncio.gather(*(client_loop(client) for _ in range(clients)))
+        health = (await client.get(f"{url}/health")).json()
+    elapsed = time.perf_counter() - t0
+    lat = sorted(latencies)
+    return {
+        "clients": clients,
+        "requests": len(lat),
+        "errors": errors,
+        "rps": len(lat) / elapsed,
+        "p50_ms": statistics.median(lat) if lat else None,
+        "p95_ms": lat[int(len(lat) * 0.95) - 1] if len(lat) >= 20 else (lat[-1] if lat else None),
+        "batching": health.get("batching", {}),
+    }
+
+async def run_config(name, env_overrides, page, client_counts, duration, health_timeout):
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}"
+    env = {**os.environ, **env_overrides}
+    proc = subprocess.Popen([sys.executable, "-m", "uvicorn", "app:app", "--port", str(port),
+                             "--log-level", "warning"], cwd=WEBAPP, env=env)
+    rows = []
+    try:
+        await _wait_healthy(url, proc, health_timeout)
+        await drive(url, page, 1, min(duration, 3))          # warm-up
+        for clients in client_counts:
+            row = await drive(url, page, clients, duration)
+            row["config"] = name
+            rows.append(row)
+            sizes = {m: f"{b['mean_batch_size']:.1f} (max queue {b['max_queue_depth']})"
+                     for m, b in row["batching"].items()}
+            print(f"{name:<10} {clients:>3} clients  {row['rps']:7.2f} req/s  "
+                  f"p50 {row['p50_ms'] or 0:8.0f} ms  p95 {row['p95_ms'] or 0:8.0f} ms  "
+                  f"errors {row['errors']}  {sizes or ''}")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+    return rows
+
+async def main(args):
+    page = json.loads(Path(args.page).read_text(encoding="utf-8"))
+    results = []
+    results += await run_config("unbatched", {"BATCH_WINDOW_MS": "0"}, page,
+                                args.clients, args.duration, args.health_timeout)
+    results += await run_config("batched", {"BATCH_WINDOW_MS": str(args.window_ms),
+                                            "MAX_BATCH": str(args.max_batch)}, page,
+                                args.clients, args.duration, args.health_timeout)
+
+    print("\nthroughput gain (batched / unbatched):")
+    for clients in args.clients:
+        base = next(r for r in results if r["config"] == "unbatched" and r["clients"] == clients)
+        new  = next(r for r in results if r["config"] == "batched" and r["clients"] == clients)
+        print(f"   {clients:>3} clients  ×{new['rps'] / base['rps'] if base['rps'] else float('nan'):.2f}")
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, indent=2))
+        print(f"✅ results → {args.out}")
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--page", default=str(REPO_ROOT / "test_data" / "test_file.json"))
+    ap.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    ap.add_argument("--duration", type=float, default=30, help="seconds per client count")
+    ap.add_argument("--window-ms", type=float, default=5)
+    ap.add_argument("--max-batch", type=int, default=16)
+    ap.add_argument("--health-timeout", type=float, default=900,
+                    help="seconds to wait for models to load")
+    ap.add_argument("--out", default=None)
+    asyncio.run(main(ap.parse_args()))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Compare analyze_page's DOM extraction engines on large synthetic pages.
+
+For each page size the same file:// page is loaded once and extracted
+`--repeat` times with the injected-JS engine and with the CDP DOMSnapshot
+engine.  Reports median wall time per engine and whether both produced the
+same semantic / contrast / image_captioning blocks.
+
+Usage:
+  python benchmarks/capture_engines.py [--sizes 1000 10000 50000] [--repeat 5] [--out results.json]
+"""
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from playwright.async_api import async_playwright
+from analyze_page import _JS_EXTRACT
+from dom_snapshot import capture_snapshot
+
+def synthetic_page(n_text: int) -> str:
+    """Roughly `n_text` text elements, nested a few levels, with images and svgs."""
+    parts = ['<!DOCTYPE html><html lang="en"><body style="background: rgb(250,250,250)">']
+    per_section = 20
+    for s in range(max(1, n_text // per_section)):
+        bg = "rgb(30,30,60)" if s % 7 == 0 else "transparent"
+        parts.append(f'<section style="background:{bg}"><h{s % 6 + 1}>Section {s}</h{s % 6 + 1}><div><ul>')
+        for i in range(per_section - 1):
+            color = f"rgb({(s * 13 + i * 7) % 256},{(i * 31) % 256},{(s * 5) % 256})"
+            parts.append(f'<li><span style="color:{color}">item {i} <b>bold</b></span> '
+                         f'<a href="#s{s}-{i}">{"link" if i % 4 else ""}</a></li>')
+        parts.append('</ul></div>')
+        if s % 5 == 0:
+            alt = f'alt="picture {s}"' if s % 10 else ''
+            parts.append(f'<img src="data:image/gif;base64,R0lGODlhAQABAAAAACw=" width="40" height="30" {alt}>')
+            parts.append('<svg width="16" height="16"><circle cx="8" cy="8" r="6"/></svg>')
+        parts.append('</section>')
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+def _comparable(extracted):
+    return {k: extracted[k] for k in ('semantic', 'contrast', 'image_captioning')}
+
+async def bench_size(browser, n_text, repeat, workdir):
+    path = Path(workdir) / f"page-{n_text}.html"
+    path.write_text(synthetic_page(n_text), encoding='utf-8')
+    context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
+    page = await context.new_page()
+    await page.goto(path.as_uri(), wait_until='load')
+
+    engines = {
+        'js':  lambda: page.evaluate(_JS_EXTRACT),
+        'cdp': lambda: capture_snapshot(context, page),
+    }
+    row = {'text_elements': n_text}
+    outputs = {}
+    for name, run in engines.items():
+        await run()                                   # warm-up
+        wall = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            outputs[name] = await run()
+            wall.append((time.perf_counter() - t0) * 1000)
+        row[name] = {
+            'median_ms': statistics.median(wall),
+            'min_ms': min(wall),
+            'elements': outputs[name]['stats']['elements'],
+            'style_lookups': outputs[name]['stats']['styleLookups'],
+        }
+    row['identical'] = _comparable(outputs['js']) == _comparable(outputs['cdp'])
+    row['speedup'] = row['js']['median_ms'] / row['cdp']['median_ms']
+    await context.close()
+    return row
+
+async def main(sizes, repeat, out):
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch(headless=True)
+            for n in sizes:
+                row = await bench_size(browser, n, repeat, workdir)
+                results.append(row)
+                print(f"{n:>8} text els  js {row['js']['median_ms']:8.1f} ms   "
+                      f"cdp {row['cdp']['median_ms']:8.1f} ms   "
+                      f"×{row['speedup']:.2f}   identical={row['identical']}")
+            await browser.close()
+    if out:
+        Path(out).write_text(json.dumps(results, indent=2))
+        print(f"✅ results → {out}")
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    ap.add_argument('--repeat', type=int, default=5)
+    ap.add_argument('--out', default=None)
+    args = ap.parse_args()
+    asyncio.run(main(args.sizes, args.repeat, args.out))
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Data-side latency of one Streamlit rerun of webapp/accessibility_eval_app.py,
+before and after the eval_data layer.
+
+before: build SITE_JSON_MAP, fetch sites, the screenshot row and every
+        feedback row for the site, regex-split the FixingAgent reply twice,
+        group the votes, one insert per click
+after:  DataLayer reads (TTL cache), precomputed splits, queued votes
+
+Runs against the local SQLite backend.  `--rtt-ms` adds a sleep per backend
+call to stand in for the Supabase round trip.  Widget rendering is the same
+in both and is not measured.
+
+Usage:
+  python benchmarks/dashboard_rerun.py [--reruns 200] [--votes 5000] [--rtt-ms 0 80]
+                                       [--out results.json]
+"""
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+from collections import Counter
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+WEBAPP    = REPO_ROOT / "webapp"
+sys.path.insert(0, str(WEBAPP))
+from eval_data import SITES, DataLayer, SQLiteBackend
+
+SITE_SOURCE = compile((WEBAPP / "site_responses.py").read_text(encoding="utf-8"),
+                      "site_responses.py", "exec")
+
+class RoundTrip:
+    """Backend wrapper adding `rtt_ms` of latency per call."""
+    def __init__(self, backend, rtt_ms):
+        self.backend, self.rtt = backend, rtt_ms / 1000
+
+    def __getattr__(self, name):
+        fn = getattr(self.backend, name)
+        def call(*args, **kwargs):
+            time.sleep(self.rtt)
+            return fn(*args, **kwargs)
+        return call
+
+def split(raw):
+    return re.split(r"\n\n(?=\d+\.)", raw)[1:]
+
+def rerun_before(backend, site, click):
+    ns = {}
+    exec(SITE_SOURCE, ns)                                   # literal rebuilt per rerun
+    backend.sites()
+    backend.screenshot(site)
+    fix = next(m for m in ns["SITE_JSON_MAP"][site] if m["name"] == "FixingAgent")["content"]
+    sugs = split(fix)                                       # Review tab
+    if click:
+        backend.insert_votes([{"site_name": site, "fix_index": click, "action": "up"}])
+    rows = backend.feedback_rows(site)                      # Stats tab: every row
+    titles = [re.match(r"\d+\.\s*(.+)", s) for s in split(fix)]
+    Counter((r["fix_index"], r["action"]) for r in rows)
+    return len(sugs), len(titles)
+
+def rerun_after(data, site, click):
+    data.sites()
+    data.screenshot(site)
+    sugs = SITES[site]["suggestions"]
+    if click:
+        data.vote(site, click, "up")
+    data.vote_counts(site)
+    return len(sugs)
+
+def main(args):
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        local = SQLiteBackend(str(Path(workdir) / "eval.db"), screenshots=WEBAPP / "webp")
+        sites = local.sites()
+        rng = random.Random(0)
+        local.insert_votes([{"site_name": rng.choice(sites), "fix_index": rng.randint(1, 6),
+                             "action": rng.choice(("up", "down"))} for _ in range(args.votes)])
+
+        for rtt in args.rtt_ms:
+            backend = RoundTrip(local, rtt)
+            data = DataLayer(backend, ttl=args.ttl, flush_ms=args.flush_ms)
+            # interactions: mostly browsing one site, a vote every `click_every` reruns
+            plan = [(rng.choice(sites[:3]), (i % 6) + 1 if i % args.click_every == 0 else 0)
+                    for i in range(args.reruns)]
+            for name, fn, target in (("before", rerun_before, backend), ("after", rerun_after, data)):
+                times = []
+                for site, click in plan:
+                    t0 = time.perf_counter()
+                    fn(target, site, click)
+                    times.append((time.perf_counter() - t0) * 1000)
+                times.sort()
+                row = {"config": name, "rtt_ms": rtt, "reruns": len(times),
+                       "p50_ms": statistics.median(times),
+                       "p95_ms": times[int(len(times) * 0.95) - 1],
+                       "mean_ms": statistics.fmean(times)}
+                results.append(row)
+                print(f"{name:<7} rtt {rtt:>4} ms   p50 {row['p50_ms']:8.2f} ms   "
+                      f"p95 {row['p95_ms']:8.2f} ms   mean {row['mean_ms']:8.2f} ms")
+            data.flush()
+            print(f"   cache {data.stats['hits']} hits / {data.stats['misses']} misses, "
+                  f"{data.stats['flushed']} votes in {data.stats['flushes']} flushes")
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, indent=2))
+        print(f"✅ results → {args.out}")
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--reruns", type=int, default=200)
+    ap.add_argument("--votes", type=int, default=5000, help="votes already stored")
+    ap.add_argument("--rtt-ms", type=float, nargs="+", default=[0, 80])
+    ap.add_argument("--click-every", type=int, default=4)
+    ap.add_argument("--ttl", type=float, default=30)
+    ap.add_argument("--flush-ms", type=float, default=500)
+    ap.add_argument("--out", default=None)
+    main(ap.parse_args())
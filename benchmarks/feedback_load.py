@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Concurrent write test for the /feedback store.
+
+`direct` hammers the stores from a thread pool: the old read-append-rewrite
+feedback_store.json (the pre-SQLite `save_feedback`) against FeedbackStore.
+`http` starts the API (AGENTS=axe, so no model is loaded) on a fresh
+database and posts votes from concurrent clients.  Both report writes/s and
+check that every acknowledged vote is in the store exactly once.
+`stats` times the per-page dashboard query at growing row counts: the
+maintained counters (`FeedbackStore.stats`, behind /feedback/stats) against
+fetching the page's rows and grouping them, as the Stats tab does.
+
+Usage:
+  python benchmarks/feedback_load.py [--mode direct http stats] [--concurrency 1 8 64]
+                                     [--writes 2000] [--rows 1000 100000 1000000]
+                                     [--out results.json]
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import socket
+import asyncio
+import argparse
+import tempfile
+import statistics
+import datetime
+import threading
+import subprocess
+from pathlib import Path
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+WEBAPP    = REPO_ROOT / "webapp"
+sys.path.insert(0, str(WEBAPP))
+from feedback_db import FeedbackStore
+
+AGENTS = ("semantic", "contrast", "caption", "axe")
+
+def make_vote(i: int) -> dict:
+    rng = random.Random(i)
+    return {"page_id": f"page-{rng.randrange(50)}",
+            "agent": rng.choice(AGENTS),
+            "suggestion": {"node": f"#n{rng.randrange(500)}", "issue_type": "heading-order",
+                           "detail": "H3 appears before H2.", "fix": "Reorder headings."},
+            "action": rng.choice(("up", "down")),
+            "comment": f"vote {i}"}
+
+# ─── direct: stores in-process ──────────────────────────
+def legacy_append(path: Path, row: dict):
+    """What save_feedback used to do on every vote."""
+    data = json.loads(path.read_text())
+    data.append(row)
+    path.write_text(json.dumps(data, indent=2))
+
+def run_direct(backend, concurrency, writes, workdir):
+    if backend == "json":
+        path = Path(workdir) / f"store-{concurrency}.json"
+        path.write_text("[]")
+        write = lambda row: legacy_append(path, row)
+        def stored():
+            try:
+                return [r["id"] for r in json.loads(path.read_text())]
+            except ValueError:          # a torn write left the file unreadable
+                return []
+    else:
+        store = FeedbackStore(Path(workdir) / f"store-{concurrency}.db")
+        write = store.append
+        stored = lambda: [r["id"] for r in store.rows()]
+
+    acked, errors = [], 0
+    lock = threading.Lock()
+    def one(i):
+        nonlocal errors
+        row = {**make_vote(i), "id": str(uuid.uuid4()),
+               "timestamp": datetime.datetime.utcnow().isoformat()}
+        try:
+            write(row)
+        except Exception:
+            with lock:
+                errors += 1
+            return
+        with lock:
+            acked.append(row["id"])
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(writes)))
+    elapsed = time.perf_counter() - t0
+    return acked, errors, elapsed, stored()
+
+# ─── http: the running API ──────────────────────────────
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+async def _wait_healthy(url, proc, timeout=60):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                raise RuntimeError(f"server exited with {proc.returncode}")
+            try:
+                if (await client.get(f"{url}/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise TimeoutError("server did not become healthy")
+
+async def _post_all(url, concurrency, writes):
+    acked, errors = [], 0
+    counter = iter(range(writes))
+
+    async def client_loop(client):
+        nonlocal errors
+        for i in counter:
+            try:
+                r = await client.post(f"{url}/feedback", json=make_vote(i))
+                if r.status_code == 200:
+                    acked.append(r.json()["id"])
+                    continue
+            except httpx.HTTPError:
+                pass
+            errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(timeout=60, limits=limits) as client:
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+    return acked, errors
+
+def run_http(concurrency, writes, workdir):
+    db = Path(workdir) / f"api-{concurrency}.db"
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}"
+    env = {**os.environ, "AGENTS": "axe", "FEEDBACK_DB": str(db)}
+    proc = subprocess.Popen([sys.executable, "-m", "uvicorn", "app:app", "--port", str(port),
+                             "--log-level", "warning"], cwd=WEBAPP, env=env)
+    try:
+        asyncio.run(_wait_healthy(url, proc))
+        t0 = time.perf_counter()
+        acked, errors = asyncio.run(_post_all(url, concurrency, writes))
+        elapsed = time.perf_counter() - t0
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+    return acked, errors, elapsed, [r["id"] for r in FeedbackStore(db).rows()]
+
+# ─── stats: counters vs scan ────────────────────────────
+def scan_stats(store, page_id):
+    counts = Counter()
+    for row in store.rows(page_id):
+        counts[(row["agent"], json.dumps(row["suggestion"], sort_keys=True), row["action"])] += 1
+    return counts
+
+def run_stats(sizes, workdir, repeat=5):
+    store = FeedbackStore(Path(workdir) / "stats.db")
+    rows = []
+    for n in sizes:
+        have = store.count()
+        for start in range(have, n, 50_000):
+            store.extend(make_vote(i) for i in range(start, min(n, start + 50_000)))
+        page = "page-0"
+        timings = {}
+        for name, fn in (("counters", lambda: store.stats(page)), ("scan", lambda: scan_stats(store, page))):
+            times = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                fn()
+                times.append((time.perf_counter() - t0) * 1000)
+            timings[name] = statistics.median(times)
+        assert store.stats(page)["total"] == store.count(page)
+        rows.append({"mode": "stats", "rows": n, "page_rows": store.count(page),
+                     "counters_ms": timings["counters"], "scan_ms": timings["scan"]})
+        print(f"📊 stats  {n:>9} rows  ({rows[-1]['page_rows']:>7} on page)  "
+              f"counters {timings['counters']:7.2f} ms   scan {timings['scan']:9.1f} ms")
+    return rows
+
+def main(args):
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for mode in args.mode:
+            if mode == "stats":
+                results += run_stats(args.rows, workdir)
+                continue
+            backends = ("json", "sqlite") if mode == "direct" else ("api",)
+            for backend in backends:
+                for c in args.concurrency:
+                    # the JSON store is O(n) per write; keep its run short
+                    writes = min(args.writes, args.legacy_writes) if backend == "json" else args.writes
+                    if mode == "direct":
+                        acked, errors, elapsed, stored = run_direct(backend, c, writes, workdir)
+                    else:
+                        acked, errors, elapsed, stored = run_http(c, writes, workdir)
+                    stored_set = set(stored)
+                    row = {"mode": mode, "backend": backend, "concurrency": c, "writes": writes,
+                           "acked": len(acked), "errors": errors,
+                           "lost": len(set(acked) - stored_set),
+                           "duplicates": len(stored) - len(stored_set),
+                           "writes_per_s": len(acked) / elapsed}
+                    results.append(row)
+                    flag = "✅" if not row["lost"] and not row["duplicates"] and not errors else "❌"
+                    print(f"{flag} {mode:<6} {backend:<6} {c:>4} writers  {writes:>6} writes  "
+                          f"{row['writes_per_s']:9.0f}/s  acked {row['acked']:>6}  "
+                          f"lost {row['lost']:>5}  errors {errors}")
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, indent=2))
+        print(f"✅ results → {args.out}")
+    return results
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--mode", nargs="+", choices=("direct", "http", "stats"),
+                    default=["direct", "http", "stats"])
+    ap.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 64])
+    ap.add_argument("--writes", type=int, default=2000)
+    ap.add_argument("--legacy-writes", type=int, default=500,
+                    help="cap for the JSON-rewrite baseline")
+    ap.add_argument("--rows", type=int, nargs="+", default=[1000, 100_000, 1_000_000],
+                    help="store sizes for the stats mode")
+    ap.add_argument("--out", default=None)
+    main(ap.parse_args())
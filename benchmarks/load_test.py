@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Load test for the API: latency percentiles, throughput and error rates per
+endpoint, optionally for several server configurations side by side.
+
+Each configuration starts its own server (uvicorn app:app in webapp/) with
+the given environment overrides and fresh feedback / jobs / incremental
+databases and result cache, so runs never see each other's data, and one
+job worker when `jobs` is in the mix.  `--url` drives an already running
+server instead.
+
+Requests replay page snapshots (`--pages`, default test_data/test_file.json)
+and `--variants` generated variations of them: their own page_id, some axe
+violations dropped, contrast colours shifted.  Fewer variants means more
+repeats, i.e. more result-cache hits.  Endpoints are picked per request by
+the `--mix` weights:
+
+  analyze  analyze_stream  reanalyze  jobs          POST with a page
+  feedback                                          POST a vote on one of its findings
+  feedback_stats  cache_stats  health               GET
+
+Arrivals are open-loop Poisson at each of `--rates` (req/s), at most
+`--concurrency` in flight; latency counts from the scheduled arrival, so a
+saturated server shows up as queueing rather than fewer requests.  Rate 0
+runs closed-loop: `--concurrency` clients back to back.
+
+Usage:
+  python benchmarks/load_test.py [--config NAME:KEY=VAL,KEY=VAL …] [--url http://…]
+                                 [--rates 5 20 50] [--concurrency 64] [--duration 30]
+                                 [--mix analyze=5,feedback=3,feedback_stats=1,health=1]
+                                 [--pages a.json …] [--variants 20] [--out results.json]
+
+  e.g. cache vs no cache, detectors only:
+  python benchmarks/load_test.py --config cache:AGENTS=axe \\
+                                 --config nocache:AGENTS=axe,RESULT_CACHE_ITEMS=0
+"""
+import os
+import sys
+import copy
+import json
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from collections import Counter
+
+import httpx
+
+from api_batching import REPO_ROOT, WEBAPP, _free_port, _wait_healthy
+sys.path.insert(0, str(WEBAPP))
+from pipeline import contrast_ratio
+
+ENDPOINTS = ("analyze", "analyze_stream", "reanalyze", "jobs", "feedback",
+             "feedback_stats", "cache_stats", "health")
+AGENTS = ("semantic", "contrast", "caption", "axe")
+
+# ─── workload ───────────────────────────────────────────
+def variant(page: dict, i: int) -> dict:
+    """A plausible re-capture of `page`: new id, ~20% of violations gone, shifted colours."""
+    rng = random.Random(i)
+    out = copy.deepcopy(page)
+    out["page_id"] = f"{page.get('page_id', 'page')}-v{i}"
+    for vp in out.get("viewports", []):
+        axe = vp.get("axe") or {}              # null when capture skipped axe
+        axe["violations"] = [v for v in axe.get("violations", []) if rng.random() > 0.2]
+        for c in vp.get("contrast", []):
+            if c.get("fg") and c.get("bg"):
+                c["fg"] = [min(255, max(0, ch + rng.randint(-24, 24))) for ch in c["fg"]]
+                c["contrast"] = contrast_ratio(c["fg"], c["bg"])
+    return out
+
+def load_pages(paths, variants: int) -> list:
+    base = [json.loads(Path(p).read_text(encoding="utf-8")) for p in paths]
+    return base + [variant(base[i % len(base)], i) for i in range(variants)]
+
+def parse_mix(spec: str) -> dict:
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise SystemExit(f"unknown endpoint {name!r} in --mix, expected some of {ENDPOINTS}")
+        mix[name] = float(weight or 1)
+    return mix
+
+def parse_config(spec: str):
+    name, _, overrides = spec.partition(":")
+    env = {}
+    for kv in filter(None, overrides.split(",")):
+        key, _, value = kv.partition("=")
+        env[key.strip()] = value
+    return name, env
+
+def make_vote(rng, page: dict) -> dict:
+    violations = [v for vp in page.get("viewports", [])
+                  for v in (vp.get("axe") or {}).get("violations", [])]
+    v = rng.choice(violations) if violations else {"id": "none"}
+    return {"page_id": page.get("page_id", "page"), "agent": rng.choice(AGENTS),
+            "suggestion": {"node": ", ".join(" ".join(n.get("target", [])) for n in v.get("nodes", [])[:3]),
+                           "issue_type": v.get("id"), "fix": f"See {v.get('helpUrl')}"},
+            "action": rng.choice(("up", "down")), "comment": None}
+
+async def send(client, url, endpoint, page, rng):
+    """One request → status code (raises on transport errors)."""
+    if endpoint == "analyze":
+        return (await client.post(f"{url}/analyze", json=page)).status_code
+    if endpoint == "analyze_stream":
+        async with client.stream("POST", f"{url}/analyze/stream", json=page) as r:
+            async for _ in r.aiter_bytes():
+                pass
+            return r.status_code
+    if endpoint == "reanalyze":
+        return (await client.post(f"{url}/reanalyze", json=page)).status_code
+    if endpoint == "jobs":
+        return (await client.post(f"{url}/jobs", json={"page": page, "lane": "bulk"})).status_code
+    if endpoint == "feedback":
+        return (await client.post(f"{url}/feedback", json=make_vote(rng, page))).status_code
+    if endpoint == "feedback_stats":
+        return (await client.get(f"{url}/feedback/stats",
+                                 params={"page_id": page.get("page_id", "page")})).status_code
+    if endpoint == "cache_stats":
+        return (await client.get(f"{url}/cache/stats")).status_code
+    return (await client.get(f"{url}/health")).status_code
+
+# ─── driving ────────────────────────────────────────────
+async def timed(client, url, endpoint, page, rng, scheduled, samples):
+    try:
+        status = await send(client, url, endpoint, page, rng)
+        error = None if status < 400 else f"HTTP {status}"
+    except httpx.HTTPError as e:
+        status, error = None, type(e).__name__
+    samples.append((endpoint, status, (time.perf_counter() - scheduled) * 1000, error))
+
+async def run_rate(url, pages, mix, rate, concurrency, duration, seed):
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    samples = []
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(timeout=300, limits=limits) as client:
+        t0 = time.perf_counter()
+        if rate > 0:
+            slots = asyncio.Semaphore(concurrency)
+            async def arrival(endpoint, page, scheduled):
+                async with slots:
+                    await timed(client, url, endpoint, page, rng, scheduled, samples)
+            tasks, at = [], 0.0
+            while True:
+                at += rng.expovariate(rate)
+                if at > duration:
+                    break
+                delay = t0 + at - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                endpoint = rng.choices(names, weights)[0]
+                tasks.append(asyncio.create_task(arrival(endpoint, rng.choice(pages), t0 + at)))
+            await asyncio.gather(*tasks)
+        else:
+            async def client_loop():
+                while time.perf_counter() - t0 < duration:
+                    await timed(client, url, rng.choices(names, weights)[0], rng.choice(pages),
+                                rng, time.perf_counter(), samples)
+            await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+        server = {"health": (await client.get(f"{url}/health")).json(),
+                  "cache": (await client.get(f"{url}/cache/stats")).json()}
+    return samples, elapsed, server
+
+def percentile(values: list, q: float):
+    """Nearest-rank percentile of sorted `values`."""
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, int(round(q / 100 * len(values))) - 1))]
+
+def summarise(samples, elapsed) -> dict:
+    out = {}
+    groups = {"all": samples}
+    for s in samples:
+        groups.setdefault(s[0], []).append(s)
+    for endpoint, group in groups.items():
+        ok = sorted(ms for _, _, ms, error in group if error is None)
+        errors = len(group) - len(ok)
+        out[endpoint] = {"requests": len(group), "errors": errors,
+                         "error_rate": errors / len(group) if group else 0.0,
+                         "throughput_rps": len(ok) / elapsed,
+                         "p50_ms": percentile(ok, 50), "p95_ms": percentile(ok, 95),
+                         "p99_ms": percentile(ok, 99),
+                         "statuses": dict(Counter(str(status) for _, status, _, _ in group))}
+    return out
+
+def print_summary(config, rate, stats):
+    label = f"{rate:g} req/s" if rate else "closed"
+    for endpoint, s in sorted(stats.items(), key=lambda kv: kv[0] != "all"):
+        fmt = lambda v: f"{v:8.0f}" if v is not None else "       -"
+        print(f"{config:<10} {label:>10}  {endpoint:<15} {s['requests']:>6} "
+              f"{s['throughput_rps']:8.2f}/s  p50 {fmt(s['p50_ms'])}  p95 {fmt(s['p95_ms'])}  "
+              f"p99 {fmt(s['p99_ms'])} ms  errors {s['error_rate']:6.1%}")
+
+async def run_config(name, url, env_overrides, pages, args):
+    """Start a server for this config (unless `url` is given) and run every rate."""
+    proc, tmp = None, None
+    if url is None:
+        tmp = tempfile.TemporaryDirectory()
+        port = _free_port()
+        url = f"http://127.0.0.1:{port}"
+        env = {**os.environ,
+               "FEEDBACK_DB": str(Path(tmp.name) / "feedback.db"),
+               "JOBS_DB": str(Path(tmp.name) / "jobs.db"),
+               "INCREMENTAL_DB": str(Path(tmp.name) / "incremental.db"),
+               "RESULT_CACHE_DIR": str(Path(tmp.name) / "result_cache"),
+               # /jobs refuses work when no worker would run it
+               **({"JOB_WORKERS": "1"} if "jobs" in args.mix else {}),
+               **env_overrides}
+        proc = subprocess.Popen([sys.executable, "-m", "uvicorn", "app:app", "--port", str(port),
+                                 "--log-level", "warning"], cwd=WEBAPP, env=env)
+    rows = []
+    try:
+        if proc is not None:
+            await _wait_healthy(url, proc, args.health_timeout)
+        async with httpx.AsyncClient(timeout=600) as client:        # warm-up: each endpoint once
+            for endpoint in args.mix:
+                await timed(client, url, endpoint, pages[0], random.Random(0), time.perf_counter(), [])
+        for rate in args.rates:
+            samples, elapsed, server = await run_rate(url, pages, args.mix, rate, args.concurrency,
+                                                      args.duration, args.seed)
+            stats = summarise(samples, elapsed)
+            print_summary(name, rate, stats)
+            rows.append({"config": name, "env": env_overrides, "rate": rate,
+                         "concurrency": args.concurrency, "elapsed_s": elapsed,
+                         "endpoints": stats, "server": server})
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=30)
+            tmp.cleanup()
+    return rows
+
+def compare(results, baseline: str) -> list:
+    """Every other config against `baseline`, per rate and endpoint."""
+    base = {(r["rate"], e): s for r in results if r["config"] == baseline
+            for e, s in r["endpoints"].items()}
+    out = []
+    for r in results:
+        if r["config"] == baseline:
+            continue
+        for endpoint, s in r["endpoints"].items():
+            b = base.get((r["rate"], endpoint))
+            if b is None:
+                continue
+            ratio = lambda k: s[k] / b[k] if s[k] is not None and b[k] else None
+            out.append({"config": r["config"], "baseline": baseline, "rate": r["rate"],
+                        "endpoint": endpoint, "throughput_x": ratio("throughput_rps"),
+                        "p50_x": ratio("p50_ms"), "p99_x": ratio("p99_ms"),
+                        "error_rate_delta": s["error_rate"] - b["error_rate"]})
+    return out
+
+async def main(args):
+    pages = load_pages(args.pages, args.variants)
+    configs = [parse_config(c) for c in args.config] or [("default", {})]
+    if args.url and len(configs) > 1:
+        raise SystemExit("--url drives one running server; use --config without --url to compare")
+    print(f"{len(pages)} pages, mix {args.mix}, {args.duration:g}s per rate")
+    results = []
+    for name, env in configs:
+        results += await run_config(name, args.url, env, pages, args)
+
+    comparison = compare(results, configs[0][0]) if len(configs) > 1 else []
+    if comparison:
+        print(f"\nagainst {configs[0][0]} (×: other / baseline):")
+        fmt = lambda v: f"×{v:5.2f}" if v is not None else "     -"
+        for c in comparison:
+            label = f"{c['rate']:g} req/s" if c["rate"] else "closed"
+            print(f"{c['config']:<10} {label:>10}  {c['endpoint']:<15} throughput {fmt(c['throughput_x'])}  "
+                  f"p50 {fmt(c['p50_x'])}  p99 {fmt(c['p99_x'])}  errors {c['error_rate_delta']:+6.1%}")
+    if args.out:
+        Path(args.out).write_text(json.dumps({"args": {**vars(args), "mix": args.mix},
+                                              "results": results, "comparison": comparison}, indent=2))
+        print(f"✅ results → {args.out}")
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--config", action="append", default=[],
+                    help="NAME:KEY=VAL,KEY=VAL server environment; repeat to compare (first is the baseline)")
+    ap.add_argument("--url", default=None, help="load an already running server instead")
+    ap.add_argument("--pages", nargs="+", default=[str(REPO_ROOT / "test_data" / "test_file.json")])
+    ap.add_argument("--variants", type=int, default=20, help="generated page variations")
+    ap.add_argument("--mix", type=parse_mix, default=parse_mix("analyze=5,feedback=3,feedback_stats=1,health=1"),
+                    help=f"endpoint=weight,… from {', '.join(ENDPOINTS)}")
+    ap.add_argument("--rates", type=float, nargs="+", default=[5, 20, 50],
+                    help="arrivals per second; 0 = closed loop")
+    ap.add_argument("--concurrency", type=int, default=64, help="max requests in flight")
+    ap.add_argument("--duration", type=float, default=30, help="seconds per rate")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--health-timeout", type=float, default=900,
+                    help="seconds to wait for models to load")
+    ap.add_argument("--out", default=None)
+    asyncio.run(main(ap.parse_args()))
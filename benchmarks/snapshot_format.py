@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Size and parse-time comparison of page JSON vs the `.pagesnap` format.
+
+Pages are either real files (`--inputs a.json b.json …`) or synthetic
+WebUI-7k-shaped documents: several viewports, each with full axe reports
+(violations / passes / incomplete / inapplicable) whose node html, selectors
+and messages repeat across rules and viewports like real captures do.
+
+For each page: bytes on disk (pretty JSON as analyze_page writes it, compact
+JSON, gzipped JSON, snapshot raw and zlib) and median parse times for the
+full document and for just `viewports[0].axe.violations`.  Every snapshot is
+checked to round-trip losslessly.
+
+Usage:
+  python benchmarks/snapshot_format.py [--elements 200 1000 4000] [--repeat 5]
+                                       [--inputs page.json …] [--out results.json]
+"""
+import sys
+import gzip
+import json
+import time
+import random
+import argparse
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from agents import page_snapshot
+
+VIEWPORTS = {"1920-1080": (1920, 1080), "1366-768": (1366, 768),
+             "iPad-Pro": (834, 1194), "iPhone-13 Pro": (390, 844)}
+TAGS = ["cat.color", "cat.semantics", "cat.keyboard", "cat.aria", "cat.text-alternatives",
+        "cat.forms", "cat.name-role-value", "cat.structure", "wcag2a", "wcag2aa", "wcag143",
+        "wcag111", "wcag412", "section508", "best-practice"]
+
+def _check(rng, rule, impact):
+    return {"id": f"{rule}-check-{rng.randrange(3)}", "data": None, "relatedNodes": [],
+            "impact": impact, "message": f"Element does not satisfy {rule} requirement"}
+
+def _node(rng, el, rule, impact, failed):
+    checks = [_check(rng, rule, impact) for _ in range(rng.randint(1, 3))]
+    node = {"any": checks, "all": [], "none": [], "impact": impact if failed else None,
+            "html": el["html"], "target": el["target"]}
+    if failed:
+        node["failureSummary"] = "Fix any of the following:\n  " + "\n  ".join(
+            c["message"] for c in checks)
+    return node
+
+def synthetic_page(n_elements: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    elements = [{"html": f'<div class="card card-{i % 37}" id="el-{i}"><a href="/item/{i}">Item {i}</a>',
+                 "target": [f"#el-{i}"] if i % 3 else [f".card-{i % 37}:nth-child({i % 11 + 1})", "a"]}
+                for i in range(n_elements)]
+    rules = [(f"rule-{r}", rng.choice(["minor", "moderate", "serious", "critical"]),
+              rng.sample(TAGS, 4)) for r in range(90)]
+
+    def results(rule_slice, failed, max_nodes):
+        out = []
+        for rid, impact, tags in rule_slice:
+            picks = rng.sample(elements, min(len(elements), rng.randint(0, max_nodes)))
+            out.append({"id": rid, "impact": impact if failed else None, "tags": tags,
+                        "description": f"Ensures {rid} is satisfied by every element",
+                        "help": f"Elements must satisfy {rid}",
+                        "helpUrl": f"https://dequeuniversity.com/rules/axe/4.10/{rid}",
+                        "nodes": [_node(rng, el, rid, impact, failed) for el in picks]})
+        return out
+
+    viewports = []
+    for vp, (width, height) in VIEWPORTS.items():
+        rng.seed(seed)          # same page → largely the same findings per viewport
+        viewports.append({
+            "viewport": vp,
+            "semantic": {
+                "lang": "en",
+                "headings": [[rng.randint(1, 6), f"Heading {i}"] for i in range(n_elements // 20)],
+                "images": [{"nodeId": f"img-{i}", "alt": f"picture {i}" if i % 4 else ""}
+                           for i in range(n_elements // 10)],
+                "missing_alt": [f"img-{i}" for i in range(0, n_elements // 10, 4)],
+                "links": [{"nodeId": str(i), "text": f"Item {i}"} for i in range(n_elements // 2)],
+                "missing_name": [],
+            },
+            "contrast": [{"role": rng.choice(["p", "span", "a", "li"]),
+                          "fg": [rng.randrange(256) for _ in range(3)],
+                          "bg": [255, 255, 255],
+                          "contrast": round(rng.uniform(1, 21), 6)} for _ in range(n_elements)],
+            "image_captioning": [{"nodeId": f"img-{i}", "alt": "",
+                                  "bbox": {"x": rng.uniform(0, width), "y": rng.uniform(0, 9000),
+                                           "width": 120.5, "height": 80}}
+                                 for i in range(n_elements // 10)],
+            "axe": {
+                "testEngine": {"name": "axe-core", "version": "4.10.3"},
+                "testRunner": {"name": "axe"},
+                "testEnvironment": {"userAgent": "Mozilla/5.0 HeadlessChrome", "windowWidth": width,
+                                    "windowHeight": height, "orientationAngle": 0,
+                                    "orientationType": "landscape-primary"},
+                "timestamp": "2025-06-12T10:00:00.000Z",
+                "url": "https://example.com/",
+                "toolOptions": {"reporter": "v1"},
+                "violations": results(rules[:12], True, max(1, n_elements // 25)),
+                "passes": results(rules[12:60], False, max(1, n_elements // 8)),
+                "incomplete": results(rules[60:66], False, max(1, n_elements // 40)),
+                "inapplicable": results(rules[66:], False, 0),
+            },
+            "html_path": f"out/example-{vp}.html",
+            "screenshot": f"out/example-{vp}.webp",
+        })
+    return {"page_id": "https://example.com/", "viewports": viewports}
+
+def _median_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(times)
+
+def bench(name, doc, repeat):
+    pretty  = json.dumps(doc, indent=2, ensure_ascii=False).encode('utf-8')
+    compact = json.dumps(doc, ensure_ascii=False).encode('utf-8')
+    snap    = page_snapshot.dumps(doc)
+    raw     = page_snapshot.dumps(doc, compress=False)
+    assert page_snapshot.loads(snap) == doc, f"{name}: snapshot did not round-trip"
+
+    row = {
+        'page': name,
+        'bytes': {'json_pretty': len(pretty), 'json': len(compact),
+                  'json_gz': len(gzip.compress(compact, 6)),
+                  'snap_raw': len(raw), 'snap': len(snap)},
+        'ms': {
+            'json_full':        _median_ms(lambda: json.loads(pretty), repeat),
+            'snap_full':        _median_ms(lambda: page_snapshot.loads(snap), repeat),
+            'json_violations':  _median_ms(lambda: json.loads(pretty)['viewports'][0]['axe']
+                                           .get('violations', []), repeat),
+            'snap_violations':  _median_ms(lambda: page_snapshot.PageSnapshot(snap)
+                                           .axe(0, 'violations', []), repeat),
+            'json_write':       _median_ms(lambda: json.dumps(doc, indent=2, ensure_ascii=False), repeat),
+            'snap_write':       _median_ms(lambda: page_snapshot.dumps(doc), repeat),
+        },
+        'interned': page_snapshot.PageSnapshot(snap).counts,
+    }
+    b, ms = row['bytes'], row['ms']
+    print(f"{name:<28} json {b['json_pretty'] / 1e6:7.2f} MB  gz {b['json_gz'] / 1e6:6.2f} MB  "
+          f"snap {b['snap'] / 1e6:6.2f} MB (×{b['json_pretty'] / b['snap']:.0f})  |  "
+          f"full {ms['json_full']:7.1f} → {ms['snap_full']:7.1f} ms  "
+          f"violations {ms['json_violations']:7.1f} → {ms['snap_violations']:6.1f} ms")
+    return row
+
+def main(elements, repeat, inputs, out):
+    results = []
+    for n in elements:
+        results.append(bench(f"synthetic-{n}", synthetic_page(n), repeat))
+    for path in inputs:
+        results.append(bench(Path(path).name, json.loads(Path(path).read_text(encoding='utf-8')), repeat))
+    if out:
+        Path(out).write_text(json.dumps(results, indent=2))
+        print(f"✅ results → {out}")
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--elements', type=int, nargs='+', default=[200, 1000, 4000])
+    ap.add_argument('--repeat', type=int, default=5)
+    ap.add_argument('--inputs', nargs='*', default=[])
+    ap.add_argument('--out', default=None)
+    args = ap.parse_args()
+    main(args.elements, args.repeat, args.inputs, args.out)
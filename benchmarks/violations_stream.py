@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Time and peak Python-heap memory of reading axe violations from a page file:
+full `json.loads` vs the streaming `read_violations`.
+
+Synthetic pages (see snapshot_format.py) are written pretty (analyze_page),
+compact (phase3_and_4) and as `.pagesnap`, and read back from disk for the
+first viewport and for every viewport.
+
+Usage:
+  python benchmarks/violations_stream.py [--elements 200 1000 4000] [--repeat 3] [--out results.json]
+"""
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from agents import page_snapshot
+from agents.axe_stream import read_violations
+from snapshot_format import synthetic_page
+
+def _full(path, viewports):
+    doc = json.loads(Path(path).read_bytes())
+    return [doc['viewports'][i]['axe'].get('violations', []) for i in viewports]
+
+def _measure(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(times), peak
+
+def main(elements, repeat, out):
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in elements:
+            doc = synthetic_page(n)
+            n_viol = sum(len(v['nodes']) for v in doc['viewports'][0]['axe']['violations'])
+            files = {
+                'pretty':  (Path(workdir) / f'{n}-pretty.json',
+                            json.dumps(doc, indent=2, ensure_ascii=False).encode('utf-8')),
+                'compact': (Path(workdir) / f'{n}-compact.json',
+                            json.dumps(doc, separators=(',', ':'), ensure_ascii=False).encode('utf-8')),
+                'snap':    (Path(workdir) / f'{n}{page_snapshot.SUFFIX}', page_snapshot.dumps(doc)),
+            }
+            for path, data in files.values():
+                path.write_bytes(data)
+
+            for label, viewports in (('first', (0,)), ('all', tuple(range(len(doc['viewports']))))):
+                expected = _full(files['pretty'][0], viewports)
+                for fmt, (path, data) in files.items():
+                    got = [vp['violations'] for vp in read_violations(path, viewports)]
+                    assert got == expected, f"{fmt}/{label}: violations differ"
+                    row = {'elements': n, 'violation_nodes': n_viol, 'format': fmt,
+                           'viewports': label, 'bytes': len(data)}
+                    if fmt != 'snap':
+                        row['full_ms'], row['full_peak'] = _measure(lambda: _full(path, viewports), repeat)
+                    row['stream_ms'], row['stream_peak'] = _measure(
+                        lambda: read_violations(path, viewports), repeat)
+                    results.append(row)
+                    full = (f"full {row['full_ms']:8.1f} ms {row['full_peak'] / 1e6:7.1f} MB  →  "
+                            if 'full_ms' in row else ' ' * 35)
+                    print(f"{n:>6} els {fmt:<8} {label:<5} {len(data) / 1e6:7.2f} MB  {full}"
+                          f"stream {row['stream_ms']:7.1f} ms {row['stream_peak'] / 1e6:6.2f} MB")
+    if out:
+        Path(out).write_text(json.dumps(results, indent=2))
+        print(f"✅ results → {out}")
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--elements', type=int, nargs='+', default=[200, 1000, 4000])
+    ap.add_argument('--repeat', type=int, default=3)
+    ap.add_argument('--out', default=None)
+    args = ap.parse_args()
+    main(args.elements, args.repeat, args.out)
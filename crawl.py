@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Site crawler around analyze_page.analyze.
+
+Seeds a URL frontier from a start URL and/or sitemap, analyses every page in
+the same per-page JSON format as analyze_page.py, and follows same-origin
+links found in each captured HTML.  The frontier lives in
+<out-dir>/frontier.sqlite, so an interrupted crawl resumes where it stopped
+(pages that were in flight are retried).
+
+Usage:
+  python crawl.py https://example.com/ out/ [--sitemap https://example.com/sitemap.xml]
+                  [--max-pages 500] [--max-depth 5] [--concurrency 4]
+                  [--per-host 2] [--delay 1.0] [--viewports ...]
+
+Local fixture site:
+  python -m http.server 8000 -d test_data/site
+  python crawl.py http://localhost:8000/ out/ --sitemap http://localhost:8000/sitemap.xml
+"""
+import gzip
+import time
+import asyncio
+import sqlite3
+import argparse
+import posixpath
+import urllib.request
+import urllib.robotparser
+import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+
+from playwright.async_api import async_playwright
+
+import analyze_page
+import screenshot_encoding
+from analyze_page import (
+    CaptureOptions, DEFAULT_VIEWPORT, VIEWPORTS, analyze, hashed_output_name, missing_viewports,
+    page_output_name,
+)
+
+# ─── CONFIG ─────────────────────────────────────────────
+USER_AGENT    = "accessibility-crawler/1.0"
+MAX_ATTEMPTS  = 2
+SKIP_SUFFIXES = {'.pdf', '.zip', '.gz', '.tar', '.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg',
+                 '.ico', '.mp3', '.mp4', '.webm', '.avi', '.mov', '.css', '.js', '.json', '.xml',
+                 '.woff', '.woff2', '.ttf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx'}
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid')
+
+# ─── URL NORMALIZATION ──────────────────────────────────
+def normalize_url(url: str, base: str | None = None) -> str | None:
+    """
+    Canonical form used for dedup: absolute http(s), lower-case scheme/host,
+    no default port, no fragment, dot segments resolved, tracking params
+    dropped and the rest of the query sorted.  None for URLs we never crawl.
+    """
+    if base is not None:
+        url = urljoin(base, url.strip())
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ('http', 'https') or not parts.hostname:
+        return None
+
+    host = parts.hostname.lower()
+    if parts.port and (scheme, parts.port) not in (('http', 80), ('https', 443)):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or '/'
+    trailing = path.endswith('/')
+    path = posixpath.normpath(path)
+    if path == '.' or path == '//':
+        path = '/'
+    if trailing and path != '/':
+        path += '/'
+    if posixpath.splitext(path)[1].lower() in SKIP_SUFFIXES:
+        return None
+
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if not k.lower().startswith(TRACKING_PARAMS))
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+def origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+# ─── LINK DISCOVERY ─────────────────────────────────────
+class _LinkParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.base = None
+        self.hrefs = []
+        self.nofollow = False
+
+    def handle_starttag(self, tag, attrs):
+        a = dict(attrs)
+        if tag == 'base' and a.get('href') and self.base is None:
+            self.base = a['href']
+        elif tag in ('a', 'area') and a.get('href'):
+            if 'nofollow' not in (a.get('rel') or '').lower().split():
+                self.hrefs.append(a['href'])
+        elif tag == 'meta' and (a.get('name') or '').lower() == 'robots':
+            self.nofollow = 'nofollow' in (a.get('content') or '').lower()
+
+def extract_links(html: str, page_url: str) -> list:
+    """Normalized, de-duplicated link targets of one captured page."""
+    parser = _LinkParser()
+    parser.feed(html)
+    if parser.nofollow:
+        return []
+    base = urljoin(page_url, parser.base) if parser.base else page_url
+    seen, links = set(), []
+    for href in parser.hrefs:
+        url = normalize_url(href, base)
+        if url and url not in seen:
+            seen.add(url)
+            links.append(url)
+    return links
+
+# ─── SITEMAP / ROBOTS ───────────────────────────────────
+def _fetch(url: str, timeout=30) -> bytes:
+    req = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        data = resp.read()
+    if data[:2] == b'\x1f\x8b':
+        data = gzip.decompress(data)
+    return data
+
+def sitemap_urls(url: str, _depth=0) -> list:
+    """Every <loc> of a sitemap, following sitemap indexes a few levels deep."""
+    root = ET.fromstring(_fetch(url))
+    ns = root.tag.split('}')[0] + '}' if root.tag.startswith('{') else ''
+    locs = [(el.text or '').strip() for el in root.iter(f'{ns}loc')]
+    if root.tag == f'{ns}sitemapindex':
+        if _depth >= 3:
+            return []
+        urls = []
+        for loc in locs:
+            try:
+                urls.extend(sitemap_urls(loc, _depth + 1))
+            except Exception as e:
+                print(f"⚠️  sitemap {loc}: {e}")
+        return urls
+    return [loc for loc in locs if loc]
+
+def load_robots(site: str):
+    rp = urllib.robotparser.RobotFileParser(f"{site}/robots.txt")
+    try:
+        rp.parse(_fetch(rp.url, timeout=10).decode('utf-8', 'replace').splitlines())
+    except Exception:
+        rp.parse([])            # unreachable / 404 → everything allowed
+    return rp
+
+# ─── FRONTIER ───────────────────────────────────────────
+class Frontier:
+    """
+    Persistent URL frontier.  state: pending → active → done | failed.
+    Insertion order within a depth is preserved, so the crawl is breadth-first.
+    """
+    def __init__(self, path: Path):
+        self.db = sqlite3.connect(path)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS urls (
+                id       INTEGER PRIMARY KEY,
+                url      TEXT UNIQUE NOT NULL,
+                depth    INTEGER NOT NULL,
+                state    TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                parent   TEXT,
+                output   TEXT,
+                error    TEXT
+            );
+            CREATE INDEX IF NOT EXISTS urls_pending ON urls(state, depth, id);
+            CREATE INDEX IF NOT EXISTS urls_output ON urls(output);
+        """)
+        # anything that was in flight when the last run stopped gets retried
+        self.db.execute("UPDATE urls SET state='pending' WHERE state='active'")
+        self.db.commit()
+
+    def add(self, urls, depth: int, parent: str | None = None) -> int:
+        cur = self.db.executemany(
+            "INSERT OR IGNORE INTO urls (url, depth, parent) VALUES (?, ?, ?)",
+            [(u, depth, parent) for u in urls])
+        self.db.commit()
+        return cur.rowcount
+
+    def claim(self):
+        row = self.db.execute(
+            "SELECT url, depth FROM urls WHERE state='pending' ORDER BY depth, id LIMIT 1").fetchone()
+        if row:
+            self.db.execute("UPDATE urls SET state='active', attempts=attempts+1 WHERE url=?",
+                            (row[0],))
+            self.db.commit()
+        return row
+
+    def output_path(self, url: str, out_dir: Path) -> Path:
+        """
+        Where `url`'s JSON goes, reserved in the `output` column the first time
+        it is asked for, so retries and resumed crawls reuse it.  `/a` vs `/a/`
+        or `/a-b` vs `/a/b` share a page_output_name(); whichever comes second
+        gets a hash of its URL instead.
+        """
+        row = self.db.execute("SELECT output FROM urls WHERE url=?", (url,)).fetchone()
+        if row and row[0]:
+            return Path(row[0])
+        path = out_dir / page_output_name(url)
+        if self.db.execute("SELECT 1 FROM urls WHERE output=? AND url<>?",
+                           (str(path), url)).fetchone():
+            path = out_dir / hashed_output_name(path.name, url)
+        self.db.execute("UPDATE urls SET output=? WHERE url=?", (str(path), url))
+        self.db.commit()
+        return path
+
+    def finish(self, url: str, output: str):
+        self.db.execute("UPDATE urls SET state='done', output=?, error=NULL WHERE url=?",
+                        (output, url))
+        self.db.commit()
+
+    def fail(self, url: str, error: str, retry: bool):
+        self.db.execute("UPDATE urls SET state=?, error=? WHERE url=?",
+                        ('pending' if retry else 'failed', error, url))
+        self.db.commit()
+
+    def attempts(self, url: str) -> int:
+        return self.db.execute("SELECT attempts FROM urls WHERE url=?", (url,)).fetchone()[0]
+
+    def counts(self) -> dict:
+        return dict(self.db.execute("SELECT state, COUNT(*) FROM urls GROUP BY state"))
+
+    def close(self):
+        self.db.close()
+
+# ─── POLITENESS ─────────────────────────────────────────
+class HostLimiter:
+    """At most `per_host` pages in flight per host, starts spaced by `delay` seconds."""
+    def __init__(self, per_host: int, delay: float):
+        self.per_host = per_host
+        self.delay = delay
+        self._sems = {}
+        self._next_start = {}
+        self._locks = {}
+
+    def _host(self, url):
+        return urlsplit(url).netloc
+
+    async def acquire(self, url):
+        host = self._host(url)
+        sem = self._sems.setdefault(host, asyncio.Semaphore(self.per_host))
+        await sem.acquire()
+        async with self._locks.setdefault(host, asyncio.Lock()):
+            wait = self._next_start.get(host, 0.0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_start[host] = time.monotonic() + self.delay
+
+    def release(self, url):
+        self._sems[self._host(url)].release()
+
+# ─── CRAWL ──────────────────────────────────────────────
+async def crawl(start_urls, out_dir: Path, opts: CaptureOptions | None = None, *,
+                sitemap=None, viewports=(DEFAULT_VIEWPORT,), max_pages=500, max_depth=5,
+                concurrency=4, per_host=2, delay=1.0, respect_robots=True):
+    opts = opts or CaptureOptions()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    frontier = Frontier(out_dir / 'frontier.sqlite')
+
+    seeds = [u for u in (normalize_url(s) for s in start_urls) if u]
+    if sitemap:
+        seeds += [u for u in (normalize_url(s) for s in sitemap_urls(sitemap)) if u]
+    origins = {origin(u) for u in seeds}
+    added = frontier.add(seeds, depth=0)
+    print(f"🌱 {added} new seed URLs ({len(seeds)} total) across {len(origins)} origin(s)")
+
+    robots = {}
+    if respect_robots:
+        for o in origins:
+            robots[o] = await asyncio.to_thread(load_robots, o)
+
+    def allowed(url):
+        if origin(url) not in origins:
+            return False
+        rp = robots.get(origin(url))
+        return rp is None or rp.can_fetch(USER_AGENT, url)
+
+    limit = asyncio.Semaphore(concurrency)
+    hosts = HostLimiter(per_host, delay)
+    changed = asyncio.Event()
+    in_flight = 0
+    done_before = frontier.counts().get('done', 0)
+    stats = {'done': 0, 'failed': 0, 'skipped': 0, 'discovered': 0}
+    t0 = time.perf_counter()
+
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+
+        async def visit(url, depth):
+            output_path = frontier.output_path(url, out_dir)
+            await hosts.acquire(url)
+            try:
+                out, _, _ = await analyze(url, output_path, opts, viewports=viewports,
+                                          pw=pw, browser=browser, limit=limit, verbose=False)
+            finally:
+                hosts.release(url)
+            frontier.finish(url, str(output_path))
+            stats['done'] += 1
+
+            if depth < max_depth:
+                html = Path(out['viewports'][0]['html_path']).read_text(encoding='utf-8')
+                links = [u for u in extract_links(html, url) if allowed(u)]
+                stats['discovered'] += frontier.add(links, depth + 1, parent=url)
+            missing = missing_viewports(out, viewports)
+            print(f"✅ [{done_before + stats['done']}] d{depth} {url}"
+                  + (f"  ⚠️  failed: {', '.join(missing)}" if missing else ""))
+
+        async def worker():
+            nonlocal in_flight
+            while True:
+                if done_before + stats['done'] + in_flight >= max_pages:
+                    return
+                row = frontier.claim()
+                if row is None:
+                    if in_flight == 0:
+                        return
+                    changed.clear()
+                    await changed.wait()
+                    continue
+                url, depth = row
+                if not allowed(url):
+                    frontier.fail(url, 'disallowed by robots.txt', retry=False)
+                    stats['skipped'] += 1
+                    continue
+                in_flight += 1
+                try:
+                    await visit(url, depth)
+                except Exception as e:
+                    retry = frontier.attempts(url) < MAX_ATTEMPTS
+                    frontier.fail(url, str(e), retry=retry)
+                    if not retry:
+                        stats['failed'] += 1
+                    print(f"{'🔁' if retry else '❌'} {url}: {e}")
+                finally:
+                    in_flight -= 1
+                    changed.set()
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        finally:
+            await browser.close()
+            screenshot_encoding.shutdown_pool()
+            counts = frontier.counts()
+            frontier.close()
+
+    elapsed = time.perf_counter() - t0
+    print(f"🏁 {stats['done']} pages ok, {stats['failed']} failed, {stats['skipped']} disallowed, "
+          f"{stats['discovered']} new URLs in {elapsed:.1f}s "
+          f"→ {stats['done'] / elapsed * 60 if elapsed else 0.0:.1f} pages/minute")
+    print(f"   frontier: {counts.get('done', 0)} done, {counts.get('pending', 0)} pending, "
+          f"{counts.get('failed', 0)} failed")
+    return stats
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(usage="python crawl.py <start-url> <out-dir/> [options]")
+    ap.add_argument('start_url', nargs='?')
+    ap.add_argument('out')
+    ap.add_argument('--sitemap', default=None, help='sitemap.xml (or index) to seed from')
+    ap.add_argument('--max-pages', type=int, default=500)
+    ap.add_argument('--max-depth', type=int, default=5, help='link hops from a seed')
+    ap.add_argument('--concurrency', type=int, default=4, help='max pages in flight overall')
+    ap.add_argument('--per-host', type=int, default=2, help='max pages in flight per host')
+    ap.add_argument('--delay', type=float, default=1.0,
+                    help='seconds between page starts on the same host')
+    ap.add_argument('--ignore-robots', action='store_true')
+    ap.add_argument('--viewports', nargs='+', default=[DEFAULT_VIEWPORT],
+                    help=f'viewports to capture, from {VIEWPORTS} or any W-H; "all" for every one')
+    ap.add_argument('--agents', nargs='+', default=analyze_page.DEFAULT_AGENTS)
+    ap.add_argument('--engine', default='js', choices=['js', 'cdp'])
+    ap.add_argument('--record', metavar='DIR', default=None)
+    ap.add_argument('--replay', metavar='DIR', default=None)
+    args = ap.parse_args()
+
+    if not args.start_url and not args.sitemap:
+        ap.error('give a start URL, --sitemap, or both')
+
+    viewports = VIEWPORTS if args.viewports == ['all'] else args.viewports
+    opts = CaptureOptions(agents=args.agents, engine=args.engine,
+                          record_dir=args.record, replay_dir=args.replay)
+    asyncio.run(crawl([args.start_url] if args.start_url else [], Path(args.out), opts,
+                      sitemap=args.sitemap, viewports=viewports, max_pages=args.max_pages,
+                      max_depth=args.max_depth, concurrency=args.concurrency,
+                      per_host=args.per_host, delay=args.delay,
+                      respect_robots=not args.ignore_robots))
@@ -0,0 +1,200 @@
+"""
+CDP capture engine for analyze_page.py.
+
+Instead of calling getComputedStyle / getBoundingClientRect per element from
+injected JS, one `DOMSnapshot.captureSnapshot` call returns the flattened DOM
+with the whitelisted computed styles and layout rects of every rendered node
+(the same data the WebUI-7k `-style.json` / `-bb.json` files were built from).
+`extract_from_snapshot` turns that into the `semantic` / `contrast` /
+`image_captioning` blocks the JS engine produces.
+
+Nodes without a layout object (display:none and friends) have no computed
+styles in a snapshot, so they are left out of `contrast` and get an empty
+bbox, where the JS engine still reports their styles.
+"""
+import re
+import time
+
+SNAPSHOT_STYLES = ["color", "background-color"]
+
+TEXT_TAGS = {'p','span','a','h1','h2','h3','h4','h5','h6','li','label','button'}
+HEADINGS  = {'H1','H2','H3','H4','H5','H6'}
+SKIP_TEXT = {'SCRIPT', 'STYLE'}
+ELEMENT, TEXT = 1, 3
+
+_RGB = re.compile(r"rgba?\((\d+),\s*(\d+),\s*(\d+)")
+
+def _to_rgb(s):
+    m = _RGB.match(s or '')
+    return [int(m.group(1)), int(m.group(2)), int(m.group(3))] if m else None
+
+def _contrast_ratio(f, b):
+    def lum(c):
+        v = c / 255
+        return v / 12.92 if v <= 0.03928 else ((v + 0.055) / 1.055) ** 2.4
+    L1 = 0.2126*lum(f[0]) + 0.7152*lum(f[1]) + 0.0722*lum(f[2])
+    L2 = 0.2126*lum(b[0]) + 0.7152*lum(b[1]) + 0.0722*lum(b[2])
+    return (max(L1, L2) + 0.05) / (min(L1, L2) + 0.05)
+
+def extract_from_snapshot(snapshot: dict) -> dict:
+    """
+    Build `{semantic, contrast, image_captioning, stats}` from a
+    `DOMSnapshot.captureSnapshot` result taken with SNAPSHOT_STYLES and
+    includeDOMRects.  Only the top-level document is used, like the JS engine.
+    """
+    t0 = time.perf_counter()
+    strings = snapshot['strings']
+    doc     = snapshot['documents'][0]
+    nodes   = doc['nodes']
+
+    parents = nodes['parentIndex']
+    types   = nodes['nodeType']
+    names   = [strings[i] for i in nodes['nodeName']]
+    values  = nodes['nodeValue']
+    attrs   = nodes.get('attributes', [])
+    n_nodes = len(names)
+
+    def attr(i, key):
+        pairs = attrs[i] if i < len(attrs) else []
+        for k in range(0, len(pairs), 2):
+            if strings[pairs[k]].lower() == key:
+                return strings[pairs[k + 1]]
+        return None
+
+    # first layout box per node → (styles, bounds)
+    layout = doc['layout']
+    boxes = {}
+    for row, idx in enumerate(layout['nodeIndex']):
+        if idx not in boxes:
+            boxes[idx] = row
+    def style(i, prop):
+        row = boxes.get(i)
+        if row is None:
+            return None
+        sidx = layout['styles'][row][SNAPSHOT_STYLES.index(prop)]
+        return strings[sidx] if sidx >= 0 else None
+    def bbox(i):
+        row = boxes.get(i)
+        x, y, w, h = layout['bounds'][row] if row is not None else (0, 0, 0, 0)
+        return {'x': x, 'y': y, 'width': w, 'height': h}
+
+    children = [[] for _ in range(n_nodes)]
+    for i, p in enumerate(parents):
+        if p >= 0:
+            children[p].append(i)
+
+    def strip_text(i):
+        # BeautifulSoup get_text(strip=True), as in the JS engine
+        out, stack = [], list(reversed(children[i]))
+        while stack:
+            j = stack.pop()
+            if types[j] == TEXT:
+                if names[parents[j]] not in SKIP_TEXT and values[j] >= 0:
+                    out.append(strings[values[j]].strip())
+            else:
+                stack.extend(reversed(children[j]))
+        return ''.join(out)
+
+    # ── background resolution, memoized like the JS engine ──
+    bg_memo = {}
+    def resolve_bg(i):
+        chain, node, bg = [], i, None
+        while node >= 0 and types[node] == ELEMENT:
+            if node in bg_memo:
+                bg = bg_memo[node]
+                break
+            own = _to_rgb(style(node, 'background-color'))
+            if own and any(own):
+                bg = bg_memo[node] = own
+                break
+            chain.append((node, own))
+            node = parents[node]
+        if bg is None:
+            bg = (chain[-1][1] if chain else None) or [255, 255, 255]
+        for n, _ in chain:
+            bg_memo[n] = bg
+        return bg
+
+    lang = ''
+    headings, images, missing_alt, image_captioning = [], [], [], []
+    links, missing_name, contrast = [], [], []
+    n_img = n_svg = n_text = n_elements = 0
+
+    for i in range(n_nodes):
+        if types[i] != ELEMENT:
+            continue
+        n_elements += 1
+        name = names[i]
+        if name == 'HTML' and parents[i] >= 0 and types[parents[i]] != ELEMENT:
+            lang = attr(i, 'lang') or lang
+        if name in HEADINGS:
+            headings.append([int(name[1]), strip_text(i)])
+        if name == 'IMG':
+            node_id = f"img-{n_img}"
+            n_img += 1
+            alt = attr(i, 'alt') or ''
+            images.append({'nodeId': node_id, 'alt': alt.strip()})
+            if not alt.strip():
+                missing_alt.append(node_id)
+            image_captioning.append({'nodeId': node_id, 'alt': alt, 'bbox': bbox(i)})
+        if name.lower() == 'a':
+            text = strip_text(i)
+            links.append({'nodeId': str(len(links)), 'text': text})
+            if not text:
+                missing_name.append(str(len(links) - 1))
+        if name.lower() in TEXT_TAGS:
+            n_text += 1
+            fg = _to_rgb(style(i, 'color'))
+            if fg:
+                bg = resolve_bg(i)
+                contrast.append({'role': name.lower(), 'fg': fg, 'bg': bg,
+                                 'contrast': _contrast_ratio(fg, bg)})
+
+    # svgs are numbered after all imgs, as in the JS engine
+    for i in range(n_nodes):
+        if types[i] == ELEMENT and names[i] == 'svg':
+            node_id = f"svg-{n_svg}"
+            n_svg += 1
+            images.append({'nodeId': node_id, 'alt': ''})
+            missing_alt.append(node_id)
+            image_captioning.append({'nodeId': node_id, 'alt': '', 'bbox': bbox(i)})
+
+    headings.sort(key=lambda h: h[0])
+    return {
+        'semantic': {
+            'lang': lang,
+            'headings': headings,
+            'images': images,
+            'missing_alt': missing_alt,
+            'links': links,
+            'missing_name': missing_name,
+        },
+        'contrast': contrast,
+        'image_captioning': image_captioning,
+        'stats': {
+            'elements': n_elements,
+            'textElements': n_text,
+            'images': n_img,
+            'svgs': n_svg,
+            'links': len(links),
+            'headings': len(headings),
+            'styleLookups': len(boxes),
+            'ms': (time.perf_counter() - t0) * 1000,
+        },
+    }
+
+async def capture_snapshot(context, page) -> dict:
+    """Run the CDP engine on `page`; same return shape as the JS engine."""
+    t0 = time.perf_counter()
+    cdp = await context.new_cdp_session(page)
+    try:
+        snapshot = await cdp.send('DOMSnapshot.captureSnapshot', {
+            'computedStyles': SNAPSHOT_STYLES,
+            'includeDOMRects': True,
+        })
+    finally:
+        await cdp.detach()
+    extracted = extract_from_snapshot(snapshot)
+    extracted['html'] = await page.content()
+    extracted['stats']['ms'] = (time.perf_counter() - t0) * 1000
+    return extracted
@@ -0,0 +1,129 @@
+"""
+Screenshot capture and encoding for analyze_page.py.
+
+Chromium only hands back PNG/JPEG, so WebP output means a decode + re-encode
+that used to run inline on the event loop.  Encoding now runs in a process
+pool, and only when Chromium can't write the requested format itself.
+
+Capture modes:
+  full      full-page screenshot (what the captioning agent crops from)
+  viewport  just the visible viewport
+  regions   only the areas covering image bboxes, pasted at their page
+            coordinates onto a blank page-sized canvas, so bbox crops keep
+            working while everything else compresses to almost nothing
+"""
+import io
+import os
+import time
+import atexit
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+FORMATS  = {'webp': ('WEBP', '.webp'), 'png': ('PNG', '.png'), 'jpeg': ('JPEG', '.jpg')}
+MODES    = ('full', 'viewport', 'regions')
+MERGE_PX = 16       # boxes closer than this are captured as one region
+
+_pool = None            # (workers, executor)
+
+def encode_pool(workers: int | None = None) -> ProcessPoolExecutor:
+    """The shared encode pool, recreated when asked for a different size."""
+    global _pool
+    if _pool is None or _pool[0] != workers:
+        shutdown_pool(wait=False)           # encodes already queued on it still finish
+        _pool = (workers, ProcessPoolExecutor(max_workers=workers))
+    return _pool[1]
+
+def shutdown_pool(wait: bool = True):
+    global _pool
+    if _pool is not None:
+        _pool[1].shutdown(wait=wait)
+        _pool = None
+
+atexit.register(shutdown_pool)
+
+def suffix(fmt: str) -> str:
+    return FORMATS[fmt][1]
+
+def encode(path, fmt, quality, lossless, png=None, regions=None, canvas=None):
+    """
+    Runs in a worker process.  Encodes either one PNG or a set of
+    `(x, y, png)` regions on a `canvas` (w, h) to `path`.
+    Returns (bytes_written, encode_ms).
+    """
+    t0 = time.perf_counter()
+    if regions is not None:
+        img = Image.new('RGB', canvas, (255, 255, 255))
+        for x, y, data in regions:
+            img.paste(Image.open(io.BytesIO(data)).convert('RGB'), (x, y))
+    else:
+        img = Image.open(io.BytesIO(png))
+
+    pil_format = FORMATS[fmt][0]
+    kwargs = {}
+    if pil_format == 'WEBP':
+        kwargs = {'quality': quality, 'lossless': lossless}
+    elif pil_format == 'JPEG':
+        img = img.convert('RGB')
+        kwargs = {'quality': quality}
+    img.save(path, pil_format, **kwargs)
+    return os.path.getsize(path), (time.perf_counter() - t0) * 1000
+
+def merge_boxes(bboxes, width, height, pad=MERGE_PX):
+    """Integer page rects covering every non-empty bbox, overlapping ones merged."""
+    rects = []
+    for b in bboxes:
+        if b['width'] <= 0 or b['height'] <= 0:
+            continue
+        x0 = max(0, int(b['x']))
+        y0 = max(0, int(b['y']))
+        x1 = min(width, int(b['x'] + b['width']) + 1)
+        y1 = min(height, int(b['y'] + b['height']) + 1)
+        if x1 > x0 and y1 > y0:
+            rects.append([x0, y0, x1, y1])
+    rects.sort(key=lambda r: (r[1], r[0]))
+
+    merged = []
+    for r in rects:
+        for m in merged:
+            if r[0] <= m[2] + pad and m[0] <= r[2] + pad and r[1] <= m[3] + pad and m[1] <= r[3] + pad:
+                m[0], m[1] = min(m[0], r[0]), min(m[1], r[1])
+                m[2], m[3] = max(m[2], r[2]), max(m[3], r[3])
+                break
+        else:
+            merged.append(r)
+    return merged
+
+async def capture(page, path, *, mode='full', fmt='webp', quality=80, lossless=False,
+                  bboxes=(), workers=None):
+    """
+    Take the screenshot for `page` and return an awaitable resolving to
+    (bytes_written, encode_ms) once the file at `path` is written, so the
+    caller can overlap encoding with other browser work.
+    """
+    loop = asyncio.get_running_loop()
+
+    if mode == 'regions':
+        width, height = await page.evaluate(
+            "() => [document.documentElement.scrollWidth, document.documentElement.scrollHeight]")
+        regions = []
+        for x0, y0, x1, y1 in merge_boxes(bboxes, width, height):
+            data = await page.screenshot(full_page=True,
+                                         clip={'x': x0, 'y': y0, 'width': x1 - x0, 'height': y1 - y0})
+            regions.append((x0, y0, data))
+        return loop.run_in_executor(encode_pool(workers), encode, str(path), fmt, quality,
+                                    lossless, None, regions, (max(width, 1), max(height, 1)))
+
+    full_page = mode == 'full'
+    if fmt in ('png', 'jpeg'):
+        # Chromium encodes these itself, nothing to offload
+        kwargs = {'quality': quality} if fmt == 'jpeg' else {}
+        await page.screenshot(full_page=full_page, path=str(path), type=fmt, **kwargs)
+        done = loop.create_future()
+        done.set_result((os.path.getsize(path), 0.0))
+        return done
+
+    png = await page.screenshot(full_page=full_page)
+    return loop.run_in_executor(encode_pool(workers), encode, str(path), fmt, quality,
+                                lossless, png)
@@ -3,6 +3,12 @@ import json
 import pickle
 import os
 
+from agents.tracing import span, set_tracer, PrintTracer
+
+# TRACE=1 prints how long every stage took (parse, tokenize, generate, LLM calls, …)
+if os.getenv("TRACE"):
+    set_tracer(PrintTracer())
+
 # A silent proxy for driving “human” turns
 user_proxy = UserProxyAgent(
     name="UserProxy",
@@ -12,7 +18,7 @@ user_proxy = UserProxyAgent(
 )
 
 # Load your UI JSON once
-with open("test_data/test_file.json", "r", encoding="utf-8") as f:
+with open("test_data/test_file.json", "r", encoding="utf-8") as f, span("json_parse", agent="calling_agents"):
     ui_json = json.load(f)
 
 # 1) Make sure your JSON is a string
@@ -30,7 +36,8 @@ class ChatWrapperAgent(AssistantAgent):
     def generate_reply(self, messages, sender=None, **kwargs):
         # take the content of the *first* message as raw JSON
         raw_json = messages[0]["content"]
-        return self.t5_agent.handle(raw_json)
+        with span("handle", agent=self.name):
+            return self.t5_agent.handle(raw_json)
 
 # Load magents from Pickle files
 semantic_model = pickle.load(open("agent_pickles/semantic_agent.pkl", "rb"))
@@ -84,29 +91,36 @@ user_proxy = UserProxyAgent(
 
 # 3) Build the GroupChat with explicit round‑robin ordering
 
+class TracedAssistantAgent(AssistantAgent):
+    """AssistantAgent whose replies (one LLM call each) are traced as llm_call spans."""
+    def generate_reply(self, messages=None, sender=None, **kwargs):
+        model = self.llm_config.get("model", "") if isinstance(self.llm_config, dict) else ""
+        with span("llm_call", agent=self.name, model=model):
+            return super().generate_reply(messages=messages, sender=sender, **kwargs)
+
 # Visually Impaired Agent
-visually_impaired_agent = AssistantAgent(
+visually_impaired_agent = TracedAssistantAgent(
     name="VisuallyImpairedAgent",
     system_message="You are a screen‑reader user. Given the following combined accessibility summary from the SemanticAgent and ContrastAgent, analyze it and respond with any additional issues or validations as you navigate the page. Include explicit references to each semantic and contrast finding.",
     llm_config={"model": "gpt-4", "temperature": 0}
 )
 
 # Motor-Impaired Agent
-motor_impaired_agent = AssistantAgent(
+motor_impaired_agent = TracedAssistantAgent(
     name="MotorImpairedAgent",
     system_message="You are a keyboard‑only user. Given the combined accessibility summary above, walk through the page structure and identify keyboard navigation barriers (e.g., tabindex issues, missing focus styles). Refer back to each semantic/contrast point in your response.",
     llm_config={"model": "gpt-4", "temperature": 0}
 )
 
 # Color-Blind Agent
-color_blind_agent = AssistantAgent(
+color_blind_agent = TracedAssistantAgent(
     name="ColorBlindAgent",
     system_message="You are a color‑blind user. Using the combined summary, assess whether the listed contrast ratios and semantic issues affect your ability to distinguish page elements. Call out any color‑related problems or confirm that the reported contrast ratio is sufficient.",
     llm_config={"model": "gpt-4", "temperature": 0}
 )
 
 # Fixing Agent
-fixing_agent = AssistantAgent(
+fixing_agent = TracedAssistantAgent(
     name="FixingAgent",
     system_message="You are the final‑stage accessibility engineer. Given the full conversation history—including the semantic and contrast summaries and each simulation agent’s findings—produce a consolidated list of code‑level fixes. For each issue, reference which agent(s) raised it, then provide the minimal HTML/CSS/ARIA snippet needed to resolve it.",
     llm_config={"model": "gpt-4", "temperature": 0}
@@ -137,9 +151,10 @@ manager = GroupChatManager(
 )
 
 # 5) Kick off with your combined summary; max_turns = 6 agents after the proxy
-chat_result = user_proxy.initiate_chat(
-    manager,
-    message=combined_summary,
-    clear_history=True,
-    max_turns=1
-)
\ No newline at end of file
+with span("group_chat", agent="GroupChatManager", model="gpt-4"):
+    chat_result = user_proxy.initiate_chat(
+        manager,
+        message=combined_summary,
+        clear_history=True,
+        max_turns=1
+    )
\ No newline at end of file
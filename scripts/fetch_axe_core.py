@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+One-time download of the pinned axe-core bundle into vendor/axe-core/, so page
+capture never has to reach a CDN again.
+
+Usage:
+  python scripts/fetch_axe_core.py [version]
+"""
+import sys
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from agents.axe_rules import AXE_SCRIPT_CANDIDATES, AXE_VERSION
+
+CDN_URL = "https://cdnjs.cloudflare.com/ajax/libs/axe-core/{version}/axe.min.js"
+
+def main(version=AXE_VERSION):
+    dest = AXE_SCRIPT_CANDIDATES[0]
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    with urllib.request.urlopen(CDN_URL.format(version=version), timeout=60) as resp:
+        source = resp.read()
+    dest.write_bytes(source)
+    print(f"✅ axe-core {version} ({len(source) / 1024:.0f} KB) → {dest}")
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
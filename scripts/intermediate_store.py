@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Sharded intermediate store shared by phase 1 and phase 3+4.
+
+Phase 1 used to pickle every page into intermediate/per_page.pkl, which had to
+be unpickled in one go before phase 3+4 could write anything.  Pages are now
+streamed into gzipped JSONL shards, one directory per table:
+
+    intermediate/
+    ├─ _manifest.json
+    ├─ viewports/part-00000.jsonl.gz   page_id, vp_index, viewport, html_path, screenshot
+    ├─ semantic/part-00000.jsonl.gz    page_id, vp_index, lang, headings, links, missing_name
+    ├─ images/part-00000.jsonl.gz      page_id, vp_index, nodeId, alt, bbox
+    └─ contrast/part-00000.jsonl.gz    page_id, vp_index, role, backendId, fg, bg, contrast
+
+Every table rolls over to a new part after the same number of pages, so part N
+of each table always covers the same pages and a page can be rebuilt by reading
+one part per table.
+"""
+import os
+import gzip
+import json
+from itertools import groupby
+
+# ─── SCHEMA ─────────────────────────────────────────────────────────────────────
+TABLES = {
+    "viewports": ["page_id", "vp_index", "viewport", "html_path", "screenshot"],
+    "semantic":  ["page_id", "vp_index", "lang", "headings", "links", "missing_name"],
+    "images":    ["page_id", "vp_index", "nodeId", "alt", "bbox"],
+    "contrast":  ["page_id", "vp_index", "role", "backendId", "fg", "bg", "contrast"],
+}
+MANIFEST        = "_manifest.json"
+PAGES_PER_SHARD = 500
+
+def _part_name(idx):
+    return f"part-{idx:05d}.jsonl.gz"
+
+# ─── WRITER ─────────────────────────────────────────────────────────────────────
+class ShardWriter:
+    """
+    Streams pages into the store.  Use as a context manager and call
+    `add_page(page_id, viewports)` with the same per-viewport dicts phase 1
+    used to put in per_page.pkl.
+    """
+
+    def __init__(self, root, pages_per_shard=PAGES_PER_SHARD):
+        self.root = root
+        self.pages_per_shard = pages_per_shard
+        self.parts = []
+        self.rows = {t: 0 for t in TABLES}
+        self._files = {}
+        self._pages_in_part = 0
+        for t in TABLES:
+            os.makedirs(os.path.join(root, t), exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _open_part(self):
+        idx = len(self.parts)
+        name = _part_name(idx)
+        self._files = {
+            t: gzip.open(os.path.join(self.root, t, name), "wt", encoding="utf-8")
+            for t in TABLES
+        }
+        self.parts.append(name)
+        self._pages_in_part = 0
+
+    def _close_part(self):
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+    def _write(self, table, row):
+        self._files[table].write(json.dumps(row, ensure_ascii=False) + "\n")
+        self.rows[table] += 1
+
+    def add_page(self, page_id, viewports):
+        if not self._files or self._pages_in_part >= self.pages_per_shard:
+            self._close_part()
+            self._open_part()
+        self._pages_in_part += 1
+
+        for i, vp in enumerate(viewports):
+            key = {"page_id": page_id, "vp_index": i}
+            self._write("viewports", {**key,
+                                      "viewport": vp["viewport"],
+                                      "html_path": vp["html_path"],
+                                      "screenshot": vp["screenshot"]})
+            sem = vp["semantic"]
+            self._write("semantic", {**key,
+                                     "lang": sem["lang"],
+                                     "headings": sem["headings"],
+                                     "links": sem["links"],
+                                     "missing_name": sem["missing_name"]})
+            bboxes = {c["nodeId"]: c["bbox"] for c in vp["image_captioning"]}
+            for img in sem["images"]:
+                self._write("images", {**key,
+                                       "nodeId": img["nodeId"],
+                                       "alt": img["alt"],
+                                       "bbox": bboxes.get(img["nodeId"])})
+            for c in vp["contrast"]:
+                self._write("contrast", {**key, **c})
+
+    def close(self):
+        self._close_part()
+        manifest = {
+            "tables": TABLES,
+            "parts": self.parts,
+            "rows": self.rows,
+            "pages_per_shard": self.pages_per_shard,
+        }
+        with open(os.path.join(self.root, MANIFEST), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+# ─── READERS ────────────────────────────────────────────────────────────────────
+def load_manifest(root):
+    with open(os.path.join(root, MANIFEST), encoding="utf-8") as f:
+        return json.load(f)
+
+def _read_part(root, table, part, columns=None):
+    with gzip.open(os.path.join(root, table, part), "rt", encoding="utf-8") as f:
+        for line in f:
+            row = json.loads(line)
+            if columns is not None:
+                row = {c: row.get(c) for c in columns}
+            yield row
+
+def iter_rows(root, table, columns=None, parts=None):
+    """
+    Stream rows of one table, optionally projected onto `columns`.
+    `parts` restricts the read to a subset of the manifest's part files.
+    """
+    if table not in TABLES:
+        raise KeyError(f"Unknown table {table!r}; expected one of {list(TABLES)}")
+    for part in parts if parts is not None else load_manifest(root)["parts"]:
+        yield from _read_part(root, table, part, columns)
+
+def _by_viewport(rows):
+    out = {}
+    for row in rows:
+        out.setdefault((row["page_id"], row["vp_index"]), []).append(row)
+    return out
+
+def iter_pages(root, parts=None):
+    """
+    Rebuild `{'page_id', 'viewports'}` dicts in the phase 1 layout, one part at
+    a time, so at most one shard's worth of pages is held in memory.
+    """
+    for part in parts if parts is not None else load_manifest(root)["parts"]:
+        semantic = {(r["page_id"], r["vp_index"]): r for r in _read_part(root, "semantic", part)}
+        images   = _by_viewport(_read_part(root, "images", part))
+        contrast = _by_viewport(_read_part(root, "contrast", part))
+
+        rows = _read_part(root, "viewports", part)
+        for page_id, vps in groupby(rows, key=lambda r: r["page_id"]):
+            viewports = []
+            for vp in vps:
+                key = (page_id, vp["vp_index"])
+                sem = semantic.get(key, {})
+                imgs = images.get(key, [])
+                viewports.append({
+                    "viewport": vp["viewport"],
+                    "semantic": {
+                        "lang": sem.get("lang", ""),
+                        "headings": sem.get("headings", []),
+                        "images": [{"nodeId": i["nodeId"], "alt": i["alt"]} for i in imgs],
+                        "missing_alt": [i["nodeId"] for i in imgs if not i["alt"].strip()],
+                        "links": sem.get("links", []),
+                        "missing_name": sem.get("missing_name", []),
+                    },
+                    "contrast": [
+                        {k: c[k] for k in TABLES["contrast"][2:]}
+                        for c in contrast.get(key, [])
+                    ],
+                    "image_captioning": [
+                        {"nodeId": i["nodeId"], "alt": i["alt"], "bbox": i["bbox"]}
+                        for i in imgs if i["bbox"]
+                    ],
+                    "axe": None,
+                    "html_path": vp["html_path"],
+                    "screenshot": vp["screenshot"],
+                })
+            yield {"page_id": page_id, "viewports": viewports}
@@ -3,14 +3,15 @@ import os
 import re
 import json
 import gzip
-import pickle
 from tqdm import tqdm
 from bs4 import BeautifulSoup
 
+from intermediate_store import ShardWriter
+
 # ─── CONFIG ─────────────────────────────────────────────────────────────────────
 BASE_DIR        = "/Users/akshat/Data/UIUC/Spring 2025/Courses/CS 568 User-Centered Machine Learning/Project/WebUI-7k/train_split_web7k"
 VIEWPORTS       = ["1280-720","1366-768","1536-864","1920-1080","iPad-Pro","iPhone-13 Pro"]
-os.makedirs("intermediate", exist_ok=True)  # folder for intermediate pickle
+STORE_DIR       = "intermediate"            # sharded JSONL store, see intermediate_store.py
 
 # ─── HELPERS ────────────────────────────────────────────────────────────────────
 def load_json(path):
@@ -40,10 +41,22 @@ def contrast_ratio(fg,bg):
     l,d=max(L1,L2),min(L1,L2)
     return (l+0.05)/(d+0.05)
 
+def resolve_bg(bid, styles, by_back, by_id):
+    """Own background-color, else the nearest AX ancestor's, else white."""
+    c = parse_rgba(styles.get(str(bid),{}).get('background-color'))
+    if c: return c
+    node = by_back.get(bid)
+    while node:
+        node = by_id.get(node.get('parentId'))
+        if not node: break
+        c2 = parse_rgba(styles.get(str(node['backendDOMNodeId']),{}).get('background-color'))
+        if c2: return c2
+    return (255,255,255)
+
 # ─── PHASE 1 ─────────────────────────────────────────────────────────────────────
 def main():
-    per_page = {}
     axe_jobs = []
+    store = ShardWriter(STORE_DIR)
 
     for pid in tqdm(os.listdir(BASE_DIR), desc="Pages"):
         page_dir = os.path.join(BASE_DIR, pid)
@@ -77,16 +90,7 @@ def main():
             by_id   = {n['nodeId']:n for n in AXT}
 
             def fg(bid): return parse_rgba(STY.get(str(bid),{}).get('color'))
-            def bg(bid):
-                c = parse_rgba(STY.get(str(bid),{}).get('background-color'))
-                if c: return c
-                node = by_back.get(bid)
-                while node:
-                    node = by_id.get(node.get('parentId'))
-                    if not node: break
-                    c2 = parse_rgba(STY.get(str(node['backendDOMNodeId']),{}).get('background-color'))
-                    if c2: return c2
-                return (255,255,255)
+            def bg(bid): return resolve_bg(bid, STY, by_back, by_id)
 
             # 1) semantic
             try:
@@ -169,12 +173,12 @@ def main():
               'vpIndex':len(result['viewports'])-1
             })
 
-        per_page[pid]=result
+        store.add_page(pid, result['viewports'])
 
     # write out
+    store.close()
     json.dump(axe_jobs, open("axe_jobs.json","w"), indent=2)
-    pickle.dump(per_page, open("intermediate/per_page.pkl","wb"))
-    print("Phase 1 done: wrote axe_jobs.json + intermediate/per_page.pkl")
+    print(f"Phase 1 done: wrote axe_jobs.json + {STORE_DIR}/ ({len(store.parts)} shards)")
 
 if __name__=="__main__":
     main()
\ No newline at end of file
@@ -2,41 +2,43 @@
 import os
 import sys
 import json
-import pickle
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from intermediate_store import iter_pages, load_manifest
 
 # ─── CONFIG ───────────────────────────────────────────────────────────────────────
 BASE_DIR    = "/Users/akshat/Data/UIUC/Spring 2025/Courses/CS 568 User-Centered Machine Learning/Project/WebUI-7k"
 TRAIN_DIR   = os.path.join(BASE_DIR, "train_split_web7k")
-PKL_PATH    = os.path.join(BASE_DIR, "intermediate", "per_page.pkl")
+STORE_DIR   = os.path.join(BASE_DIR, "intermediate")
 OUTPUT_DIR  = os.path.join(BASE_DIR, "json_dataset_for_agents")
 
-# ─── SETUP ────────────────────────────────────────────────────────────────────────
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+# axe result types nothing downstream reads
+DROPPED_AXE_KEYS = ("passes", "incomplete", "inapplicable")
 
-# ─── LOAD PHASE 1 METADATA ───────────────────────────────────────────────────────
-try:
-    with open(PKL_PATH, "rb") as f:
-        per_page = pickle.load(f)
-except Exception as e:
-    print(f"❌ Fatal: could not load phase 1 pickle at {PKL_PATH}: {e}", file=sys.stderr)
-    sys.exit(1)
+# ─── HELPERS ──────────────────────────────────────────────────────────────────────
+def axe_prefix(vp):
+    # reconstruct the same filename prefix used in phase 1
+    return vp if vp in ("iPad-Pro", "iPhone-13 Pro") else f"default_{vp}"
 
-# ─── PHASE 3+4: FILTER & MERGE ─────────────────────────────────────────────────────
-for page_id, page_data in per_page.items():
-    vps = page_data.get("viewports", [])
-    out_viewports = []
+def project_axe(axe_data):
+    """Keep everything except the passes/incomplete/inapplicable arrays."""
+    return {k: v for k, v in axe_data.items() if k not in DROPPED_AXE_KEYS}
 
-    for vp_entry in vps:
-        vp = vp_entry.get("viewport")
-        # reconstruct the same filename prefix you used in phase 1:
-        if vp in ("iPad-Pro", "iPhone-13 Pro"):
-            prefix = vp
-        else:
-            prefix = f"default_{vp}"
+def merge_page(page_data, train_dir, output_dir, violations_only, indent):
+    """
+    Attach axe results to one page and write it out.  Returns
+    (status, bytes_written, messages) with status in written/skipped/failed.
+    """
+    page_id = page_data["page_id"]
+    out_viewports = []
+    messages = []
 
-        axe_path = os.path.join(TRAIN_DIR, page_id, f"{prefix}-axe.json")
+    for vp_entry in page_data.get("viewports", []):
+        axe_path = os.path.join(train_dir, page_id, f"{axe_prefix(vp_entry.get('viewport'))}-axe.json")
         if not os.path.isfile(axe_path):
-            print(f"⚠️  Missing axe file, skipping: {axe_path}", file=sys.stderr)
+            messages.append(f"⚠️  Missing axe file, skipping: {axe_path}")
             continue
 
         # load the axe results
@@ -44,29 +46,101 @@ for page_id, page_data in per_page.items():
             with open(axe_path, "r", encoding="utf-8") as axf:
                 axe_data = json.load(axf)
         except Exception as e:
-            print(f"⚠️  Could not parse JSON {axe_path}: {e}", file=sys.stderr)
+            messages.append(f"⚠️  Could not parse JSON {axe_path}: {e}")
             continue
 
         # keep only if there are real violations
         violations = axe_data.get("violations")
         if isinstance(violations, list) and len(violations) > 0:
-            # copy everything from the original vp_entry and inject full axe results
-            new_vp = vp_entry.copy()
-            new_vp["axe"] = axe_data
-            out_viewports.append(new_vp)
-
-    # if at least one viewport had violations, write out the merged JSON
-    if out_viewports:
-        out_payload = {
-            "page_id": page_id,
-            "viewports": out_viewports
-        }
-        out_file = os.path.join(OUTPUT_DIR, f"{page_id}.json")
+            vp_entry["axe"] = project_axe(axe_data) if violations_only else axe_data
+            out_viewports.append(vp_entry)
+
+    if not out_viewports:
+        return "skipped", 0, messages
+
+    # stream straight to disk rather than building the whole string first;
+    # via a temp file so a crash mid-dump never leaves a truncated page
+    out_file = os.path.join(output_dir, f"{page_id}.json")
+    tmp_file = f"{out_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as outf:
+            json.dump({"page_id": page_id, "viewports": out_viewports}, outf,
+                      indent=indent, separators=None if indent else (",", ":"))
+        os.replace(tmp_file, out_file)
+        return "written", os.path.getsize(out_file), messages
+    except Exception as e:
+        messages.append(f"❌ Failed to write {out_file}: {e}")
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        return "failed", 0, messages
+
+def merge_part(part, store_dir, train_dir, output_dir, violations_only, indent):
+    """Worker entry point: merge every page of one store shard."""
+    stats = {"written": 0, "skipped": 0, "failed": 0, "bytes": 0, "messages": []}
+    for page_data in iter_pages(store_dir, parts=[part]):
         try:
-            with open(out_file, "w", encoding="utf-8") as outf:
-                json.dump(out_payload, outf, indent=2)
-            print(f"✅ Wrote {len(out_viewports)} violations → {out_file}")
+            status, nbytes, messages = merge_page(page_data, train_dir, output_dir,
+                                                  violations_only, indent)
         except Exception as e:
-            print(f"❌ Failed to write {out_file}: {e}", file=sys.stderr)
+            status, nbytes, messages = "failed", 0, [f"❌ {page_data['page_id']}: {e}"]
+        stats[status] += 1
+        stats["bytes"] += nbytes
+        stats["messages"].extend(messages)
+    return stats
+
+# ─── PHASE 3+4: FILTER & MERGE ─────────────────────────────────────────────────────
+def main():
+    ap = argparse.ArgumentParser(description="Merge phase 1 store with per-viewport axe results.")
+    ap.add_argument("--store", default=STORE_DIR)
+    ap.add_argument("--train-dir", default=TRAIN_DIR)
+    ap.add_argument("--output-dir", default=OUTPUT_DIR)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--violations-only", action="store_true",
+                    help="drop axe passes/incomplete/inapplicable from the output")
+    ap.add_argument("--indent", type=int, default=None,
+                    help="pretty-print output JSON (default: compact)")
+    args = ap.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    try:
+        parts = load_manifest(args.store)["parts"]
+    except Exception as e:
+        print(f"❌ Fatal: could not open phase 1 store at {args.store}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    totals = {"written": 0, "skipped": 0, "failed": 0, "bytes": 0}
+    failed_parts = []
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(merge_part, part, args.store, args.train_dir, args.output_dir,
+                        args.violations_only, args.indent): part
+            for part in parts
+        }
+        for fut in as_completed(futures):
+            part = futures[fut]
+            try:
+                stats = fut.result()
+            except Exception as e:
+                # the shard's page count isn't known without reading it
+                print(f"❌ Shard {part} failed: {e}", file=sys.stderr)
+                failed_parts.append(part)
+                continue
+            for msg in stats.pop("messages"):
+                print(msg, file=sys.stderr)
+            for k in totals:
+                totals[k] += stats[k]
+            print(f"✅ {part}: {stats['written']} written, {stats['skipped']} skipped, "
+                  f"{stats['failed']} failed")
+    elapsed = time.perf_counter() - t0
+
+    print(f"🏁 Phase 3+4 complete in {elapsed:.1f}s with {args.workers} workers.")
+    print(f"   written: {totals['written']}  skipped: {totals['skipped']}  failed: {totals['failed']}  "
+          f"({totals['bytes'] / 1e6:.1f} MB)  →  {args.output_dir}")
+    if failed_parts:
+        print(f"   failed shards ({len(failed_parts)}): {', '.join(sorted(failed_parts))}")
+    if totals["failed"] or failed_parts:
+        sys.exit(1)
 
-print("🏁 Phase 3+4 complete.  Check", OUTPUT_DIR)
+if __name__ == "__main__":
+    main()
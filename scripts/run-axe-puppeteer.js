@@ -14,12 +14,23 @@ try {
 }
 
 (async () => {
-  const [, , jobsFile] = process.argv;
+  const [, , jobsFile, optionsFile] = process.argv;
   if (!jobsFile) {
-    console.error('Usage: node run-axe-puppeteer.js <axe_jobs.json>');
+    console.error('Usage: node run-axe-puppeteer.js <axe_jobs.json> [axe_options.json]');
     process.exit(1);
   }
 
+  // optional axe.run options, e.g. from `python -m agents.axe_rules semantic axe`
+  let axeOptions = null;
+  if (optionsFile) {
+    try {
+      axeOptions = JSON.parse(fs.readFileSync(optionsFile, 'utf-8'));
+    } catch (err) {
+      console.error('❌ Failed to read axe options file:', err.message);
+      process.exit(1);
+    }
+  }
+
   let jobs;
   try {
     jobs = JSON.parse(fs.readFileSync(jobsFile, 'utf-8'));
@@ -50,9 +61,9 @@ try {
       });
 
       console.log(`→ [${pageId}@${vpIndex}] 🪝 running axe`);
-      const results = await new AxePuppeteer(page)
-        .include('body')
-        .analyze();
+      const axeBuilder = new AxePuppeteer(page).include('body');
+      if (axeOptions) axeBuilder.options(axeOptions);
+      const results = await axeBuilder.analyze();
 
       fs.writeFileSync(outFile, JSON.stringify(results, null, 2));
       console.log(`→ [${pageId}@${vpIndex}] ✅ done`);
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+run_axe_pool.py
+
+Usage:
+  python scripts/run_axe_pool.py <axe_jobs.json> [--concurrency N] [--axe-script axe.min.js]
+
+Python replacement for run-axe-puppeteer.js + rerun_axe_failures.js.  Runs the
+phase 1 job list over a pool of N Playwright browser contexts.  Every job is
+first tried with the strict strategy used by run-axe-puppeteer.js:
+  • waitUntil: networkidle, 30 s
+  • blocking image/media/font/stylesheet
+  • scoping to <body>
+and, if navigation or axe fails, immediately retried with the relaxed strategy
+from rerun_axe_failures.js:
+  • waitUntil: domcontentloaded, 60 s
+  • additionally blocking scripts
+  • scoping to <html>
+Results are written atomically (tmp file + rename).  Jobs that fail both
+strategies get the usual `{error, violations: []}` stub and a line in the
+failure log.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+from playwright.async_api import async_playwright
+
+REPO_ROOT   = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+from agents.axe_rules import AXE_RUN_JS, DEFAULT_AGENTS, axe_run_options, load_axe_source
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────────────
+FAILURE_LOG = "axe_failures.txt"
+
+STRICT = {
+    "name": "strict",
+    "wait_until": "networkidle",
+    "timeout": 30000,
+    "blocked": {"image", "media", "font", "stylesheet"},
+    "scope": "body",
+}
+RELAXED = {
+    "name": "relaxed",
+    "wait_until": "domcontentloaded",
+    "timeout": 60000,
+    "blocked": {"image", "media", "font", "stylesheet", "script"},
+    "scope": "html",
+}
+
+# ─── HELPERS ────────────────────────────────────────────────────────────────────
+def write_atomic(path, payload):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    os.replace(tmp, path)
+
+async def run_strategy(page, job, strategy, axe_options, state):
+    state["blocked"] = strategy["blocked"]
+    await page.goto(job["htmlUrl"], wait_until=strategy["wait_until"],
+                    timeout=strategy["timeout"])
+    await page.wait_for_selector(strategy["scope"], state="attached", timeout=30000)
+    return await page.evaluate(AXE_RUN_JS, {"scope": strategy["scope"], "options": axe_options})
+
+class Progress:
+    def __init__(self, total, every):
+        self.total = total
+        self.every = every
+        self.done = self.ok = self.fallback = self.failed = 0
+        self.t0 = time.perf_counter()
+
+    def record(self, status):
+        self.done += 1
+        setattr(self, status, getattr(self, status) + 1)
+        if self.done % self.every == 0 or self.done == self.total:
+            self.report()
+
+    def report(self):
+        elapsed = time.perf_counter() - self.t0
+        rate = self.done / elapsed if elapsed else 0.0
+        eta = (self.total - self.done) / rate if rate else 0.0
+        print(f"⏱️  {self.done}/{self.total} jobs  {rate:.2f} jobs/s  ETA {eta:.0f}s  "
+              f"(ok {self.ok}, fallback {self.fallback}, failed {self.failed})")
+
+# ─── WORKER POOL ────────────────────────────────────────────────────────────────
+async def worker(browser, queue, axe_source, axe_options, progress, failure_log):
+    context = await browser.new_context()
+    # local axe bundle, evaluated in every frame before page scripts
+    await context.add_init_script(script=axe_source)
+    page = await context.new_page()
+    state = {"blocked": STRICT["blocked"]}
+
+    async def block(route):
+        if route.request.resource_type in state["blocked"]:
+            await route.abort()
+        else:
+            await route.continue_()
+    await page.route("**/*", block)
+
+    while True:
+        job = await queue.get()
+        if job is None:
+            queue.task_done()
+            break
+        tag = f"{job['pageId']}@{job['vpIndex']}"
+        errors = []
+        status = "failed"
+        for strategy in (STRICT, RELAXED):
+            try:
+                results = await run_strategy(page, job, strategy, axe_options, state)
+            except Exception as err:
+                errors.append(f"{strategy['name']}: {err}".replace("\n", " "))
+                continue
+            # only navigation / axe failures earn the relaxed retry; a write
+            # error would just repeat after another full page load
+            try:
+                write_atomic(job["outFile"], results)
+                status = "ok" if strategy is STRICT else "fallback"
+            except Exception as err:
+                errors.append(f"write: {err}".replace("\n", " "))
+            break
+
+        if status == "failed":
+            print(f"⚠️  Axe failed for {tag}: {errors[-1]}", file=sys.stderr)
+            try:
+                write_atomic(job["outFile"], {"error": errors[-1], "violations": []})
+            except Exception as write_err:
+                print(f"❌ Could not write stub for {tag}: {write_err}", file=sys.stderr)
+            if failure_log:
+                with open(failure_log, "a", encoding="utf-8") as f:
+                    f.write(f"{tag}\t{job['htmlUrl']}\t{' | '.join(errors)}\n")
+        progress.record(status)
+        queue.task_done()
+
+    await context.close()
+
+async def run_jobs(jobs, *, concurrency=4, axe_source=None, agents=DEFAULT_AGENTS,
+                   failure_log=None, progress_every=25):
+    """
+    Run `jobs` (phase 1 axe_jobs.json entries) over `concurrency` browser
+    contexts, restricted to the axe rules `agents` consume.  Returns the
+    Progress counters.
+    """
+    axe_options = axe_run_options(agents)
+    if axe_options is None:
+        raise ValueError(f"None of {list(agents)} consume axe results; nothing to run")
+    if axe_source is None:
+        axe_source = load_axe_source()
+    if failure_log:
+        open(failure_log, "w").close()
+
+    queue = asyncio.Queue()
+    for job in jobs:
+        queue.put_nowait(job)
+    n_workers = max(1, min(concurrency, len(jobs)))
+    for _ in range(n_workers):
+        queue.put_nowait(None)
+
+    progress = Progress(len(jobs), progress_every)
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(
+            headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"]
+        )
+        await asyncio.gather(*(
+            worker(browser, queue, axe_source, axe_options, progress, failure_log)
+            for _ in range(n_workers)
+        ))
+        await browser.close()
+    return progress
+
+def main():
+    ap = argparse.ArgumentParser(description="Run axe-core over axe_jobs.json with a browser pool.")
+    ap.add_argument("jobs_file")
+    ap.add_argument("--concurrency", type=int, default=4)
+    ap.add_argument("--axe-script", default=None,
+                    help="path to axe.min.js (default: vendor/axe-core or node_modules)")
+    ap.add_argument("--agents", nargs="+", default=DEFAULT_AGENTS,
+                    help="agents whose axe rules should run (default: all)")
+    ap.add_argument("--failure-log", default=FAILURE_LOG)
+    ap.add_argument("--progress-every", type=int, default=25)
+    args = ap.parse_args()
+
+    try:
+        jobs = json.loads(Path(args.jobs_file).read_text(encoding="utf-8"))
+        axe_source = load_axe_source(args.axe_script)
+    except Exception as err:
+        print(f"❌ Failed to read inputs: {err}", file=sys.stderr)
+        sys.exit(1)
+
+    progress = asyncio.run(run_jobs(
+        jobs,
+        concurrency=args.concurrency,
+        axe_source=axe_source,
+        agents=args.agents,
+        failure_log=args.failure_log,
+        progress_every=args.progress_every,
+    ))
+    progress.report()
+    print(f"🏁 All Axe jobs complete. Failures (if any) in {args.failure_log}")
+    if progress.failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / 'scripts'), str(ROOT / 'webapp')]
+
+@pytest.fixture(scope='session')
+def chromium():
+    """Skips the test unless playwright can launch Chromium here."""
+    sync_playwright = pytest.importorskip('playwright.sync_api').sync_playwright
+    try:
+        with sync_playwright() as pw:
+            pw.chromium.launch().close()
+    except Exception:
+        pytest.skip('no Chromium for playwright')
@@ -0,0 +1,52 @@
+import asyncio
+import json
+
+from asset_cache import AssetStore
+
+class Request:
+    method, post_data_buffer = 'GET', None
+
+    def __init__(self, url):
+        self.url = url
+
+class Response:
+    status, headers = 200, {'content-type': 'text/css', 'content-length': '4'}
+
+    async def body(self):
+        return b'a{} '
+
+class Route:
+    def __init__(self, url, fails=False):
+        self.request, self.fails, self.outcome = Request(url), fails, None
+
+    async def fetch(self, max_redirects=None):
+        if self.fails:
+            raise OSError('net::ERR_NAME_NOT_RESOLVED')
+        return Response()
+
+    async def abort(self, code='failed'):
+        self.outcome = ('abort', code)
+
+    async def fulfill(self, **kw):
+        self.outcome = ('fulfill', kw['body'])
+
+def test_record_failure_aborts_and_is_counted(tmp_path):
+    store = AssetStore(tmp_path, 'record')
+    route = Route('https://gone.example/x.css', fails=True)
+    asyncio.run(store.handle(route))
+    assert route.outcome == ('abort', 'failed')
+    assert store.stats['failed'] == 1 and store.stats['recorded'] == 0
+
+def test_rerecording_does_not_grow_index(tmp_path):
+    for _ in range(2):
+        store = AssetStore(tmp_path, 'record')
+        for _ in range(3):
+            route = Route('https://a.example/x.css')
+            asyncio.run(store.handle(route))
+            assert route.outcome == ('fulfill', b'a{} ')
+    lines = (tmp_path / 'index.jsonl').read_text().splitlines()
+    assert [json.loads(l)['key'] for l in lines] == ['GET https://a.example/x.css']
+
+    route = Route('https://a.example/x.css')
+    asyncio.run(AssetStore(tmp_path, 'replay').handle(route))
+    assert route.outcome == ('fulfill', b'a{} ')
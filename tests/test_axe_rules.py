@@ -0,0 +1,9 @@
+from agents.axe_rules import axe_run_options, slowest_rules
+
+def test_agents_without_axe_need_no_run():
+    assert axe_run_options(['contrast']) is None
+    assert axe_run_options(['contrast', 'caption']) is None
+    assert slowest_rules(None) == []
+
+def test_semantic_only_runs_its_category():
+    assert axe_run_options(['semantic', 'contrast'])['runOnly']['values'] == ['cat.semantics']
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from agents.axe_stream import read_violations
+
+def violations(doc, index):
+    return [v['violations'] for v in read_violations(doc, (index,))]
+
+def test_irregular_indentation_is_not_trusted():
+    # the `}]},` closing "semantic" sits at the viewport's indentation, so
+    # the newline-plus-indent shortcut lands inside the first viewport
+    doc = ('{\n  "viewports": [\n    {\n      "semantic": {"a": [{\n    }]},\n'
+           '      "axe": {"violations": [{"id": "vp0"}]}\n    },\n    {\n'
+           '      "axe": {"violations": [{"id": "vp1"}]}\n    }\n  ]\n}')
+    assert violations(doc, 0) == [[{'id': 'vp0'}]]
+    assert violations(doc, 1) == [[{'id': 'vp1'}]]
+
+def test_json_dump_indent_2(tmp_path):
+    page = {'page_id': 'p', 'viewports': [
+        {'viewport': f'vp{i}',
+         'semantic': {'nodes': [{'text': '}\n  ]', 'kids': [[], {}]}]},
+         'axe': {'passes': [{'id': 'x"\\'}], 'violations': [{'id': f'rule{i}'}]}}
+        for i in range(3)]}
+    path = tmp_path / 'page.json'
+    with open(path, 'w') as f:
+        json.dump(page, f, indent=2)
+    got = read_violations(path, (0, 2))
+    assert [(v['index'], v['viewport'], v['violations']) for v in got] == [
+        (0, 'vp0', [{'id': 'rule0'}]), (2, 'vp2', [{'id': 'rule2'}])]
+
+def test_compact_falls_back_to_json_loads():
+    page = {'viewports': [{'axe': {'violations': [{'id': 'a'}]}}]}
+    assert violations(json.dumps(page), 0) == [[{'id': 'a'}]]
+    assert violations(json.dumps(page).encode(), 0) == [[{'id': 'a'}]]
+
+def test_str_is_a_document_not_a_file_name(tmp_path):
+    path = tmp_path / 'page.json'
+    path.write_text(json.dumps({'viewports': [{'axe': {'violations': [{'id': 'a'}]}}]}))
+    assert violations(path, 0) == [[{'id': 'a'}]]
+    with pytest.raises(json.JSONDecodeError):
+        read_violations(str(path))
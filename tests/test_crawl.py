@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import urllib.request
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('playwright')
+pytest.importorskip('PIL')
+from crawl import Frontier, crawl, extract_links, normalize_url, sitemap_urls
+from analyze_page import CaptureOptions
+
+SITE = Path(__file__).resolve().parent.parent / 'test_data' / 'site'
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture(scope='module')
+def site():
+    """test_data/site over http.server on a free port → its base URL."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), partial(_QuietHandler, directory=str(SITE)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+def fetch(url):
+    with urllib.request.urlopen(url, timeout=10) as resp:
+        return resp.read().decode('utf-8')
+
+def test_normalize_url():
+    assert normalize_url('HTTP://Example.COM:80/a/./b/../c?utm_source=x&b=2&a=1#top') == \
+        'http://example.com/a/c?a=1&b=2'
+    assert normalize_url('https://example.com') == 'https://example.com/'
+    assert normalize_url('mailto:team@example.org') is None
+    assert normalize_url('/report.pdf', 'https://example.com/') is None
+
+def test_extract_links_from_fixture_pages(site):
+    assert extract_links(fetch(f'{site}/'), f'{site}/') == [
+        f'{site}/about.html', f'{site}/blog/', f'{site}/private/secret.html',
+        'https://example.org/']
+    # reordered queries are one URL
+    assert extract_links(fetch(f'{site}/blog/'), f'{site}/blog/') == [
+        f'{site}/blog/post-1.html', f'{site}/blog/post-2.html?a=1&b=2']
+    # <meta name="robots" content="nofollow">
+    assert extract_links(fetch(f'{site}/blog/post-2.html'), f'{site}/blog/post-2.html') == []
+
+def test_sitemap_urls(site):
+    assert sitemap_urls(f'{site}/sitemap.xml') == [
+        'http://localhost:8000/', 'http://localhost:8000/blog/post-1.html']
+
+def test_frontier_resumes_in_flight_pages(tmp_path):
+    frontier = Frontier(tmp_path / 'frontier.sqlite')
+    assert frontier.add(['https://a.example/', 'https://a.example/x'], depth=0) == 2
+    assert frontier.claim() == ('https://a.example/', 0)
+    frontier.finish('https://a.example/', str(tmp_path / 'a.example.json'))
+    assert frontier.claim() == ('https://a.example/x', 0)
+    frontier.close()                        # stopped with /x in flight
+
+    frontier = Frontier(tmp_path / 'frontier.sqlite')
+    assert frontier.counts() == {'done': 1, 'pending': 1}
+    assert frontier.add(['https://a.example/'], depth=1) == 0
+    assert frontier.claim() == ('https://a.example/x', 0)
+    assert frontier.attempts('https://a.example/x') == 2
+    frontier.close()
+
+def test_frontier_output_paths_never_collide(tmp_path):
+    frontier = Frontier(tmp_path / 'frontier.sqlite')
+    urls = ['https://a.example/a', 'https://a.example/a/', 'https://a.example/a-b',
+            'https://a.example/a/b']
+    frontier.add(urls, depth=0)
+    paths = [frontier.output_path(u, tmp_path) for u in urls]
+    assert paths[0] == tmp_path / 'a.example-a.json'
+    assert paths[2] == tmp_path / 'a.example-a-b.json'
+    assert len(set(paths)) == 4
+    frontier.close()
+
+    # kept across restarts, whatever order they are asked for in
+    frontier = Frontier(tmp_path / 'frontier.sqlite')
+    assert [frontier.output_path(u, tmp_path) for u in reversed(urls)] == paths[::-1]
+    frontier.close()
+
+def test_crawl_fixture_site(chromium, site, tmp_path):
+    # contrast only: no axe bundle needed
+    opts = CaptureOptions(agents=['contrast'], screenshot_mode='viewport', image_format='png')
+    stats = asyncio.run(crawl([f'{site}/'], tmp_path, opts, concurrency=2, delay=0))
+    assert stats['done'] == 5 and stats['failed'] == 0 and stats['skipped'] == 1
+
+    frontier = Frontier(tmp_path / 'frontier.sqlite')
+    rows = dict(frontier.db.execute("SELECT url, state FROM urls"))
+    frontier.close()
+    assert rows[f'{site}/private/secret.html'] == 'failed'       # robots.txt
+    assert 'https://example.org/' not in rows                   # other origin
+    assert f'{site}/never-followed.html' not in rows            # nofollow
+    assert len(list(tmp_path.glob('*.json'))) == 5
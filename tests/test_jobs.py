@@ -0,0 +1,38 @@
+from jobs import JobQueue
+
+def test_stale_worker_cannot_finish_a_reclaimed_job(tmp_path):
+    queue = JobQueue(tmp_path / 'jobs.db', lease_s=-1)     # every lease is already expired
+    [job_id] = queue.submit([{'url': 'https://a.example'}])
+    assert queue.claim('old')[0][0] == job_id
+    assert queue.claim('new')[0][0] == job_id               # lease ran out, handed out again
+
+    assert not queue.complete(job_id, 'old', {'from': 'old'})
+    assert not queue.fail(job_id, 'old', 'late failure')
+    assert queue.status(job_id)['state'] == 'running'
+
+    assert queue.complete(job_id, 'new', {'from': 'new'})
+    assert queue.result(job_id) == {'from': 'new'}
+    assert not queue.complete(job_id, 'new', {'from': 'again'})
+
+def test_renew_keeps_a_slow_batch_leased(tmp_path):
+    queue = JobQueue(tmp_path / 'jobs.db', lease_s=60)
+    ids = queue.submit([{'n': 1}, {'n': 2}])
+    assert len(queue.claim('w', 2)) == 2
+    queue.lease_s = -1                      # renew into the past: the lease is gone
+    assert queue.renew('w', ids) == 2
+    assert len(queue.claim('other', 2)) == 2
+    queue.lease_s = 60
+    assert queue.renew('w', ids) == 0       # no longer w's to renew
+    assert queue.renew('other', ids) == 2
+    assert queue.claim('third', 2) == []
+
+def test_live_workers(tmp_path):
+    queue = JobQueue(tmp_path / 'jobs.db', lease_s=60)
+    assert queue.live_workers() == []
+    queue.claim('idle')                     # an empty claim still counts as a sign of life
+    queue.claim('busy')
+    assert queue.live_workers() == ['busy', 'idle']
+    queue.release('idle')
+    assert queue.live_workers() == ['busy']
+    queue.lease_s = -1
+    assert queue.live_workers() == []
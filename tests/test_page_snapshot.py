@@ -0,0 +1,23 @@
+import json
+
+import pytest
+
+from agents import page_snapshot
+from agents.page_snapshot import load_page
+
+def test_load_page_sources(tmp_path):
+    doc = {'page_id': 'p', 'viewports': [{'axe': {'violations': []}}]}
+    json_path, snap_path = tmp_path / 'p.json', tmp_path / 'p.pagesnap'
+    json_path.write_text(json.dumps(doc))
+    page_snapshot.dump(doc, snap_path)
+    assert load_page(json.dumps(doc)) == doc
+    assert load_page(json.dumps(doc).encode()) == doc
+    assert load_page(json_path) == doc
+    assert load_page(snap_path) == doc
+
+def test_str_is_never_read_as_a_file(tmp_path):
+    (tmp_path / 'p.json').write_text('{}')
+    with pytest.raises(json.JSONDecodeError):
+        load_page(str(tmp_path / 'p.json'))
+    with pytest.raises(json.JSONDecodeError):
+        load_page('{"truncated": ')
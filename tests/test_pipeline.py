@@ -0,0 +1,37 @@
+import pytest
+
+import pipeline
+from pipeline import ScreenshotPathError, screenshot_inputs, screenshot_path
+
+@pytest.fixture
+def page_root(tmp_path, monkeypatch):
+    root = tmp_path / 'pages'
+    (root / 'shots').mkdir(parents=True)
+    (root / 'shots' / 'a.webp').write_bytes(b'webp')
+    (tmp_path / 'secret.png').write_bytes(b'png')
+    monkeypatch.setattr(pipeline, 'PAGE_ROOT', str(root))
+    return root
+
+def test_relative_paths_resolve_under_page_root(page_root):
+    assert screenshot_path('shots/a.webp') == (page_root / 'shots' / 'a.webp').resolve()
+    assert screenshot_path('shots/../shots/a.webp') == (page_root / 'shots' / 'a.webp').resolve()
+
+@pytest.mark.parametrize('path', ['../secret.png', 'shots/../../secret.png', '/etc/passwd'])
+def test_escapes_are_refused(page_root, path):
+    with pytest.raises(ScreenshotPathError):
+        screenshot_path(path)
+
+def test_symlink_out_of_page_root_is_refused(page_root):
+    (page_root / 'link.png').symlink_to(page_root.parent / 'secret.png')
+    with pytest.raises(ScreenshotPathError):
+        screenshot_path('link.png')
+
+def test_no_page_root_refuses_everything(monkeypatch):
+    monkeypatch.setattr(pipeline, 'PAGE_ROOT', None)
+    with pytest.raises(ScreenshotPathError):
+        screenshot_path('shots/a.webp')
+
+def test_refused_paths_are_never_statted(page_root):
+    page = {'viewports': [{'screenshot': 'shots/a.webp'}, {'screenshot': '../secret.png'}]}
+    mtime = (page_root / 'shots' / 'a.webp').stat().st_mtime_ns
+    assert screenshot_inputs(page) == [('shots/a.webp', 4, mtime), ('../secret.png', None, None)]
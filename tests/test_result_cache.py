@@ -0,0 +1,11 @@
+from result_cache import ResultCache
+
+def test_contains_checks_both_tiers_without_counting(tmp_path):
+    cache = ResultCache(tmp_path, max_items=1)
+    key, other = 'a' * 64, 'b' * 64
+    assert key not in cache
+    cache.put(key, {'x': 1})
+    cache.put(other, {'x': 2})              # evicts `key` from memory; still on disk
+    assert key in cache and other in cache
+    assert 'c' * 64 not in ResultCache(tmp_path, disk=False)
+    assert 'misses' not in cache.stats and 'disk_hits' not in cache.stats
@@ -0,0 +1,45 @@
+import json
+import asyncio
+
+import pytest
+
+pytest.importorskip('playwright')
+from run_axe_pool import run_jobs
+
+pytestmark = pytest.mark.usefixtures('chromium')
+
+# stands in for axe.min.js: reports the scope it ran on, and fails the strict
+# <body>-scoped run on pages titled "strict-fails"
+FAKE_AXE = """
+window.axe = { run: async (context, options) => {
+  const scope = context.include[0][0];
+  if (scope === 'body' && document.title === 'strict-fails') throw new Error('boom');
+  return { violations: [{ id: 'fake', scope }], passes: [] };
+} };
+"""
+
+def job(tmp_path, name, title, out_dir=None):
+    html = tmp_path / f'{name}.html'
+    html.write_text(f'<html><head><title>{title}</title></head><body><p>{name}</p></body></html>')
+    out_dir = out_dir or tmp_path
+    return {'pageId': name, 'vpIndex': 0, 'htmlUrl': html.as_uri(),
+            'outFile': str(out_dir / f'{name}-axe.json')}
+
+def run(jobs, tmp_path):
+    log = tmp_path / 'failures.txt'
+    progress = asyncio.run(run_jobs(jobs, concurrency=2, axe_source=FAKE_AXE,
+                                    failure_log=str(log), progress_every=100))
+    return progress, log.read_text()
+
+def test_strict_then_relaxed(tmp_path):
+    jobs = [job(tmp_path, 'a', 'fine'), job(tmp_path, 'b', 'strict-fails')]
+    progress, log = run(jobs, tmp_path)
+    assert (progress.ok, progress.fallback, progress.failed) == (1, 1, 0)
+    assert log == ''
+    scopes = [json.load(open(j['outFile']))['violations'][0]['scope'] for j in jobs]
+    assert scopes == ['body', 'html']
+
+def test_write_error_is_not_retried(tmp_path):
+    progress, log = run([job(tmp_path, 'c', 'fine', out_dir=tmp_path / 'missing')], tmp_path)
+    assert progress.failed == 1
+    assert 'write: ' in log and 'relaxed: ' not in log
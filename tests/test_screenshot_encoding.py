@@ -0,0 +1,18 @@
+import pytest
+
+pytest.importorskip('PIL')
+import screenshot_encoding
+from screenshot_encoding import encode_pool, shutdown_pool
+
+def test_pool_follows_worker_count():
+    try:
+        one = encode_pool(1)
+        assert encode_pool(1) is one
+        two = encode_pool(2)
+        assert two is not one and two.submit(abs, -3).result() == 3
+        with pytest.raises(RuntimeError):
+            one.submit(abs, -1)             # the old pool was shut down
+        shutdown_pool()
+        assert screenshot_encoding._pool is None
+    finally:
+        shutdown_pool()
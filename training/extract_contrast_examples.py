@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Stream ContrastAgent training pairs straight from the phase 1 store.
+
+Produces the same input/output strings as `extract_contrast_violations_from_folder`
+in contrast_agent.ipynb, but reads only the contrast columns of the sharded store
+instead of loading every merged page JSON.
+
+Usage:
+  python training/extract_contrast_examples.py <intermediate-dir> <out.jsonl>
+"""
+import os
+import sys
+import json
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+from intermediate_store import iter_rows
+
+COLUMNS = ["role", "fg", "bg", "contrast"]
+
+def make_example(row):
+    role = row.get("role") or "unknown"
+    fg_str = ",".join(map(str, row.get("fg") or [0, 0, 0]))
+    bg_str = ",".join(map(str, row.get("bg") or [255, 255, 255]))
+    contrast_val = row.get("contrast", 1.0)
+
+    input_str = f"role: {role}, fg: {fg_str}, bg: {bg_str}, contrast: {contrast_val:.2f}"
+    output_str = (f"The {role} element has a foreground color of RGB({fg_str}) and background "
+                  f"color of RGB({bg_str}) resulting in a contrast ratio of {contrast_val:.2f}.")
+    if contrast_val < 4.5:
+        output_str += " This is below the WCAG recommended minimum of 4.5:1 for normal text."
+    return {"input": input_str, "output": output_str}
+
+def main(store_dir, out_path):
+    n = 0
+    with open(out_path, "w", encoding="utf-8") as out:
+        for row in iter_rows(store_dir, "contrast", columns=COLUMNS):
+            out.write(json.dumps(make_example(row)) + "\n")
+            n += 1
+    print(f"✅ Wrote {n} contrast examples → {out_path}")
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python training/extract_contrast_examples.py <intermediate-dir> <out.jsonl>")
+        sys.exit(1)
+    main(sys.argv[1], sys.argv[2])
@@ -1,43 +1,110 @@
 # app.py
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import RootModel, BaseModel
+from pydantic import RootModel, BaseModel, Field
 from pathlib import Path
-import json, uuid, datetime, uvicorn
-from typing import Optional, Dict, Any
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+from functools import partial
+from collections import Counter
+import os, json, uuid, time, asyncio, datetime, uvicorn
+from typing import Optional, Dict, Any, List
 
+import pipeline
+from pipeline import STAGES, run_agent, build_result, page_json
+from batching import MicroBatcher
+from feedback_db import FeedbackStore
+from result_cache import ResultCache, result_key
+from jobs import JobQueue, QueueFull
+from incremental import IncrementalStore, diff, encode_output, decode_output
+from metrics import StageMetrics, metric, render
+from agents.tracing import span, set_tracer, model_name
+import job_worker
 
-def run_semantic(page: dict):
-    return [{"node": "#h3-12",
-             "issue_type": "heading-order",
-             "detail": "H3 appears before H2."}]
+AGENT_WORKERS   = int(os.getenv("AGENT_WORKERS", "2"))        # concurrent inference calls
+TORCH_THREADS   = os.getenv("TORCH_THREADS")                  # intra-op threads per call
+BATCH_WINDOW_MS = float(os.getenv("BATCH_WINDOW_MS", "5"))    # 0 disables micro-batching
+MAX_BATCH       = int(os.getenv("MAX_BATCH", "16"))
+RESULT_CACHE_DIR   = os.getenv("RESULT_CACHE_DIR", "result_cache")   # "" keeps it in memory only
+RESULT_CACHE_ITEMS = int(os.getenv("RESULT_CACHE_ITEMS", "256"))     # 0 disables the cache
+JOBS_DB       = os.getenv("JOBS_DB", "jobs.db")
+# each job worker is a process that loads every enabled agent itself, i.e. one
+# more full copy of the model weights next to the server's; off by default, run
+# them here or as separate `python job_worker.py` processes when /jobs is used
+# (without any, POST /jobs answers 503 rather than queueing work nobody runs)
+JOB_WORKERS   = int(os.getenv("JOB_WORKERS", "0"))
+JOB_QUEUE_MAX = int(os.getenv("JOB_QUEUE_MAX", "10000")) # queued jobs before /jobs answers 429
+INCREMENTAL_DB = os.getenv("INCREMENTAL_DB", "incremental.db")
 
-def run_contrast(page: dict):
-    return [{"node": "#cta-btn",
-             "issue_type": "color-contrast",
-             "detail": "4.1:1 contrast"}]
-
-def run_caption(page: dict):
-    return [{"node": "img[alt='']",
-             "issue_type": "image-alt-missing",
-             "detail": "Missing alt"}]
-
-def run_fixer(detectors: dict):
-    fixes = []
-    for d in detectors["contrast"]:
-        fixes.append({**d,
-                      "fix": "Darken text to #374151 for 7.2 : 1 contrast"})
-    for d in detectors["caption"]:
-        fixes.append({**d,
-                      "fix": "Add alt='Company logo: stylised dragon'"})
-    return fixes
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # every model is loaded here, before the first request is accepted
+    if TORCH_THREADS:
+        import torch
+        torch.set_num_threads(int(TORCH_THREADS))
+    # agent / pipeline spans → /metrics histograms
+    app.state.metrics = StageMetrics()
+    previous_tracer = set_tracer(app.state.metrics)
+    loop = asyncio.get_running_loop()
+    names = pipeline.enabled_agents()
+    with ThreadPoolExecutor(max_workers=len(names) or 1) as loader:
+        async def load(name):
+            t0 = time.perf_counter()
+            agent = await loop.run_in_executor(loader, pipeline.load_agent, name)
+            return name, agent, (time.perf_counter() - t0) * 1000
+        loaded = await asyncio.gather(*(load(n) for n in names))
+    app.state.agents  = {name: agent for name, agent, _ in loaded}
+    app.state.load_ms = {name: ms for name, _, ms in loaded}
+    # part of every result-cache key: a new model revision never hits old results
+    app.state.versions = {name: pipeline.agent_version(name, agent)
+                          for name, agent in app.state.agents.items()}
+    app.state.cache = (ResultCache(RESULT_CACHE_DIR or None, max_items=RESULT_CACHE_ITEMS,
+                                   disk=bool(RESULT_CACHE_DIR))
+                       if RESULT_CACHE_ITEMS > 0 else None)
+    app.state.inflight = {}             # key -> Future, identical concurrent requests share a run
+    app.state.incremental = IncrementalStore(INCREMENTAL_DB)
+    app.state.reuse = Counter()         # (agent, reused | generated) -> model inputs, /reanalyze
+    app.state.executor = ThreadPoolExecutor(max_workers=AGENT_WORKERS,
+                                            thread_name_prefix="agent")
+    # one batcher per model: prompts / crops from concurrent requests share a generate
+    app.state.batchers = {}
+    if BATCH_WINDOW_MS > 0:
+        for name, agent in app.state.agents.items():
+            if name in STAGES:
+                batcher = MicroBatcher(name, partial(STAGES[name][1], agent),
+                                       executor=app.state.executor, max_batch=MAX_BATCH,
+                                       window_ms=BATCH_WINDOW_MS)
+                batcher.start()
+                app.state.batchers[name] = batcher
+    # bulk analysis: a persistent queue and worker processes holding their own models
+    app.state.jobs = JobQueue(JOBS_DB, max_queued=JOB_QUEUE_MAX)
+    ctx = multiprocessing.get_context("spawn")
+    app.state.job_workers = [ctx.Process(target=job_worker.run, args=(JOBS_DB,), daemon=True)
+                             for _ in range(JOB_WORKERS)]
+    for proc in app.state.job_workers:
+        proc.start()
+    try:
+        yield
+    finally:
+        for proc in app.state.job_workers:
+            proc.terminate()                # SIGTERM: finish the batch in hand, requeue the rest
+        for proc in app.state.job_workers:
+            await asyncio.to_thread(proc.join, 60)
+            if proc.is_alive():
+                proc.kill()
+        for batcher in app.state.batchers.values():
+            await batcher.stop()
+        app.state.executor.shutdown(wait=False, cancel_futures=True)
+        set_tracer(previous_tracer)
 
-app = FastAPI(title="Accessibility Agent API")
+app = FastAPI(title="Accessibility Agent API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],         
-    allow_methods=["POST"],
+    allow_methods=["POST", "GET"],
     allow_headers=["*"],
 )
 
@@ -46,43 +113,391 @@ class PageSnapshot(RootModel):
 
 class Feedback(BaseModel):
     page_id: str
+    agent: Optional[str] = None
     suggestion: Dict[str, Any]
     action: str             
     comment: Optional[str] = None
 
+@app.get("/health")
+def health():
+    return {"agents": list(app.state.agents), "load_ms": app.state.load_ms,
+            "workers": AGENT_WORKERS, "job_workers": job_workers(),
+            "batching": {name: b.snapshot() for name, b in app.state.batchers.items()}}
+
+async def detect(name: str, page: dict, raw: str):
+    """One agent on `page` → (name, findings, ms, error); ms is None if it didn't run."""
+    agent = app.state.agents.get(name)
+    if agent is None:               # disabled through AGENTS
+        return name, [], None, None
+    loop = asyncio.get_running_loop()
+    t0 = time.perf_counter()
+    model = model_name(agent.model) if hasattr(agent, "model") else ""
+    try:
+        # whole agent for one request, queueing for the executor / batcher included
+        with span("detect", agent=name, model=model):
+            batcher = app.state.batchers.get(name)
+            if name not in STAGES:
+                # no model (axe): don't queue behind inference on the bounded executor
+                findings, _ = await asyncio.to_thread(run_agent, name, agent, page, raw)
+            elif batcher is None:
+                findings, _ = await loop.run_in_executor(
+                    app.state.executor, run_agent, name, agent, page, raw)
+            else:
+                prepare, _, finish = STAGES[name]
+                items = await loop.run_in_executor(app.state.executor, prepare, agent, page, raw)
+                outputs = await batcher.submit(items)
+                # finish hashes every caption crop's pixels: not on the event loop
+                findings = await loop.run_in_executor(app.state.executor, finish,
+                                                      agent, page, items, outputs)
+    except Exception as e:
+        return name, [], None, f"{type(e).__name__}: {e}"
+    return name, findings, (time.perf_counter() - t0) * 1000, None
+
+def collect(results):
+    detectors = {name: [] for name in pipeline.AGENTS}
+    detectors.update({name: findings for name, findings, _, _ in results})
+    timings   = {name: ms for name, _, ms, _ in results if ms is not None}
+    errors    = {name: err for name, _, _, err in results if err}
+    return detectors, timings, errors
+
+async def run_detectors(page: dict):
+    """All enabled agents on `page`, concurrently, on the bounded executor."""
+    raw = page_json(page)
+    return collect(await asyncio.gather(*(detect(n, page, raw) for n in pipeline.AGENTS)))
+
+def assemble(page: dict, detectors: dict, timings: dict, errors: dict, t0: float) -> dict:
+    return build_result(page, detectors, timings, errors, (time.perf_counter() - t0) * 1000)
+
+async def run_analysis(page: dict) -> dict:
+    t0 = time.perf_counter()
+    detectors, timings, errors = await run_detectors(page)
+    if not timings:
+        raise HTTPException(status_code=500, detail=errors)
+    return assemble(page, detectors, timings, errors, t0)
+
+def cache_key(page: dict) -> str:
+    inputs = pipeline.screenshot_inputs(page) if "caption" in app.state.agents else ()
+    return result_key(page, app.state.versions, inputs)
+
+def etag_matches(header: Optional[str], etag: str, stored: bool = False) -> bool:
+    """
+    If-None-Match against `etag`.  `*` only counts when a result is `stored`
+    under the key: otherwise a client holding nothing would get a bare 304.
+    """
+    if not header:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in header.split(",")]
+    return etag in tags or ("*" in tags and stored)
+
 @app.post("/analyze")
-def analyze(snapshot: PageSnapshot):
+async def analyze(snapshot: PageSnapshot, request: Request):
     page = snapshot.root
+    cache = app.state.cache
+    if cache is None:
+        return await run_analysis(page)
+
+    key  = await asyncio.to_thread(cache_key, page)        # hashing a big page is not free
+    etag = f'"{key}"'
+    if_none_match = request.headers.get("if-none-match")
+    stored = (bool(if_none_match) and "*" in if_none_match
+              and await asyncio.to_thread(cache.__contains__, key))
+    if etag_matches(if_none_match, etag, stored):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    result, state = await asyncio.to_thread(cache.get, key), "hit"
+    if result is None:
+        pending = app.state.inflight.get(key)
+        if pending is not None:
+            result, state = await asyncio.shield(pending), "shared"
+        else:
+            pending = asyncio.get_running_loop().create_future()
+            app.state.inflight[key] = pending
+            state = "miss"
+            try:
+                result = await run_analysis(page)
+                if not result["errors"]:        # failures may be transient: don't pin them
+                    await asyncio.to_thread(cache.put, key, result)
+                pending.set_result(result)
+            except BaseException as e:
+                pending.set_exception(e)
+                pending.exception()             # waiters get it; don't warn if there are none
+                raise
+            finally:
+                app.state.inflight.pop(key, None)
+    headers = {"X-Cache": state}
+    if not result["errors"]:
+        headers["ETag"] = etag
+    return JSONResponse(result, headers=headers)
+
+# ─── streaming /analyze ─────────────────────────────────
+def _frame(event: dict, sse: bool) -> bytes:
+    data = json.dumps(event, ensure_ascii=False)
+    return (f"event: {event['event']}\ndata: {data}\n\n" if sse else data + "\n").encode("utf-8")
+
+def _final(result: dict) -> dict:
+    return {"event": "fixer", "fixer": result["fixer"], "page_id": result["page_id"],
+            "timings_ms": result["timings_ms"], "errors": result["errors"]}
+
+@app.post("/analyze/stream")
+async def analyze_stream(snapshot: PageSnapshot, request: Request):
+    """
+    Same analysis as /analyze, streamed: one `agent` event per enabled agent
+    in the order they finish, then a `fixer` event with the fixes, page_id,
+    timings and errors.  NDJSON, or SSE if the client accepts
+    text/event-stream.
+    """
+    page  = snapshot.root
+    sse   = "text/event-stream" in request.headers.get("accept", "")
+    cache = app.state.cache
+    key   = await asyncio.to_thread(cache_key, page) if cache else None
+    cached = await asyncio.to_thread(cache.get, key) if cache else None
+    names = [n for n in pipeline.AGENTS if n in app.state.agents]
+
+    async def events():
+        if cached is not None:
+            for name in names:
+                yield _frame({"event": "agent", "agent": name, "findings": cached[name],
+                              "ms": cached["timings_ms"].get(name), "error": None}, sse)
+            yield _frame(_final(cached), sse)
+            return
+        t0  = time.perf_counter()
+        raw = page_json(page)
+        tasks = [asyncio.ensure_future(detect(n, page, raw)) for n in names]
+        results = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                name, findings, ms, err = await next_done
+                results.append((name, findings, ms, err))
+                yield _frame({"event": "agent", "agent": name, "findings": findings,
+                              "ms": ms, "error": err}, sse)
+        finally:
+            for task in tasks:          # client went away: stop queued agents
+                task.cancel()
+        result = assemble(page, *collect(results), t0)
+        if cache is not None and names and not result["errors"]:
+            await asyncio.to_thread(cache.put, key, result)
+        yield _frame(_final(result), sse)
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    if cache is not None:
+        headers["X-Cache"] = "hit" if cached is not None else "miss"
+    return StreamingResponse(events(), headers=headers,
+                             media_type="text/event-stream" if sse else "application/x-ndjson")
+
+# ─── incremental re-analysis ────────────────────────────
+async def detect_incremental(name: str, page: dict, raw: str):
+    """detect(), but model inputs seen before (same model version) reuse their output."""
+    agent = app.state.agents.get(name)
+    if agent is None or name not in STAGES:
+        return (*await detect(name, page, raw), None)
+    loop = asyncio.get_running_loop()
+    store, version = app.state.incremental, app.state.versions[name]
+    prepare, generate, finish = STAGES[name]
+    t0 = time.perf_counter()
     try:
-        semantic = run_semantic(page)
-        contrast = run_contrast(page)
-        caption  = run_caption(page)
-        fixer    = run_fixer({
-            "semantic": semantic,
-            "contrast": contrast,
-            "caption" : caption
-        })
-        return {
-            "semantic": semantic,
-            "contrast": contrast,
-            "caption" : caption,
-            "fixer"   : fixer,
-            "page_id" : page.get("page_id", str(uuid.uuid4()))
-        }
+        with span("detect_incremental", agent=name, model=model_name(agent.model)):
+            def lookup():
+                items = prepare(agent, page, raw)
+                fps = [pipeline.item_fingerprint(item) for item in items]
+                return items, fps, store.outputs(version, fps)
+            items, fps, known = await loop.run_in_executor(app.state.executor, lookup)
+            todo = {}                               # fingerprint -> first item with it
+            for item, fp in zip(items, fps):
+                if fp not in known:
+                    todo.setdefault(fp, item)
+            if todo:
+                batcher = app.state.batchers.get(name)
+                fresh = list(todo.values())
+                outs = (await batcher.submit(fresh) if batcher is not None else
+                        await loop.run_in_executor(app.state.executor, generate, agent, fresh))
+                new = {fp: encode_output(name, out) for fp, out in zip(todo, outs)}
+                await asyncio.to_thread(store.store_outputs, version, new.items())
+                known.update(new)
+            def assemble_findings():
+                outputs = [decode_output(name, item, known[fp]) for item, fp in zip(items, fps)]
+                return finish(agent, page, items, outputs)
+            findings = await loop.run_in_executor(app.state.executor, assemble_findings)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        return name, [], None, f"{type(e).__name__}: {e}", None
+    reuse = {"inputs": len(items), "generated": len(todo)}
+    app.state.reuse[name, "generated"] += len(todo)
+    app.state.reuse[name, "reused"] += len(items) - len(todo)
+    return name, findings, (time.perf_counter() - t0) * 1000, None, reuse
+
+@app.post("/reanalyze")
+async def reanalyze(snapshot: PageSnapshot, page_key: Optional[str] = None):
+    """
+    /analyze for a page seen before: only new or changed prompts / crops go
+    through the models, and every finding gets `status` new | unchanged
+    against the page's last run (`page_key`, default its page_id), with
+    `changes[agent].fixed` listing the findings that went away.
+    """
+    page = snapshot.root
+    key = page_key or page.get("page_id")
+    if not key:
+        raise HTTPException(status_code=400, detail="page has no page_id; pass page_key")
+    t0  = time.perf_counter()
+    raw = page_json(page)
+    results = await asyncio.gather(*(detect_incremental(n, page, raw) for n in pipeline.AGENTS))
+    detectors, timings, errors = collect([r[:4] for r in results])
+    if not timings:
+        raise HTTPException(status_code=500, detail=errors)
+
+    store = app.state.incremental
+    previous_at, previous = await asyncio.to_thread(store.previous, key)
+    ran = [n for n in app.state.agents if n not in errors]
+    changes = diff(previous, {n: detectors[n] for n in ran})        # tags findings in place
+    result = assemble(page, detectors, timings, errors, t0)
+    # an agent that failed this time keeps its previous findings for the next diff
+    await asyncio.to_thread(store.save_run, key,
+                            {**(previous or {}), **{n: detectors[n] for n in ran}})
+    return {**result, "page_key": key, "previous_run_at": previous_at, "changes": changes,
+            "reuse": {name: reuse for name, *_, reuse in results if reuse is not None}}
+
+# ─── bulk jobs ──────────────────────────────────────────
+class JobSubmit(BaseModel):
+    page: Optional[Dict[str, Any]] = None
+    pages: Optional[List[Dict[str, Any]]] = None
+    lane: str = "normal"                # high | normal | bulk
+    max_attempts: int = Field(3, ge=1, le=10)
+
+def job_workers() -> dict:
+    """In-process workers alive, and every worker (here or elsewhere) seen within a lease."""
+    return {"in_process": sum(p.is_alive() for p in app.state.job_workers),
+            "seen": app.state.jobs.live_workers()}
+
+@app.post("/jobs", status_code=202)
+def submit_jobs(body: JobSubmit):
+    pages = ([body.page] if body.page is not None else []) + (body.pages or [])
+    if not pages:
+        raise HTTPException(status_code=400, detail="give `page` or `pages`")
+    workers = job_workers()
+    if not workers["in_process"] and not workers["seen"]:
+        # nothing would ever run them: JOB_WORKERS defaults to 0
+        raise HTTPException(status_code=503, headers={"Retry-After": "30"},
+                            detail="no job workers: set JOB_WORKERS or run job_worker.py")
+    try:
+        ids = app.state.jobs.submit(pages, body.lane, body.max_attempts)
+    except QueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "30"})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"ids": ids, **({"id": ids[0]} if body.page is not None and not body.pages else {})}
+
+@app.get("/jobs")
+def jobs_overview():
+    return {**app.state.jobs.counts(),
+            "workers": [{"pid": p.pid, "alive": p.is_alive()} for p in app.state.job_workers],
+            "seen_workers": app.state.jobs.live_workers()}
+
+@app.get("/jobs/{job_id}")
+def job_status(job_id: str):
+    status = app.state.jobs.status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="unknown job")
+    return status
 
-FEEDBACK_STORE = Path("feedback_store.json")
-FEEDBACK_STORE.write_text("[]") if not FEEDBACK_STORE.exists() else None
+@app.get("/jobs/{job_id}/result")
+def job_result(job_id: str):
+    status = job_status(job_id)
+    if status["state"] == "done":
+        return app.state.jobs.result(job_id)
+    if status["state"] == "failed":
+        raise HTTPException(status_code=500, detail=status)
+    return JSONResponse(status, status_code=202)
+
+@app.get("/cache/stats")
+def cache_stats():
+    cache = app.state.cache
+    return {"enabled": cache is not None, "versions": app.state.versions,
+            **(cache.snapshot() if cache else {})}
+
+@app.post("/cache/invalidate")
+def cache_invalidate(key: Optional[str] = None):
+    """Drop one result (`key` = ETag without quotes) or, without `key`, all of them."""
+    if app.state.cache is None:
+        return {"removed": 0}
+    try:
+        return {"removed": app.state.cache.invalidate(key.strip('"') if key else None)}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/metrics")
+def metrics():
+    """Prometheus text format: stage histograms, queue depths, cache hit rates."""
+    batchers = {(name,): b for name, b in app.state.batchers.items()}
+    batch = lambda key, scale=1: {k: b.stats[key] * scale for k, b in batchers.items()}
+    jobs = app.state.jobs.counts()
+    families = [
+        app.state.metrics.stages.render(),
+        metric("a11y_agent_load_seconds", "gauge", "Model load time at startup.", ("agent",),
+               {(name,): ms / 1000 for name, ms in app.state.load_ms.items()}),
+        metric("a11y_executor_queue_depth", "gauge", "Inference calls waiting for an executor thread.",
+               (), {(): app.state.executor._work_queue.qsize()}),
+        metric("a11y_inflight_analyses", "gauge", "Distinct /analyze runs in progress.",
+               (), {(): len(app.state.inflight)}),
+        metric("a11y_batch_queue_depth", "gauge", "Items waiting for the next batch.", ("agent",),
+               {k: b.queue.qsize() for k, b in batchers.items()}),
+        metric("a11y_batch_max_queue_depth", "gauge", "Largest batch queue seen.", ("agent",),
+               batch("max_queue_depth")),
+        metric("a11y_batch_items_total", "counter", "Items generated through the batcher.", ("agent",),
+               batch("items")),
+        metric("a11y_batches_total", "counter", "Batched generate calls.", ("agent",), batch("batches")),
+        metric("a11y_batch_errors_total", "counter", "Failed batched generate calls.", ("agent",),
+               batch("errors")),
+        metric("a11y_batch_queue_wait_seconds_total", "counter", "Summed item wait before generate.",
+               ("agent",), batch("queue_wait_ms", 1 / 1000)),
+        metric("a11y_batch_generate_seconds_total", "counter", "Summed batched generate time.",
+               ("agent",), batch("generate_ms", 1 / 1000)),
+        metric("a11y_reanalyze_inputs_total", "counter",
+               "Model inputs on /reanalyze, reused from earlier runs or generated.", ("agent", "result"),
+               dict(app.state.reuse)),
+        metric("a11y_jobs", "gauge", "Jobs per lane and state.", ("lane", "state"),
+               {(lane, state): n for lane, states in jobs["lanes"].items() for state, n in states.items()}),
+        metric("a11y_jobs_queued_limit", "gauge", "Queued jobs before /jobs answers 429.",
+               (), {(): jobs["max_queued"]}),
+        metric("a11y_job_workers_alive", "gauge", "Live job worker processes.",
+               (), {(): sum(p.is_alive() for p in app.state.job_workers)}),
+    ]
+    cache = app.state.cache
+    if cache is not None:
+        stats = dict(cache.stats)           # not snapshot(): that walks the disk tier
+        hits = stats.get("memory_hits", 0) + stats.get("disk_hits", 0)
+        lookups = hits + stats.get("misses", 0)
+        families += [
+            metric("a11y_result_cache_lookups_total", "counter", "Result cache lookups by outcome.",
+                   ("result",), {("memory_hit",): stats.get("memory_hits", 0),
+                                 ("disk_hit",): stats.get("disk_hits", 0),
+                                 ("miss",): stats.get("misses", 0)}),
+            metric("a11y_result_cache_hit_ratio", "gauge", "Hits / lookups since startup.",
+                   (), {(): hits / lookups if lookups else 0.0}),
+            metric("a11y_result_cache_memory_items", "gauge", "Results held in memory.",
+                   (), {(): len(cache)}),
+            metric("a11y_result_cache_evictions_total", "counter", "Memory-tier evictions.",
+                   (), {(): stats.get("evictions", 0)}),
+        ]
+    return Response(render(*families), media_type="text/plain; version=0.0.4")
+
+FEEDBACK_STORE = Path("feedback_store.json")                 # legacy, imported once
+FEEDBACK_DB    = Path(os.getenv("FEEDBACK_DB", "feedback.db"))
+_new_db  = not FEEDBACK_DB.exists()
+feedback = FeedbackStore(FEEDBACK_DB)
+if _new_db and FEEDBACK_STORE.exists():
+    feedback.import_json(FEEDBACK_STORE)
 
 @app.post("/feedback")
 def save_feedback(fb: Feedback):
+    # sync handler → runs on the threadpool; one INSERT, WAL serialises writers
     row = fb.dict()
+    row["id"] = str(uuid.uuid4())
     row["timestamp"] = datetime.datetime.utcnow().isoformat()
-    data = json.loads(FEEDBACK_STORE.read_text())
-    data.append(row)
-    FEEDBACK_STORE.write_text(json.dumps(data, indent=2))
-    return {"status": "ok"}
+    feedback.append(row)
+    return {"status": "ok", "id": row["id"]}
+
+@app.get("/feedback/stats")
+def feedback_stats(page_id: Optional[str] = None, agent: Optional[str] = None):
+    # counters are kept up to date by the store on every write; no row scan here
+    return feedback.stats(page_id, agent)
 
 if __name__ == "__main__":
     uvicorn.run(
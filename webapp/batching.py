@@ -0,0 +1,124 @@
+# batching.py
+"""
+Cross-request micro-batching for model inference.
+
+Requests submit individual prompts (or image crops); a MicroBatcher per
+model collects whatever arrives within `window_ms` of the first item, up to
+`max_batch`, runs one batched generate for all of them on the executor and
+hands each caller back its own results.  While a batch is running the next
+one keeps filling, so under load batches grow on their own and the window
+only matters when traffic is light.
+"""
+import time
+import asyncio
+from collections import Counter
+
+class MicroBatcher:
+    def __init__(self, name: str, fn, *, executor, max_batch: int = 16,
+                 window_ms: float = 5.0, max_inflight: int = 1):
+        """`fn(items) -> results` is blocking and must return one result per item."""
+        self.name = name
+        self.fn = fn
+        self.executor = executor
+        self.max_batch = max_batch
+        self.window = window_ms / 1000
+        self.queue = asyncio.Queue()
+        self._inflight = asyncio.Semaphore(max_inflight)
+        self._task = None
+        self.stats = {"items": 0, "batches": 0, "errors": 0, "max_queue_depth": 0,
+                      "queue_wait_ms": 0.0, "generate_ms": 0.0}
+        self.batch_sizes = Counter()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, items: list) -> list:
+        """Queue `items` and wait for their results, in order."""
+        if not items:
+            return []
+        loop = asyncio.get_running_loop()
+        now = time.perf_counter()
+        futures = []
+        for item in items:
+            fut = loop.create_future()
+            self.queue.put_nowait((item, fut, now))
+            futures.append(fut)
+        self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], self.queue.qsize())
+        return list(await asyncio.gather(*futures))
+
+    async def _collect(self):
+        batch = [await self.queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.window
+        while len(batch) < self.max_batch:
+            if not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _loop(self):
+        while True:
+            await self._inflight.acquire()
+            try:
+                batch = await self._collect()
+            except BaseException:
+                self._inflight.release()
+                raise
+            asyncio.get_running_loop().create_task(self._run(batch))
+
+    async def _run(self, batch):
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            # callers that gave up (client disconnects) don't need a slot
+            live = [(item, fut) for item, fut, _ in batch if not fut.done()]
+            self.stats["queue_wait_ms"] += sum((started - t) * 1000
+                                               for _, fut, t in batch if not fut.done())
+            if not live:
+                return
+            try:
+                results = await loop.run_in_executor(self.executor, self.fn, [i for i, _ in live])
+                if len(results) != len(live):
+                    raise RuntimeError(f"{self.name}: {len(results)} results for {len(live)} items")
+            except Exception as e:
+                self.stats["errors"] += 1
+                for _, fut in live:
+                    if not fut.done():
+                        fut.set_exception(e)
+                return
+            for (_, fut), res in zip(live, results):
+                if not fut.done():
+                    fut.set_result(res)
+            self.stats["items"] += len(live)
+            self.stats["batches"] += 1
+            self.batch_sizes[len(live)] += 1
+        finally:
+            self.stats["generate_ms"] += (time.perf_counter() - started) * 1000
+            self._inflight.release()
+
+    def snapshot(self) -> dict:
+        s = dict(self.stats)
+        s["queue_depth"] = self.queue.qsize()
+        s["mean_batch_size"] = s["items"] / s["batches"] if s["batches"] else 0.0
+        s["mean_queue_wait_ms"] = s["queue_wait_ms"] / s["items"] if s["items"] else 0.0
+        s["batch_sizes"] = dict(sorted(self.batch_sizes.items()))
+        s["max_batch"] = self.max_batch
+        s["window_ms"] = self.window * 1000
+        return s
@@ -0,0 +1,260 @@
+# feedback_db.py
+"""
+Feedback storage for /feedback: SQLite in WAL mode.
+
+Each vote is one INSERT (O(1), no rewrite of earlier rows).  WAL lets
+readers run alongside the single writer, and busy_timeout makes concurrent
+writers queue instead of failing, so no vote is lost.  Connections are per
+thread, as FastAPI runs sync handlers on a thread pool; writers in one
+process take a lock first so they queue on it rather than in SQLite's
+sleeping busy handler.
+
+Up/down counters per page, per agent and per suggestion live in
+`feedback_counts` and are bumped by a trigger in the same transaction as
+the INSERT, so `stats()` is a primary-key lookup however many votes exist.
+'*' in a key column means "all".
+
+Import the old JSON store (idempotent, rows keep their ids):
+  python feedback_db.py import feedback_store.json [--db feedback.db]
+"""
+import sys
+import json
+import uuid
+import hashlib
+import sqlite3
+import argparse
+import datetime
+import threading
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feedback (
+    seq        INTEGER PRIMARY KEY AUTOINCREMENT,
+    id         TEXT UNIQUE NOT NULL,
+    timestamp  TEXT NOT NULL,
+    page_id    TEXT NOT NULL,
+    agent      TEXT,
+    suggestion TEXT NOT NULL,
+    action     TEXT NOT NULL,
+    comment    TEXT,
+    suggestion_key TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS feedback_page  ON feedback(page_id);
+CREATE INDEX IF NOT EXISTS feedback_agent ON feedback(agent);
+CREATE INDEX IF NOT EXISTS feedback_page_agent ON feedback(page_id, agent);
+"""
+COUNTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feedback_counts (
+    page_id        TEXT NOT NULL,
+    agent          TEXT NOT NULL,
+    suggestion_key TEXT NOT NULL,
+    suggestion     TEXT,
+    up    INTEGER NOT NULL DEFAULT 0,
+    down  INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (page_id, agent, suggestion_key)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS feedback_count AFTER INSERT ON feedback BEGIN
+    INSERT INTO feedback_counts (page_id, agent, suggestion_key, suggestion, up, down, total)
+    SELECT p, a, k, CASE WHEN k = '*' THEN NULL ELSE NEW.suggestion END,
+           NEW.action = 'up', NEW.action = 'down', 1
+    FROM (SELECT '*' AS p, '*' AS a, '*' AS k
+          UNION ALL SELECT '*', COALESCE(NEW.agent, ''), '*'
+          UNION ALL SELECT NEW.page_id, '*', '*'
+          UNION ALL SELECT NEW.page_id, COALESCE(NEW.agent, ''), '*'
+          UNION ALL SELECT NEW.page_id, COALESCE(NEW.agent, ''), NEW.suggestion_key)
+    WHERE true
+    ON CONFLICT (page_id, agent, suggestion_key) DO UPDATE SET
+        up = up + excluded.up, down = down + excluded.down, total = total + 1;
+END;
+"""
+COLUMNS = ("id", "timestamp", "page_id", "agent", "suggestion", "action", "comment", "suggestion_key")
+INSERT  = f"INTO feedback ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+ALL     = "*"
+
+def suggestion_key(suggestion: dict) -> str:
+    """The suggestion's own `id` if it has one, else a hash of its content."""
+    if suggestion.get("id") is not None:
+        return str(suggestion["id"])
+    canon = json.dumps(suggestion, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(canon.encode("utf-8")).hexdigest()[:16]
+
+def _counts(row) -> dict:
+    return {"up": row[0], "down": row[1], "total": row[2]}
+
+class FeedbackStore:
+    def __init__(self, path, busy_timeout_ms: int = 30000):
+        self.path = str(path)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        conn = self._conn()
+        with self._write_lock:
+            conn.executescript(SCHEMA)
+            cols = {r[1] for r in conn.execute("PRAGMA table_info(feedback)")}
+            if "suggestion_key" not in cols:          # store created before the counters
+                conn.execute("ALTER TABLE feedback ADD COLUMN suggestion_key TEXT NOT NULL DEFAULT ''")
+            fresh = not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'feedback_counts'").fetchone()
+            conn.executescript(COUNTS_SCHEMA)
+        if fresh and self.count():
+            self.rebuild_counts()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")     # durable at checkpoints, safe with WAL
+            conn.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms}")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _row(row: dict) -> tuple:
+        row = dict(row)
+        row.setdefault("id", str(uuid.uuid4()))
+        row.setdefault("timestamp", datetime.datetime.utcnow().isoformat())
+        suggestion = row.get("suggestion") or {}
+        row["suggestion_key"] = suggestion_key(suggestion)
+        row["suggestion"] = json.dumps(suggestion, ensure_ascii=False, sort_keys=True)
+        return tuple(row.get(c) for c in COLUMNS)
+
+    def append(self, row: dict) -> str:
+        """Insert one feedback row; returns its id."""
+        values = self._row(row)
+        conn = self._conn()
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("INSERT " + INSERT, values)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return values[0]
+
+    def extend(self, rows) -> int:
+        """Insert many rows in one transaction, skipping ids already stored."""
+        values = [self._row(r) for r in rows]
+        conn = self._conn()
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cur = conn.executemany("INSERT OR IGNORE " + INSERT, values)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return cur.rowcount
+
+    def count(self, page_id: str | None = None, agent: str | None = None) -> int:
+        sql, args = "SELECT COUNT(*) FROM feedback WHERE 1=1", []
+        if page_id is not None:
+            sql += " AND page_id = ?"
+            args.append(page_id)
+        if agent is not None:
+            sql += " AND agent = ?"
+            args.append(agent)
+        return self._conn().execute(sql, args).fetchone()[0]
+
+    def rows(self, page_id: str | None = None, agent: str | None = None, limit: int | None = None):
+        sql, args = f"SELECT {', '.join(COLUMNS)} FROM feedback WHERE 1=1", []
+        if page_id is not None:
+            sql += " AND page_id = ?"
+            args.append(page_id)
+        if agent is not None:
+            sql += " AND agent = ?"
+            args.append(agent)
+        sql += " ORDER BY seq"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        for values in self._conn().execute(sql, args):
+            row = dict(zip(COLUMNS, values))
+            row["suggestion"] = json.loads(row["suggestion"])
+            yield row
+
+    def stats(self, page_id: str | None = None, agent: str | None = None) -> dict:
+        """
+        Up/down counters, read straight from feedback_counts.  Without
+        `page_id`: totals and per-agent counts over all pages.  With it: the
+        page's totals, per-agent counts and per-suggestion counts (limited to
+        `agent` if given).
+        """
+        conn = self._conn()
+        page = page_id if page_id is not None else ALL
+        total = conn.execute("SELECT up, down, total FROM feedback_counts "
+                             "WHERE page_id = ? AND agent = ? AND suggestion_key = ?",
+                             (page, agent if agent is not None else ALL, ALL)).fetchone()
+        out = {"page_id": page_id, "agent": agent,
+               **_counts(total or (0, 0, 0)),
+               "agents": {a: _counts(r) for a, *r in conn.execute(
+                   "SELECT agent, up, down, total FROM feedback_counts "
+                   "WHERE page_id = ? AND agent != ? AND suggestion_key = ? ORDER BY agent",
+                   (page, ALL, ALL))}}
+        if page_id is not None:
+            sql = ("SELECT agent, suggestion_key, suggestion, up, down, total FROM feedback_counts "
+                   "WHERE page_id = ? AND agent != ? AND suggestion_key != ?")
+            args = [page_id, ALL, ALL]
+            if agent is not None:
+                sql += " AND agent = ?"
+                args.append(agent)
+            out["suggestions"] = [{"agent": a, "key": k, "suggestion": json.loads(sugg), **_counts(r)}
+                                  for a, k, sugg, *r in conn.execute(sql + " ORDER BY agent, suggestion_key", args)]
+        return out
+
+    def rebuild_counts(self):
+        """Recompute feedback_counts from the feedback rows (after a migration or repair)."""
+        conn = self._conn()
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute("SELECT seq, suggestion FROM feedback WHERE suggestion_key = ''").fetchall()
+                conn.executemany("UPDATE feedback SET suggestion_key = ? WHERE seq = ?",
+                                 ((suggestion_key(json.loads(sugg)), seq) for seq, sugg in rows))
+                conn.execute("DELETE FROM feedback_counts")
+                for page_expr, agent_expr in (("'*'", "'*'"), ("page_id", "'*'"),
+                                              ("'*'", "COALESCE(agent, '')"),
+                                              ("page_id", "COALESCE(agent, '')")):
+                    conn.execute(
+                        f"INSERT INTO feedback_counts (page_id, agent, suggestion_key, up, down, total) "
+                        f"SELECT {page_expr}, {agent_expr}, '*', SUM(action = 'up'), SUM(action = 'down'), "
+                        f"COUNT(*) FROM feedback GROUP BY 1, 2")
+                conn.execute(
+                    "INSERT INTO feedback_counts (page_id, agent, suggestion_key, suggestion, up, down, total) "
+                    "SELECT page_id, COALESCE(agent, ''), suggestion_key, MIN(suggestion), "
+                    "SUM(action = 'up'), SUM(action = 'down'), COUNT(*) FROM feedback GROUP BY 1, 2, 3")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def import_json(self, path) -> int:
+        """Load a legacy feedback_store.json; rows without an id get a stable one."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        for row in data:
+            if "ts" in row:                 # some early rows used `ts`
+                row.setdefault("timestamp", row.pop("ts"))
+            if "id" not in row:
+                key = json.dumps(row, sort_keys=True, ensure_ascii=False)
+                row["id"] = str(uuid.uuid5(uuid.NAMESPACE_URL, key))
+        return self.extend(data)
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Feedback store maintenance")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    imp = sub.add_parser("import", help="import a legacy feedback_store.json")
+    imp.add_argument("json_path")
+    imp.add_argument("--db", default="feedback.db")
+    args = ap.parse_args()
+
+    store = FeedbackStore(args.db)
+    added = store.import_json(args.json_path)
+    print(f"✅ {added} rows imported → {args.db} ({store.count()} total)")
+    sys.exit(0)
@@ -0,0 +1,119 @@
+# incremental.py
+"""
+Incremental re-analysis.
+
+Two tables in one SQLite file:
+
+  outputs  (agent version, input fingerprint) → model output.  A prompt or
+           caption crop seen before, under the same model revision, is not
+           generated again.
+  runs     page key → the findings of its last analysis, for the
+           new / fixed / unchanged diff of the next one.
+
+Input fingerprints are pipeline.item_fingerprint (prompt text, crop
+pixels); finding fingerprints are the `fingerprint` field the pipeline puts
+on every finding (axe rule + node targets/html, the contrast tuple, crop
+hash + alt, the semantic prompt).
+"""
+import json
+import time
+import sqlite3
+import threading
+from collections import Counter
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outputs (
+    version     TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    output      TEXT NOT NULL,
+    PRIMARY KEY (version, fingerprint)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS runs (
+    page_key   TEXT PRIMARY KEY,
+    analysed_at REAL NOT NULL,
+    findings   TEXT NOT NULL
+);
+"""
+
+# what is memoised per item: captions keep only the caption, the node/alt
+# come from the current page
+def encode_output(name: str, output):
+    return output[2] if name == "caption" else output
+
+def decode_output(name: str, item, value):
+    return (item["nodeId"], item["alt"], value) if name == "caption" else value
+
+class IncrementalStore:
+    def __init__(self, path, busy_timeout_ms: int = 30000):
+        self.path = str(path)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._conn().executescript(SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms}")
+            self._local.conn = conn
+        return conn
+
+    # ─── model outputs ──────────────────────────────────
+    def outputs(self, version: str, fingerprints: list) -> dict:
+        found = {}
+        unique = list(dict.fromkeys(fingerprints))
+        for k in range(0, len(unique), 500):            # stay under SQLite's variable limit
+            chunk = unique[k:k + 500]
+            found.update((fp, json.loads(out)) for fp, out in self._conn().execute(
+                f"SELECT fingerprint, output FROM outputs WHERE version = ? AND fingerprint IN "
+                f"({', '.join('?' * len(chunk))})", [version, *chunk]))
+        return found
+
+    def store_outputs(self, version: str, pairs):
+        rows = [(version, fp, json.dumps(out, ensure_ascii=False)) for fp, out in pairs]
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("INSERT OR REPLACE INTO outputs VALUES (?, ?, ?)", rows)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    # ─── runs ───────────────────────────────────────────
+    def previous(self, page_key: str):
+        row = self._conn().execute("SELECT analysed_at, findings FROM runs WHERE page_key = ?",
+                                   (page_key,)).fetchone()
+        return (row[0], json.loads(row[1])) if row else (None, None)
+
+    def save_run(self, page_key: str, detectors: dict):
+        self._conn().execute("INSERT OR REPLACE INTO runs VALUES (?, ?, ?)",
+                             (page_key, time.time(), json.dumps(detectors, ensure_ascii=False)))
+
+def diff(previous: dict | None, current: dict) -> dict:
+    """
+    Tag each current finding with `status` new / unchanged (in place) and
+    return per-agent counts plus the findings that disappeared (`fixed`).
+    Fingerprints are compared as multisets: two identical contrast pairs
+    count twice.
+    """
+    changes = {}
+    for name, findings in current.items():
+        before = Counter(f.get("fingerprint") for f in (previous or {}).get(name, []))
+        seen = Counter()
+        for f in findings:
+            seen[f["fingerprint"]] += 1
+            f["status"] = "unchanged" if seen[f["fingerprint"]] <= before[f["fingerprint"]] else "new"
+        gone = before - seen
+        fixed = []
+        for f in (previous or {}).get(name, []):
+            if gone[f.get("fingerprint")] > 0:
+                gone[f.get("fingerprint")] -= 1
+                fixed.append({k: v for k, v in f.items() if k != "status"})
+        changes[name] = {"new": sum(f["status"] == "new" for f in findings),
+                         "unchanged": sum(f["status"] == "unchanged" for f in findings),
+                         "fixed": fixed}
+    return changes
@@ -0,0 +1,84 @@
+# job_worker.py
+"""
+Worker process for the /jobs queue.
+
+Loads the enabled agents once, then claims up to `batch` jobs at a time and
+runs them through pipeline.run_batch, so one generate call covers the
+prompts / crops of the whole batch, renewing the batch's lease as it goes
+(between pages and generate chunks).  A job whose agents all failed is
+retried (jobs.JobQueue.fail); one with partial errors completes, like
+/analyze.  On SIGTERM / SIGINT it finishes the current batch and exits;
+anything it still holds goes back to the queue.
+
+app.py starts JOB_WORKERS of these (0 by default: each holds its own copy of
+the models); more can run on their own against the same database:
+  python job_worker.py [--db jobs.db] [--batch 8]
+"""
+import os
+import time
+import signal
+import socket
+import argparse
+
+import pipeline
+from jobs import JobQueue
+
+JOBS_DB    = os.getenv("JOBS_DB", "jobs.db")
+JOB_BATCH  = int(os.getenv("JOB_BATCH", "8"))
+JOB_POLL_S = float(os.getenv("JOB_POLL_S", "0.5"))
+MAX_BATCH  = int(os.getenv("MAX_BATCH", "16"))
+
+def run(db: str = JOBS_DB, batch: int = JOB_BATCH, poll_s: float = JOB_POLL_S, ready=None):
+    stopping = False
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    if os.getenv("TORCH_THREADS"):
+        import torch
+        torch.set_num_threads(int(os.getenv("TORCH_THREADS")))
+    agents = {name: pipeline.load_agent(name) for name in pipeline.enabled_agents()}
+    queue = JobQueue(db)
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    print(f"✅ job worker {worker}: {', '.join(agents)} loaded, batch {batch}", flush=True)
+    if ready is not None:
+        ready.set()
+
+    try:
+        while not stopping:
+            jobs = queue.claim(worker, batch)
+            if not jobs:
+                time.sleep(poll_s)
+                continue
+            ids, renewed = [job_id for job_id, _ in jobs], time.monotonic()
+            def heartbeat():
+                # a slow batch must not outlive its lease and run twice
+                nonlocal renewed
+                if time.monotonic() - renewed >= queue.lease_s / 4:
+                    queue.renew(worker, ids)
+                    renewed = time.monotonic()
+            try:
+                results = pipeline.run_batch(agents, [page for _, page in jobs],
+                                             max_batch=MAX_BATCH, heartbeat=heartbeat)
+            except Exception as e:
+                for job_id, _ in jobs:
+                    queue.fail(job_id, worker, f"{type(e).__name__}: {e}")
+                continue
+            for (job_id, _), result in zip(jobs, results):
+                if agents and len(result["errors"]) == len(agents):
+                    queue.fail(job_id, worker, "; ".join(f"{k}: {v}" for k, v in result["errors"].items()))
+                else:
+                    queue.complete(job_id, worker, result)
+    finally:
+        released = queue.release(worker)
+        print(f"🛑 job worker {worker} stopped ({released} jobs requeued)", flush=True)
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Run /jobs from the queue")
+    ap.add_argument("--db", default=JOBS_DB)
+    ap.add_argument("--batch", type=int, default=JOB_BATCH, help="jobs claimed per round")
+    ap.add_argument("--poll", type=float, default=JOB_POLL_S, help="idle poll interval (s)")
+    args = ap.parse_args()
+    run(args.db, args.batch, args.poll)
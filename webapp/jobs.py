@@ -0,0 +1,193 @@
+# jobs.py
+"""
+Persistent job queue for bulk analysis (SQLite, WAL).
+
+state: queued → running → done | failed.  Jobs are claimed in batches,
+highest-priority lane first, then oldest.  A claim is a lease that the
+worker renews while it runs the batch: a job whose worker died is handed
+out again once `lease_s` passes without a renewal.  Failed attempts go
+back to the queue with exponential backoff until `max_attempts`.
+
+Every timestamp is epoch seconds; queue_ms / run_ms are derived from them.
+"""
+import json
+import time
+import uuid
+import sqlite3
+import threading
+
+LANES = {"high": 0, "normal": 1, "bulk": 2}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    seq          INTEGER PRIMARY KEY AUTOINCREMENT,
+    id           TEXT UNIQUE NOT NULL,
+    priority     INTEGER NOT NULL,
+    state        TEXT NOT NULL DEFAULT 'queued',
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    page         TEXT NOT NULL,
+    result       TEXT,
+    error        TEXT,
+    worker       TEXT,
+    submitted_at REAL NOT NULL,
+    not_before   REAL NOT NULL,
+    started_at   REAL,
+    finished_at  REAL,
+    lease_until  REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_queued ON jobs(state, priority, seq);
+CREATE TABLE IF NOT EXISTS workers (
+    name      TEXT PRIMARY KEY,
+    last_seen REAL NOT NULL
+);
+"""
+
+class QueueFull(Exception):
+    pass
+
+class JobQueue:
+    def __init__(self, path, *, max_queued: int = 10000, lease_s: float = 600,
+                 backoff_s: float = 5, busy_timeout_ms: int = 30000):
+        self.path = str(path)
+        self.max_queued = max_queued
+        self.lease_s = lease_s
+        self.backoff_s = backoff_s
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._conn().executescript(SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms}")
+            self._local.conn = conn
+        return conn
+
+    def _write(self, fn):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            out = fn(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return out
+
+    def submit(self, pages: list, lane: str = "normal", max_attempts: int = 3) -> list:
+        """Queue pages, all or nothing; raises QueueFull past `max_queued` waiting jobs."""
+        if lane not in LANES:
+            raise ValueError(f"unknown lane {lane!r}, expected one of {list(LANES)}")
+        now = time.time()
+        rows = [(str(uuid.uuid4()), LANES[lane], max_attempts,
+                 json.dumps(p, ensure_ascii=False, separators=(",", ":")), now, now) for p in pages]
+
+        def insert(conn):
+            queued = conn.execute("SELECT COUNT(*) FROM jobs WHERE state = 'queued'").fetchone()[0]
+            if queued + len(rows) > self.max_queued:
+                raise QueueFull(f"{queued} jobs queued, limit {self.max_queued}")
+            conn.executemany("INSERT INTO jobs (id, priority, max_attempts, page, submitted_at, "
+                             "not_before) VALUES (?, ?, ?, ?, ?, ?)", rows)
+        self._write(insert)
+        return [r[0] for r in rows]
+
+    def claim(self, worker: str, n: int = 1) -> list:
+        """Lease up to `n` runnable jobs → [(id, page)]."""
+        now = time.time()
+
+        def take(conn):
+            # a dead worker's lease runs out: requeue, or fail it on the last attempt
+            conn.execute("UPDATE jobs SET worker = NULL, error = 'lease expired (worker lost)', "
+                         "state = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END "
+                         "WHERE state = 'running' AND lease_until < ?", (now,))
+            conn.execute("INSERT OR REPLACE INTO workers (name, last_seen) VALUES (?, ?)", (worker, now))
+            rows = conn.execute("SELECT id, page FROM jobs WHERE state = 'queued' AND not_before <= ? "
+                                "ORDER BY priority, seq LIMIT ?", (now, n)).fetchall()
+            conn.executemany("UPDATE jobs SET state = 'running', attempts = attempts + 1, worker = ?, "
+                             "started_at = ?, lease_until = ? WHERE id = ?",
+                             [(worker, now, now + self.lease_s, job_id) for job_id, _ in rows])
+            return rows
+        return [(job_id, json.loads(page)) for job_id, page in self._write(take)]
+
+    def renew(self, worker: str, ids: list) -> int:
+        """Extend the lease on `worker`'s running jobs among `ids`; returns how many it still holds."""
+        if not ids:
+            return 0
+        now, marks = time.time(), ",".join("?" * len(ids))
+
+        def extend(conn):
+            conn.execute("INSERT OR REPLACE INTO workers (name, last_seen) VALUES (?, ?)", (worker, now))
+            return conn.execute(f"UPDATE jobs SET lease_until = ? WHERE state = 'running' AND worker = ? "
+                                f"AND id IN ({marks})", (now + self.lease_s, worker, *ids)).rowcount
+        return self._write(extend)
+
+    # complete / fail only apply while `worker` still holds the lease: once it
+    # expired the job may be queued again or running elsewhere, and a late
+    # update must not overwrite that.  Both return whether the update applied.
+    def complete(self, job_id: str, worker: str, result: dict) -> bool:
+        return self._write(lambda conn: conn.execute(
+            "UPDATE jobs SET state = 'done', result = ?, error = NULL, finished_at = ?, "
+            "lease_until = NULL WHERE id = ? AND state = 'running' AND worker = ?",
+            (json.dumps(result, ensure_ascii=False), time.time(), job_id, worker)).rowcount) > 0
+
+    def fail(self, job_id: str, worker: str, error: str) -> bool:
+        """Requeue with backoff, or mark failed after the last attempt."""
+        now = time.time()
+        return self._write(lambda conn: conn.execute(
+            "UPDATE jobs SET error = ?, lease_until = NULL, finished_at = ?, "
+            "state = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END, "
+            "not_before = ? + ? * (1 << (attempts - 1)) "
+            "WHERE id = ? AND state = 'running' AND worker = ?",
+            (error, now, now, self.backoff_s, job_id, worker)).rowcount) > 0
+
+    def release(self, worker: str) -> int:
+        """Requeue a stopping worker's jobs without counting the attempt."""
+        def give_back(conn):
+            conn.execute("DELETE FROM workers WHERE name = ?", (worker,))
+            return conn.execute(
+                "UPDATE jobs SET state = 'queued', attempts = attempts - 1, worker = NULL, "
+                "lease_until = NULL WHERE state = 'running' AND worker = ?", (worker,)).rowcount
+        return self._write(give_back)
+
+    def live_workers(self) -> list:
+        """Workers that claimed or renewed within the last lease and haven't stopped."""
+        return [name for (name,) in self._conn().execute(
+            "SELECT name FROM workers WHERE last_seen >= ? ORDER BY name",
+            (time.time() - self.lease_s,))]
+
+    def status(self, job_id: str) -> dict | None:
+        row = self._conn().execute(
+            "SELECT id, priority, state, attempts, max_attempts, error, worker, submitted_at, "
+            "started_at, finished_at FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        (job_id, priority, state, attempts, max_attempts, error, worker,
+         submitted, started, finished) = row
+        lane = next(k for k, v in LANES.items() if v == priority)
+        out = {"id": job_id, "lane": lane, "state": state, "attempts": attempts,
+               "max_attempts": max_attempts, "error": error, "worker": worker,
+               "submitted_at": submitted, "started_at": started, "finished_at": finished}
+        if started is not None:
+            out["queue_ms"] = (started - submitted) * 1000
+        if state == "done" and finished is not None:
+            out["run_ms"] = (finished - started) * 1000
+        return out
+
+    def result(self, job_id: str):
+        row = self._conn().execute("SELECT result FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def counts(self) -> dict:
+        """{lane: {state: n}} plus the queued total against the limit."""
+        out = {lane: {} for lane in LANES}
+        names = {v: k for k, v in LANES.items()}
+        for priority, state, n in self._conn().execute(
+                "SELECT priority, state, COUNT(*) FROM jobs GROUP BY priority, state"):
+            out[names[priority]][state] = n
+        queued = sum(lane.get("queued", 0) for lane in out.values())
+        return {"lanes": out, "queued": queued, "max_queued": self.max_queued}
@@ -0,0 +1,79 @@
+# metrics.py
+"""
+Prometheus text exposition for /metrics, without the client library.
+
+StageMetrics is an agents.tracing tracer: every span an agent or the
+pipeline opens becomes an observation in a histogram labelled by stage,
+agent and model.  Everything else on /metrics (queue depths, cache hit
+rates, batch sizes) is read from the live objects at scrape time, see
+app.py.  Spans in the job worker processes are not included; the queue
+they drain is.
+"""
+import time
+import threading
+from contextlib import contextmanager
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names, values, extra=()) -> str:
+    pairs = [*zip(names, values), *extra]
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}" if pairs else ""
+
+def _number(v) -> str:
+    return repr(float(v)) if v != float("inf") else "+Inf"
+
+class Histogram:
+    def __init__(self, name: str, help: str, labelnames: tuple, buckets=BUCKETS):
+        self.name, self.help, self.labelnames = name, help, labelnames
+        self.buckets = tuple(buckets)
+        self._series = {}           # label values -> [bucket counts…, sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels):
+        with self._lock:
+            series = self._series.setdefault(labels, [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = {k: list(v) for k, v in self._series.items()}
+        for values, s in sorted(series.items()):
+            for bound, n in zip(self.buckets, s):
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, values, [('le', _number(bound))])} {n}")
+            lines.append(f"{self.name}_bucket{_labels(self.labelnames, values, [('le', '+Inf')])} {s[-1]}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, values)} {_number(s[-2])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, values)} {s[-1]}")
+        return lines
+
+def metric(name: str, kind: str, help: str, labelnames: tuple, samples: dict) -> list:
+    """A gauge / counter family from {label values: value}."""
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+    for values, v in sorted(samples.items()):
+        if v is not None:
+            lines.append(f"{name}{_labels(labelnames, values)} {_number(v)}")
+    return lines
+
+class StageMetrics:
+    """Tracer feeding `a11y_stage_seconds{stage, agent, model}`."""
+    def __init__(self):
+        self.stages = Histogram("a11y_stage_seconds", "Time spent per agent stage.",
+                                ("stage", "agent", "model"))
+
+    @contextmanager
+    def span(self, name: str, agent: str = "", model: str = "", **attrs):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.observe(time.perf_counter() - t0, name, agent or "", model or "")
+
+def render(*families) -> str:
+    return "\n".join(line for family in families for line in family) + "\n"
@@ -0,0 +1,331 @@
+# pipeline.py
+"""
+Detection agents behind the API: loading them once, and turning their output
+into the finding lists `/analyze` returns ({node, issue_type, detail, …}).
+
+Everything here is blocking (tokenizer + generate) and is meant to be
+called off the event loop with an already loaded agent.
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import hashlib
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+from agents.axe_stream import read_violations
+from agents.tracing import span
+
+SEMANTIC_MODEL = os.getenv("SEMANTIC_MODEL", "trusha88/t5-semantic-agent")
+CONTRAST_MODEL = os.getenv("CONTRAST_MODEL", "virajns2/contrast-violation-t5")
+CAPTION_MODEL  = os.getenv("CAPTION_MODEL", "Salesforce/blip-image-captioning-base")
+PAGE_ROOT      = os.getenv("PAGE_ROOT")     # screenshots are only read from under here
+AGENTS         = ("semantic", "contrast", "caption", "axe")
+WCAG_AA        = 4.5
+PIPELINE_VERSION = "2"      # bump when the finding / fixer output changes shape
+
+def load_agent(name: str):
+    # imported here so an API serving only `axe` never pulls in torch
+    if name == "semantic":
+        from agents.semantic_agent.agent import SemanticAgent
+        return SemanticAgent(model_dir=SEMANTIC_MODEL)
+    if name == "contrast":
+        from agents.contrast_agent.agent import ContrastAgent
+        return ContrastAgent(model_dir=CONTRAST_MODEL)
+    if name == "caption":
+        from agents.image_captioning_agent.agent import ImageCaptioningAgent
+        # prepare_caption hands it resolved paths (screenshot_path), no root needed
+        return ImageCaptioningAgent(model_id=CAPTION_MODEL)
+    if name == "axe":
+        from agents.axe_violations_agent.agent import AxeViolationsAgent
+        return AxeViolationsAgent()
+    raise ValueError(f"unknown agent {name!r}, expected one of {AGENTS}")
+
+def agent_version(name: str, agent) -> str:
+    """Model id + revision (hub commit, or size/mtime of a local checkpoint)."""
+    model = getattr(agent, "model", None)
+    if model is None:                        # axe: no model, output depends on code only
+        return f"{name}:{PIPELINE_VERSION}"
+    config = model.config
+    path = getattr(config, "name_or_path", "") or type(model).__name__
+    rev = getattr(config, "_commit_hash", None)
+    if rev is None and Path(path).is_dir():
+        rev = ",".join(f"{f.name}:{f.stat().st_size}:{f.stat().st_mtime_ns}"
+                       for f in sorted(Path(path).iterdir()) if f.is_file())
+    return f"{name}:{PIPELINE_VERSION}:{path}@{rev}"
+
+class ScreenshotPathError(Exception):
+    """A page names a screenshot outside PAGE_ROOT.  Not a ValueError, which
+    prepare_caption reads as "nothing to caption"."""
+
+def screenshot_path(path: str) -> Path:
+    """
+    `path` from a client's page, resolved under PAGE_ROOT.  Absolute paths,
+    `..` escapes (symlinks included) and, with PAGE_ROOT unset, every path
+    are refused: the server must not stat or decode files a client names.
+    """
+    if not PAGE_ROOT:
+        raise ScreenshotPathError("screenshots are disabled (PAGE_ROOT is not set)")
+    if Path(path).is_absolute():
+        raise ScreenshotPathError(f"absolute screenshot path {path!r}; give it relative to PAGE_ROOT")
+    root = Path(PAGE_ROOT).resolve()
+    p = (root / path).resolve()
+    if not p.is_relative_to(root):
+        raise ScreenshotPathError(f"screenshot path {path!r} is outside PAGE_ROOT")
+    return p
+
+def screenshot_inputs(page: dict) -> list:
+    """Screenshots a page refers to, as (path, size, mtime_ns); the captioner reads them."""
+    out = []
+    for vp in page.get("viewports", []):
+        path = vp.get("screenshot")
+        if not path:
+            continue
+        try:
+            st = screenshot_path(path).stat()
+            out.append((path, st.st_size, st.st_mtime_ns))
+        except (ScreenshotPathError, OSError):
+            out.append((path, None, None))
+    return out
+
+def enabled_agents() -> list:
+    names = [n.strip() for n in os.getenv("AGENTS", ",".join(AGENTS)).split(",") if n.strip()]
+    for n in names:
+        if n not in AGENTS:
+            raise ValueError(f"unknown agent {n!r} in AGENTS, expected one of {AGENTS}")
+    return names
+
+# ─── contrast maths (fixer) ─────────────────────────────
+def _luminance(rgb):
+    def lin(c):
+        v = c / 255
+        return v / 12.92 if v <= 0.03928 else ((v + 0.055) / 1.055) ** 2.4
+    r, g, b = rgb
+    return 0.2126 * lin(r) + 0.7152 * lin(g) + 0.0722 * lin(b)
+
+def contrast_ratio(fg, bg) -> float:
+    l1, l2 = _luminance(fg), _luminance(bg)
+    return (max(l1, l2) + 0.05) / (min(l1, l2) + 0.05)
+
+def fix_contrast(fg, bg, target: float = WCAG_AA):
+    """Closest colour to `fg` (moved towards black or white) reaching `target` on `bg`."""
+    best = None
+    for pole in ((0, 0, 0), (255, 255, 255)):
+        if contrast_ratio(pole, bg) < target:
+            continue
+        lo, hi = 0.0, 1.0
+        for _ in range(20):
+            mid = (lo + hi) / 2
+            cand = [round(f + (p - f) * mid) for f, p in zip(fg, pole)]
+            if contrast_ratio(cand, bg) >= target:
+                hi = mid
+            else:
+                lo = mid
+        cand = [round(f + (p - f) * hi) for f, p in zip(fg, pole)]
+        if best is None or hi < best[0]:
+            best = (hi, cand)
+    return best[1]
+
+# ─── fingerprints ───────────────────────────────────────
+def fingerprint(*parts) -> str:
+    """Short stable hash of JSON-able parts."""
+    canon = json.dumps(parts, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha1(canon.encode("utf-8")).hexdigest()[:16]
+
+def image_fingerprint(image) -> str:
+    h = hashlib.sha1(f"{image.mode}:{image.size}".encode())
+    h.update(image.tobytes())
+    return h.hexdigest()[:16]
+
+def item_fingerprint(item) -> str:
+    """Key of one model input: a prompt, or a caption crop's pixels."""
+    if isinstance(item, dict):
+        return image_fingerprint(item["image"])
+    return fingerprint(item)
+
+# ─── detectors ──────────────────────────────────────────
+def low_contrast(page: dict) -> list:
+    """The contrast entries ContrastAgent.preprocess turns into prompts, same order."""
+    return [c for vp in page.get("viewports", []) for c in vp.get("contrast", [])
+            if c.get("contrast", 1.0) < WCAG_AA]
+
+# Each model-backed detector is split into prepare → generate → finish so
+# the generate step can be batched across requests (see batching.py):
+#   prepare(agent, page, raw) -> items      (prompts / crops, [] if none)
+#   generate(agent, items)    -> outputs    (one per item, any batch size)
+#   finish(agent, page, items, outputs) -> findings
+
+def prepare_semantic(agent, page: dict, raw: str) -> list:
+    try:
+        return [agent.preprocess(raw)]
+    except ValueError:          # no cat.semantics violations
+        return []
+
+def finish_semantic(agent, page, prompts, summaries) -> list:
+    return [{"node": "page", "issue_type": "semantic", "detail": s, "fingerprint": fingerprint(p)}
+            for p, s in zip(prompts, summaries)]
+
+def prepare_contrast(agent, page: dict, raw: str) -> list:
+    try:
+        return agent.preprocess(raw)
+    except ValueError:          # nothing below 4.5:1
+        return []
+
+def finish_contrast(agent, page, prompts, descriptions) -> list:
+    return [{"node": c.get("role", "unknown"),
+             "issue_type": "color-contrast",
+             "detail": desc,
+             "fg": c.get("fg"), "bg": c.get("bg"), "contrast": c.get("contrast"),
+             "fingerprint": fingerprint(c.get("role"), c.get("fg"), c.get("bg"), c.get("contrast"))}
+            for c, desc in zip(low_contrast(page), descriptions)]
+
+def prepare_caption(agent, page: dict, raw: str) -> list:
+    # the captioner only reads these two fields; it gets them with the
+    # screenshot confined to PAGE_ROOT instead of the client's raw path
+    viewports = [{"screenshot": str(screenshot_path(vp["screenshot"])),
+                  "image_captioning": vp.get("image_captioning", [])}
+                 for vp in page.get("viewports", []) if vp.get("screenshot")]
+    try:
+        return agent.preprocess(page_json({"viewports": viewports}))
+    except ValueError:          # no usable bboxes
+        return []
+
+def finish_caption(agent, page, crops, triples) -> list:
+    return [{"node": node_id,
+             "issue_type": "image-alt" if alt else "image-alt-missing",
+             "detail": caption,
+             "alt": alt,
+             "fingerprint": fingerprint(image_fingerprint(crop["image"]), alt)}
+            for crop, (node_id, alt, caption) in zip(crops, triples)]
+
+def run_axe(agent, page: dict, raw: str) -> list:
+    with span("axe_extract", agent="axe"):
+        found = read_violations(raw)
+    findings = []
+    for viol in (found[0]["violations"] if found else []):
+        targets = [" ".join(n.get("target", [])) for n in viol.get("nodes", [])]
+        findings.append({"node": ", ".join(targets[:3]) + (" …" if len(targets) > 3 else ""),
+                         "issue_type": viol.get("id"),
+                         "impact": viol.get("impact"),
+                         "detail": agent.summarize([viol]),
+                         "help_url": viol.get("helpUrl"),
+                         "fingerprint": fingerprint(viol.get("id"), sorted(
+                             (n.get("target", []), n.get("html", "")) for n in viol.get("nodes", [])))})
+    return findings
+
+STAGES = {
+    "semantic": (prepare_semantic, lambda agent, items: agent.generate_summaries(items), finish_semantic),
+    "contrast": (prepare_contrast, lambda agent, items: agent.generate_descriptions(items), finish_contrast),
+    "caption":  (prepare_caption,  lambda agent, items: agent.generate_summary(items),   finish_caption),
+}
+
+def run_fixer(detectors: dict) -> list:
+    fixes = []
+    for d in detectors.get("semantic", []):
+        fixes.append({**d, "fix": d["detail"]})
+    for d in detectors.get("contrast", []):
+        if d.get("fg") and d.get("bg"):
+            new = fix_contrast(d["fg"], d["bg"])
+            fixes.append({**d, "fix": f"Change text colour to #{new[0]:02x}{new[1]:02x}{new[2]:02x} "
+                                      f"for {contrast_ratio(new, d['bg']):.1f} : 1 contrast"})
+    for d in detectors.get("caption", []):
+        if d["issue_type"] == "image-alt-missing":
+            fixes.append({**d, "fix": f"Add alt='{d['detail']}'"})
+    for d in detectors.get("axe", []):
+        if d.get("help_url"):
+            fixes.append({**d, "fix": f"See {d['help_url']}"})
+    return fixes
+
+def run_agent(name: str, agent, page: dict, raw: str):
+    """Blocking, unbatched; returns (findings, elapsed_ms)."""
+    t0 = time.perf_counter()
+    if name == "axe":
+        findings = run_axe(agent, page, raw)
+    else:
+        prepare, generate, finish = STAGES[name]
+        items = prepare(agent, page, raw)
+        findings = finish(agent, page, items, generate(agent, items) if items else [])
+    return findings, (time.perf_counter() - t0) * 1000
+
+def page_json(page: dict) -> str:
+    return json.dumps(page, ensure_ascii=False)
+
+def build_result(page: dict, detectors: dict, timings: dict, errors: dict, total_ms: float) -> dict:
+    """The /analyze response body."""
+    return {
+        **detectors,
+        "fixer"   : run_fixer(detectors),
+        "page_id" : page.get("page_id", str(uuid.uuid4())),
+        "timings_ms": {**timings, "total": total_ms},
+        "errors"  : errors,
+    }
+
+def run_batch(agents: dict, pages: list, max_batch: int = 16, heartbeat=None) -> list:
+    """
+    Blocking: every agent over several pages, one result per page in the
+    /analyze shape.  Model items (prompts / crops) from all pages are pooled
+    and generated `max_batch` at a time; a page's timing for a model agent
+    is the pooled run, not its share of it.  An error in one page's
+    prepare/finish only affects that page.  `heartbeat()`, if given, is
+    called between pages and generate chunks (job_worker renews its lease).
+    """
+    t0 = time.perf_counter()
+    beat = heartbeat or (lambda: None)
+    raws = [page_json(p) for p in pages]
+    detectors = [{name: [] for name in AGENTS} for _ in pages]
+    timings   = [{} for _ in pages]
+    errors    = [{} for _ in pages]
+
+    def error(e):
+        return f"{type(e).__name__}: {e}"
+
+    for name, agent in agents.items():
+        if name not in STAGES:
+            for i, (page, raw) in enumerate(zip(pages, raws)):
+                try:
+                    detectors[i][name], timings[i][name] = run_agent(name, agent, page, raw)
+                except Exception as e:
+                    errors[i][name] = error(e)
+                beat()
+            continue
+
+        prepare, generate, finish = STAGES[name]
+        started = time.perf_counter()
+        items = []
+        for i, (page, raw) in enumerate(zip(pages, raws)):
+            try:
+                items.append(prepare(agent, page, raw))
+            except Exception as e:
+                items.append(None)
+                errors[i][name] = error(e)
+            beat()
+        flat = [item for page_items in items if page_items for item in page_items]
+        try:
+            outputs = []
+            for k in range(0, len(flat), max_batch):
+                outputs += generate(agent, flat[k:k + max_batch])
+                beat()
+        except Exception as e:
+            for i, page_items in enumerate(items):
+                if page_items is not None:
+                    errors[i][name] = error(e)
+            continue
+        ms = (time.perf_counter() - started) * 1000
+        pos = 0
+        for i, page_items in enumerate(items):
+            if page_items is None:
+                continue
+            page_out = outputs[pos:pos + len(page_items)]
+            pos += len(page_items)
+            try:
+                detectors[i][name] = finish(agent, pages[i], page_items, page_out)
+                timings[i][name] = ms
+            except Exception as e:
+                errors[i][name] = error(e)
+
+    total = (time.perf_counter() - t0) * 1000
+    return [build_result(page, d, t, e, total)
+            for page, d, t, e in zip(pages, detectors, timings, errors)]
@@ -0,0 +1,122 @@
+# result_cache.py
+"""
+Content-addressed cache for /analyze results.
+
+The key is sha256 over the canonical page JSON (sorted keys, compact), the
+version of every enabled agent's model and the screenshots the page refers
+to, so a new model revision or a re-captured screenshot is a miss without
+anyone flushing anything.  The key doubles as the response ETag.
+
+Two tiers: an in-memory LRU of decoded results in front of one JSON file
+per key on disk (`<root>/<key[:2]>/<key>.json`), which survives restarts.
+"""
+import re
+import json
+import hashlib
+import threading
+from pathlib import Path
+from collections import OrderedDict, Counter
+
+def canonical(obj) -> bytes:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def result_key(page: dict, versions: dict, inputs=()) -> str:
+    h = hashlib.sha256()
+    for part in (versions, list(inputs), page):
+        h.update(canonical(part))
+        h.update(b"\0")
+    return h.hexdigest()
+
+class ResultCache:
+    def __init__(self, root, max_items: int = 256, disk: bool = True):
+        self.root = Path(root) if disk else None
+        self.max_items = max_items
+        self._mem = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = Counter()
+        if self.root is not None:
+            self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._mem[key] = value
+            self._mem.move_to_end(key)
+            while len(self._mem) > self.max_items:
+                self._mem.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def __len__(self) -> int:
+        """Entries in the memory tier."""
+        return len(self._mem)
+
+    def __contains__(self, key: str) -> bool:
+        """Whether `key` is stored, without reading it or counting a lookup."""
+        with self._lock:
+            if key in self._mem:
+                return True
+        return self.root is not None and self._path(key).exists()
+
+    def get(self, key: str):
+        """Cached result or None.  Blocking on a memory miss (disk read)."""
+        with self._lock:
+            if key in self._mem:
+                self._mem.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return self._mem[key]
+        if self.root is not None:
+            try:
+                value = json.loads(self._path(key).read_bytes())
+            except (FileNotFoundError, ValueError):
+                pass
+            else:
+                self.stats["disk_hits"] += 1
+                self._remember(key, value)
+                return value
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key: str, value: dict):
+        self._remember(key, value)
+        if self.root is not None:
+            path = self._path(key)
+            path.parent.mkdir(exist_ok=True)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_bytes(canonical(value))
+            tmp.replace(path)                      # readers never see a partial file
+        self.stats["stores"] += 1
+
+    def invalidate(self, key: str | None = None) -> int:
+        """Drop one key, or everything when `key` is None; returns entries removed."""
+        if key is not None and not re.fullmatch(r"[0-9a-f]{64}", key):
+            raise ValueError(f"not a result key: {key!r}")
+        with self._lock:
+            keys = set(self._mem) if key is None else ({key} & set(self._mem))
+            if key is None:
+                self._mem.clear()
+            else:
+                self._mem.pop(key, None)
+        if self.root is not None:
+            paths = list(self.root.glob("*/*.json")) if key is None else [self._path(key)]
+            for path in paths:
+                try:
+                    path.unlink()
+                    keys.add(path.stem)
+                except FileNotFoundError:
+                    pass
+        self.stats["invalidations"] += 1
+        return len(keys)
+
+    def snapshot(self) -> dict:
+        s = dict(self.stats)
+        hits = s.get("memory_hits", 0) + s.get("disk_hits", 0)
+        lookups = hits + s.get("misses", 0)
+        s["hit_rate"] = hits / lookups if lookups else 0.0
+        with self._lock:
+            s["memory_items"] = len(self._mem)
+        s["max_items"] = self.max_items
+        if self.root is not None:
+            s["disk_items"] = sum(1 for _ in self.root.glob("*/*.json"))
+        return s
@@ -0,0 +1,472 @@
+# site_responses.py
+"""
+Recorded agent conversations per site, shown by accessibility_eval_app.py.
+
+Kept out of the Streamlit script so the literal is built once per process
+rather than on every rerun.
+"""
+
+SITE_JSON_MAP = {
+    "Google": [
+    {
+        "content": "On page https://www.google.com/ (viewport 1920-1080) we detected the following semantic violations: Violation 1 \u2014 **heading-order** (impact: moderate) \u2022 Description: Ensures the order of headings is semantically correct. \u2022 Recommendation: Heading levels should only increase by one. See https://dequeuniversity.com/rules/axe/3.5/heading-order?application=axe-puppeteer \u2022 Detail: Element \"\"\"/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3",
+        "name": "semantic-agent",
+        "role": "user"
+    },
+    {
+        "content": "The span element has a foreground color of RGB(154,160,166) and background color of RGB(255,255,255) resulting in a contrast ratio of 2.64. This is below the WCAG recommended minimum of 4.5:1 for normal text.",
+        "name": "contrast-agent",
+        "role": "user"
+    },
+    {
+        "content": "- aria-allowed-role (impact: minor)\n    Categories: cat.aria\n    Description: Ensure role attribute has an appropriate value for the element\n    Help: ARIA role should be appropriate for the element\n    FailureSummary: Fix any of the following:; ARIA role combobox is not allowed for given element\n- landmark-one-main (impact: moderate)\n    Categories: cat.semantics\n    Description: Ensure the document has a main landmark\n    Help: Document should have one main landmark\n    FailureSummary: Fix all of the following:; Document does not have a main landmark\n- page-has-heading-one (impact: moderate)\n    Categories: cat.semantics\n    Description: Ensure that the page, or at least one of its frames contains a level-one heading\n    Help: Page should contain a level-one heading\n    FailureSummary: Fix all of the following:; Page must have a level-one heading",
+        "name": "axe-violations-agent",
+        "role": "user"
+    },
+    {
+        "content": "For nodeId img-9, the alt text is missing and the generated caption is 'a green leaf with a white background'. For nodeId svg-0, the alt text is missing and the generated caption is 'a white background with black circles'. For nodeId svg-1, the alt text is missing and the generated caption is 'google logo'. For nodeId svg-3, the alt text is missing and the generated caption is 'a black and white photo of a magni'. For nodeId svg-5, the alt text is missing and the generated caption is 'a microphone icon'. For nodeId svg-6, the alt text is missing and the generated caption is 'the logo for the new line of products'.",
+        "name": "image-captioning-agent",
+        "role": "user"
+    },
+    {
+        "content": "The page has several accessibility issues that need to be addressed:\n\n1. Semantic Violations: The page has a violation in the heading order. The heading levels should increase by one, but this is not the case on the page. This can make it difficult for screen reader users to understand the structure of the content.\n\n2. Contrast Issues: The contrast ratio of the span element is 2.64, which is below the WCAG recommended minimum of 4.5:1 for normal text. This can make the text difficult to read for users with visual impairments.\n\n3. ARIA Role Violations: The page has an inappropriate ARIA role attribute value. The ARIA role 'combobox' is not allowed for the given element. This can cause confusion for screen reader users.\n\n4. Missing Main Landmark: The document does not have a main landmark. This can make it difficult for screen reader users to navigate the page.\n\n5. Missing Level-One Heading: The page does not contain a level-one heading. This can make it difficult for screen reader users to understand the main topic of the page.\n\n6. Missing Alt Text: Several images on the page are missing alt text. This can make it difficult for screen reader users to understand the content of the images. The generated captions provide some context, but alt text should be added to describe the images more accurately.",
+        "name": "VisuallyImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The page structure presents several keyboard navigation barriers:\n\n1. Semantic Violations: The incorrect order of headings can confuse keyboard-only users who rely on headings for navigation. Users might not be able to predict the hierarchy of the content, making it difficult to navigate.\n\n2. Contrast Issues: The low contrast ratio of the span element can make it difficult for users to see where they have placed their focus, especially if they have visual impairments. This can hinder keyboard navigation.\n\n3. ARIA Role Violations: The inappropriate ARIA role 'combobox' can confuse assistive technologies, making it difficult for keyboard-only users to interact with the element.\n\n4. Missing Main Landmark: The absence of a main landmark can make it difficult for keyboard-only users to navigate the page. Landmarks provide a way to navigate to different sections of a page and without a main landmark, users might struggle to find the main content.\n\n5. Missing Level-One Heading: Without a level-one heading, keyboard-only users might struggle to understand the main topic of the page or to navigate through the content.\n\n6. Missing Alt Text: The missing alt text on several images can hinder keyboard navigation as users might not be able to understand the function of these images, especially if they are used as links or buttons. The generated captions provide some context, but they might not convey the same information as intended alt text.",
+        "name": "MotorImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "As a color-blind user, the reported contrast ratio of 2.64 for the span element is a significant issue. This ratio is below the WCAG recommended minimum of 4.5:1 for normal text, which means I might have difficulty distinguishing this text against its background. The other semantic issues reported, while important for overall accessibility, do not directly impact my ability to distinguish page elements based on color.",
+        "name": "ColorBlindAgent",
+        "role": "user"
+    },
+    {
+        "content": "\n\n1. Semantic Violations (SemanticAgent):\n   - Issue: Incorrect heading order.\n   - Fix: Ensure heading levels only increase by one. For example, if you have a `<h2>`, the next heading should be `<h3>`, not `<h4>`.\n   ```html\n   <h1>Main Heading</h1>\n   <h2>Subheading</h2>\n   <h3>Sub-subheading</h3>\n   ```\n\n2. Contrast Issues (ContrastAgent):\n   - Issue: Low contrast ratio of the span element.\n   - Fix: Adjust the color of the text or the background to meet the minimum contrast ratio of 4.5:1.\n   ```css\n   span {\n     color: #767676; /* Adjusted color to increase contrast */\n     background-color: #FFFFFF;\n   }\n   ```\n\n3. ARIA Role Violations (AxeViolationsAgent):\n   - Issue: Inappropriate ARIA role 'combobox'.\n   - Fix: Ensure the ARIA role is appropriate for the element.\n   ```html\n   <div role=\"combobox\"> <!-- Ensure this element is appropriate for the 'combobox' role -->\n     <!-- combobox content -->\n   </div>\n   ```\n\n4. Missing Main Landmark (AxeViolationsAgent):\n   - Issue: Document does not have a main landmark.\n   - Fix: Add a main landmark to the document.\n   ```html\n   <main>\n     <!-- main content -->\n   </main>\n   ```\n\n5. Missing Level-One Heading (AxeViolationsAgent):\n   - Issue: Page does not contain a level-one heading.\n   - Fix: Add a level-one heading to the page.\n   ```html\n   <h1>Page Title</h1>\n   ```\n\n6. Missing Alt Text (ImageCaptioningAgent):\n   - Issue: Several images are missing alt text.\n   - Fix: Add alt text to describe the images.\n   ```html\n   <img src=\"leaf.jpg\" alt=\"a green leaf with a white background\">\n   <svg aria-label=\"a white background with black circles\"> <!-- SVG content --></svg>\n   <svg aria-label=\"google logo\"> <!-- SVG content --></svg>\n   <svg aria-label=\"a black and white photo of a magni\"> <!-- SVG content --></svg>\n   <svg aria-label=\"a microphone icon\"> <!-- SVG content --></svg>\n   <svg aria-label=\"the logo for the new line of products\"> <!-- SVG content --></svg>\n   ```",
+        "name": "FixingAgent",
+        "role": "user"
+    }
+],
+    "Microsoft": [
+    {
+        "content": "On page https://www.microsoft.com/en-us/ (viewport 1920-1080) we detected the following semantic violations: Violation 1 \u2014 **heading-order** (impact: moderate) \u2022 Description: Ensures the order of headings is semantically correct. \u2022 Recommendation: Heading levels should only increase by one. See https://dequeuniversity.com/rules/axe/3.5/heading-order?application=axe-puppeteer \u2022 Detail: Element \"\">Surface Pro, Copilot+ PC with a keyboard attached./h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/h3>/",
+        "name": "semantic-agent",
+        "role": "user"
+    },
+    {
+        "content": "The a, fg:255,255,255 bg:255,255 resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The a, fg:255,255,255 bg:255,255 resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The a, fg:255,255,255 bg:255,255 resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The a, fg:255,255,255 bg:255,255 resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The button element has a foreground color of RGB(255,255,255) and background color of RGB(255,255,255) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The button element has a foreground color of RGB(255,255,255) and background color of RGB(255,255,255) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The role has a foreground color of RGB(255,255,255) and background color of RGB(255,255,255) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The p, fg:255,255,255 bg:255,255 resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The role has a foreground color of RGB(255,255,255) and background color of RGB(255,255,255) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text.",
+        "name": "contrast-agent",
+        "role": "user"
+    },
+    {
+        "content": "- landmark-unique (impact: moderate)\n    Categories: cat.semantics\n    Description: Ensure landmarks are unique\n    Help: Landmarks should have a unique role or role/label/title (i.e. accessible name) combination\n    FailureSummary: Fix any of the following:; The landmark must have a unique aria-label, aria-labelledby, or title to make landmarks distinguishable\n- region (impact: moderate)\n    Categories: cat.keyboard\n    Description: Ensure all page content is contained by landmarks\n    Help: All page content should be contained by landmarks\n    FailureSummary: Fix any of the following:; Some page content is not contained by landmarks",
+        "name": "axe-violations-agent",
+        "role": "user"
+    },
+    {
+        "content": "For nodeId img-0, the alt text is missing and the generated caption is 'microsoft logo'. For nodeId img-1, the alt image text is 'Copilot+ PC logo.', and the generated caption is 'the logo of the company'. For nodeId img-2, the alt image text is 'A collection of multiple Surface, Copilot+ PC devices.', and the generated caption is 'apple mac pro 13'. For nodeId img-3, the alt image text is 'Surface Pro, Copilot+ PC with a keyboard attached.', and the generated caption is 'the ipad keyboard with keyboard keyboard'. For nodeId img-4, the alt image text is 'A front facing Surface Laptop, Copilot+ PC.', and the generated caption is 'apple mac mac 13 re re re re re re re re re re re re re re re re re'. For nodeId img-5, the alt image text is 'Mouse and Dock accessories for Surface devices', and the generated caption is 'a purple mouse and a black mouse mouse'. For nodeId img-6, the alt text is missing and the generated caption is 'a laptop computer with a blank screen'. For nodeId img-7, the alt text is missing and the generated caption is 'the logo of the university of north carolina'. For nodeId img-8, the alt text is missing and the generated caption is 'a computer with a clock on it'. For nodeId img-9, the alt text is missing and the generated caption is 'a black and white suitcase'. For nodeId img-10, the alt text is missing and the generated caption is 'a computer monitor icon'. For nodeId img-11, the alt text is missing and the generated caption is 'the logo for the new line of clothing'. For nodeId img-12, the alt image text is 'Microsoft 365 suite of apps such as Teams, Word, Outlook, and more.', and the generated caption is 'a laptop with a bunch of colorful letters on it'. For nodeId img-13, the alt image text is 'Red, white, blue, and black Xbox Wireless Controllers', and the generated caption is 'xbox gamepads are coming in the us'. For nodeId img-14, the alt image text is 'An Xbox Series S console and an Xbox controller', and the generated caption is 'the xbox game console is shown in this image'. For nodeId img-15, the alt image text is 'A variety of games available with Xbox Game Pass.', and the generated caption is 'the game pass logo with a bunch of video games'. For nodeId img-16, the alt image text is 'Three screenshots from the Copilot App', and the generated caption is 'the app for the app store, which features a variety of apps'. For nodeId img-17, the alt image text is 'A Surface Laptop for Business in the color Platinum and Surface Pro for Business with a Surface Pro Flex Keyboard in the color Black.', and the generated caption is 'apple macbook pro 13'. For nodeId img-18, the alt image text is 'A Surface Pro for Business, Copilot+ PC, 12-inch | Snapdragon and a Surface Laptop for Business, Copilot+ PC, 13-inch | Snapdragon in the color Platinum.', and the generated caption is 'apple macbook pro 13'. For nodeId img-19, the alt image text is 'Visual Studio Icon.', and the generated caption is 'the logo for the new xiao phone'. For nodeId img-20, the alt image text is 'A laptop running Windows 11.', and the generated caption is 'a laptop with a blue rose on the screen'. For nodeId img-21, the alt image text is 'collaged illustration of a woman running up an escalator surrounded by stylized charts.', and the generated caption is 'a man is sitting on a blue and yellow graphic'. For nodeId img-22, the alt image text is 'Azeem Azhar.', and the generated caption is 'a man in a suit and glasses smiles while he stands in front of a colorful background'. For nodeId img-23, the alt image text is 'Musician Cuco looks up at an animated version of himself skateboarding down a street in LA.', and the generated caption is 'a man sitting on a red car in front of a palm tree'. For nodeId img-25, the alt image text is 'A blueprint for a fantastical building created with AI.', and the generated caption is 'a man and woman standing next to each other people'. For nodeId img-26, the alt image text is 'Facebook', and the generated caption is 'the facebook logo'. For nodeId img-27, the alt image text is 'X', and the generated caption is 'the x logo'. For nodeId img-28, the alt image text is 'LinkedIn', and the generated caption is 'the logo for the social network'. For nodeId img-30, the alt image text is 'Need Help? Lets Chat', and the generated caption is 'a black background with a white and red flower'. For nodeId img-31, the alt image text is 'Need Help? Lets Chat', and the generated caption is 'a woman with a blue background and a white background with the words, what is the future of the internet'. For nodeId svg-0, the alt text is missing and the generated caption is 'the logo for the vm'.",
+        "name": "image-captioning-agent",
+        "role": "user"
+    },
+    {
+        "content": "The analysis reveals several accessibility issues on the page. \n\nSemanticAgent identified a violation in the heading order. The heading levels should increase by one, but this rule is not followed on the page. This can make the content difficult to understand for users who rely on screen readers.\n\nContrastAgent found multiple contrast issues. The contrast ratio of 1.00 for various elements is below the WCAG recommended minimum of 4.5:1 for normal text. This can make the text hard to read for users with low vision or color vision deficiencies.\n\nAxeViolationsAgent detected two violations. The first one is related to landmarks not being unique. This can make navigation difficult for users who rely on landmarks to understand the page structure. The second violation is that some page content is not contained by landmarks. This can make it difficult for users to understand the page layout and find content.\n\nImageCaptioningAgent found that several images are missing alt text, which is crucial for users who rely on screen readers. The generated captions do not always accurately describe the images, which can lead to confusion. For example, the generated caption for nodeId img-2 is 'apple mac pro 13', but the alt image text is 'A collection of multiple Surface, Copilot+ PC devices.' This discrepancy can make the content inaccessible for users who rely on alt text to understand images.\n\nIn conclusion, the page has several accessibility issues that need to be addressed to make it more accessible for all users.",
+        "name": "VisuallyImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The page structure presents several keyboard navigation barriers:\n\n1. Semantic Violations: The incorrect order of headings can confuse keyboard-only users who rely on headings for navigation. Users might find it difficult to understand the hierarchy and relationship of the content.\n\n2. Contrast Issues: The low contrast ratio of text and button elements can make it difficult for users to identify focus styles, which are crucial for keyboard navigation. Users might struggle to see which element is currently selected or active.\n\n3. Axe Violations: The lack of unique landmarks and some content not being contained by landmarks can hinder keyboard navigation. Landmarks help users understand where they are on the page and navigate to different sections. If landmarks are not unique or some content is not contained by landmarks, users might find it difficult to navigate the page effectively.\n\n4. Missing Alt Text: Keyboard-only users who also use screen readers might find it difficult to understand the content of images due to missing alt text. While the generated captions provide some information, they might not accurately describe the images, leading to confusion.\n\nTo improve keyboard navigation, the page should correct the heading order, increase the contrast ratio for text and button elements, ensure all landmarks are unique and contain all page content, and provide accurate alt text for all images.",
+        "name": "MotorImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The analysis reveals several accessibility issues on the page. \n\nSemanticAgent identified a violation in the heading order. The heading levels should increase by one, but this rule is not followed on the page. This can make the content difficult to understand for users who rely on screen readers.\n\nContrastAgent found multiple contrast issues. The contrast ratio of 1.00 for various elements is below the WCAG recommended minimum of 4.5:1 for normal text. This can make the text hard to read for users with low vision or color vision deficiencies.\n\nAxeViolationsAgent detected two violations. The first one is related to landmarks not being unique. This can make navigation difficult for users who rely on landmarks to understand the page structure. The second violation is that some page content is not contained by landmarks. This can make it difficult for users to understand the page layout and find content.\n\nImageCaptioningAgent found that several images are missing alt text, which is crucial for users who rely on screen readers. The generated captions do not always accurately describe the images, which can lead to confusion. For example, the generated caption for nodeId img-2 is 'apple mac pro 13', but the alt image text is 'A collection of multiple Surface, Copilot+ PC devices.' This discrepancy can make the content inaccessible for users who rely on alt text to understand images.\n\nIn conclusion, the page has several accessibility issues that need to be addressed to make it more accessible for all users.",
+        "name": "ColorBlindAgent",
+        "role": "user"
+    },
+    {
+        "content": "\n\n1. **Issue: Incorrect heading order**\n   - Raised by: SemanticAgent\n   - Fix: Ensure that heading levels only increase by one. For example, if you have an `<h2>` element, the next heading should be `<h3>`, not `<h4>`.\n   - Code snippet:\n     ```html\n     <h2>Heading level 2</h2>\n     <h3>Heading level 3</h3>\n     ```\n\n2. **Issue: Low contrast ratio**\n   - Raised by: ContrastAgent\n   - Fix: Increase the contrast ratio to at least 4.5:1 for normal text. This can be done by adjusting the color of the text and/or the background.\n   - Code snippet:\n     ```css\n     a, button, p, .role {\n       color: #000000; /* Adjust color as needed */\n       background-color: #FFFFFF; /* Adjust color as needed */\n     }\n     ```\n\n3. **Issue: Non-unique landmarks**\n   - Raised by: AxeViolationsAgent\n   - Fix: Ensure that each landmark has a unique role or a unique combination of role, label, and title.\n   - Code snippet:\n     ```html\n     <nav aria-label=\"Primary navigation\"></nav>\n     <nav aria-label=\"Secondary navigation\"></nav>\n     ```\n\n4. **Issue: Some content not contained by landmarks**\n   - Raised by: AxeViolationsAgent\n   - Fix: Ensure that all page content is contained within landmark elements.\n   - Code snippet:\n     ```html\n     <main>\n       <!-- All page content goes here -->\n     </main>\n     ```\n\n5. **Issue: Missing alt text for images**\n   - Raised by: ImageCaptioningAgent\n   - Fix: Add meaningful alt text to all images. If an image is decorative and doesn't convey meaningful content, use an empty alt attribute (`alt=\"\"`).\n   - Code snippet:\n     ```html\n     <img src=\"image.jpg\" alt=\"Description of image\">\n     <img src=\"decorative.jpg\" alt=\"\">\n     ```",
+        "name": "FixingAgent",
+        "role": "user"
+    }
+],
+ "GNU" : [
+    {
+        "content": "On page https://www.gnu.org/ (viewport 1920-1080) we detected the following semantic violations: Violation 1 \u2014 **heading-order** (impact: moderate) \u2022 Description: Ensures the order of headings is semantically correct. \u2022 Recommendation: Heading levels should only increase by one. See https://dequeuniversity.com/rules/axe/3.5/heading-order?application=axe-puppeteer \u2022 Detail: Element \"\">What is GNU?/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4",
+        "name": "semantic-agent",
+        "role": "user"
+    },
+    {
+        "content": "The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(34,34,34) and background color of RGB(163,45,42) resulting in a contrast ratio of 2.25. This is below the WCAG recommended minimum of 4.5:1 for normal text.",
+        "name": "contrast-agent",
+        "role": "user"
+    },
+    {
+        "content": "- landmark-unique (impact: moderate)\n    Categories: cat.semantics\n    Description: Ensure landmarks are unique\n    Help: Landmarks should have a unique role or role/label/title (i.e. accessible name) combination\n    FailureSummary: Fix any of the following:; The landmark must have a unique aria-label, aria-labelledby, or title to make landmarks distinguishable\n- page-has-heading-one (impact: moderate)\n    Categories: cat.semantics\n    Description: Ensure that the page, or at least one of its frames contains a level-one heading\n    Help: Page should contain a level-one heading\n    FailureSummary: Fix all of the following:; Page must have a level-one heading\n- region (impact: moderate)\n    Categories: cat.keyboard\n    Description: Ensure all page content is contained by landmarks\n    Help: All page content should be contained by landmarks\n    FailureSummary: Fix any of the following:; Some page content is not contained by landmarks",
+        "name": "axe-violations-agent",
+        "role": "user"
+    },
+    {
+        "content": "For nodeId img-0, the alt image text is '\u00a0[A GNU head]\u00a0', and the generated caption is 'a black and white drawing of a ram'. For nodeId img-1, the alt image text is '\u00a0[Search www.gnu.org]\u00a0', and the generated caption is 'a magnized black and white image of a magnized black and white image of a magnized black and white'. For nodeId img-2, the alt image text is '\u00a0[Other languages]\u00a0', and the generated caption is 'the logo for the american academy'. For nodeId img-3, the alt image text is '\u00a0[Screenshot of Dragora\u00a03.0-beta2 with TDE desktop]\u00a0', and the generated caption is 'a computer screen with a blue background'. For nodeId img-4, the alt image text is '\u00a0[Screenshot of Dragora\u00a03.0-beta2 with TDE desktop]\u00a0', and the generated caption is 'a computer screen with a picture of a shark'. For nodeId img-5, the alt image text is '\u00a0[Screenshot of Guix\u00a00.15 with GNOME\u00a03 desktop]\u00a0', and the generated caption is 'the website of the new york school of medicine'. For nodeId img-6, the alt image text is '\u00a0[Screenshot of Hyperbola\u00a00.3 with i3 window manager]\u00a0', and the generated caption is 'a laptop with a screen showing a page'. For nodeId img-7, the alt image text is '\u00a0[Screenshot of Parabola\u00a02020 with LXDE desktop]\u00a0', and the generated caption is 'the screen is showing the logo for the company'. For nodeId img-8, the alt image text is '\u00a0[Screenshot of PureOS\u00a08 with GNOME\u00a03 desktop]\u00a0', and the generated caption is 'a laptop with a screen showing a picture of a dog'. For nodeId img-9, the alt image text is '\u00a0[Screenshot of Trisquel\u00a010 with MATE desktop]\u00a0', and the generated caption is 'the windows phone app'. For nodeId img-10, the alt image text is 'Help people bypass censorship. Run Snowflake!', and the generated caption is 'the logo for the hype byaspher'. For nodeId img-11, the alt image text is 'RSS Feed', and the generated caption is 'a bottle of beer with a white label'. For nodeId img-12, the alt image text is 'logo for bpel2owfn', and the generated caption is 'the logo for the new apple company'. For nodeId img-13, the alt image text is '\u00a0[FSF logo]\u00a0', and the generated caption is 'the logo for the new logo for the new business'.",
+        "name": "image-captioning-agent",
+        "role": "user"
+    },
+    {
+        "content": "The SemanticAgent has identified a violation in the heading order on the page. The heading \"What is GNU?\" is marked as an h4, which may not follow a semantically correct order of headings. The heading levels should only increase by one, so this should be corrected to improve the page's accessibility.\n\nThe ContrastAgent has found that the contrast ratio of the li elements on the page is below the WCAG recommended minimum of 4.5:1 for normal text. The foreground color of RGB(34,34,34) and background color of RGB(163,45,42) results in a contrast ratio of 2.25. This could make the text difficult to read for users with visual impairments and should be adjusted to meet the recommended contrast ratio.\n\nThe AxeViolationsAgent has identified several violations. The page does not contain a level-one heading, which is important for providing a clear structure. Additionally, some page content is not contained by landmarks, which can make navigation difficult for users with assistive technologies. Lastly, the page has multiple landmarks that are not unique, which can also cause confusion during navigation.\n\nThe ImageCaptioningAgent has provided alternative text and generated captions for several images on the page. Some of the generated captions do not seem to accurately describe the images based on their alternative text. For example, the image with the alt text '\u00a0[Screenshot of Dragora\u00a03.0-beta2 with TDE desktop]\u00a0' has a generated caption of 'a computer screen with a picture of a shark', which may not be accurate. It's important to ensure that the captions accurately describe the images to provide a meaningful context to users who rely on screen readers.",
+        "name": "VisuallyImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "Based on the combined accessibility summary, the following keyboard navigation barriers are identified:\n\n1. **Heading Order**: The page has a semantic violation with the heading order. The heading \"What is GNU?\" is marked as an h4, which may not follow a semantically correct order of headings. This could confuse keyboard-only users who rely on headings for navigation. The heading levels should only increase by one, so this should be corrected to improve the page's accessibility.\n\n2. **Contrast Ratio**: The contrast ratio of the li elements on the page is below the WCAG recommended minimum of 4.5:1 for normal text. This could make the text difficult to read for users with visual impairments and should be adjusted to meet the recommended contrast ratio. This is not a direct keyboard navigation issue, but it affects the overall accessibility of the page.\n\n3. **Landmarks**: The page has multiple landmarks that are not unique, which can cause confusion during navigation for keyboard-only users. Also, some page content is not contained by landmarks, which can make navigation difficult for users with assistive technologies. These issues should be addressed to improve keyboard navigation.\n\n4. **Missing Level-One Heading**: The page does not contain a level-one heading, which is important for providing a clear structure. This could confuse keyboard-only users who rely on headings for navigation.\n\n5. **Image Captions**: Some of the generated captions do not seem to accurately describe the images based on their alternative text. While this is not a direct keyboard navigation issue, it affects the overall accessibility of the page as users who rely on screen readers might get incorrect or misleading information about the images. \n\nIn conclusion, to improve keyboard navigation, the page should correct the heading order, ensure all content is contained within unique landmarks, include a level-one heading, and provide accurate image captions.",
+        "name": "MotorImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The ContrastAgent has identified a significant issue that would affect my ability to distinguish page elements. The contrast ratio of the li elements on the page is below the WCAG recommended minimum of 4.5:1 for normal text. The foreground color of RGB(34,34,34) and background color of RGB(163,45,42) results in a contrast ratio of 2.25. This low contrast ratio would make it difficult for me to read the text, and it should be adjusted to meet the recommended contrast ratio.\n\nThe SemanticAgent and AxeViolationsAgent have also identified several semantic issues, such as incorrect heading order and non-unique landmarks, which could make the page more difficult to navigate. However, these issues are not directly related to color and would not affect my ability to distinguish page elements based on color alone. \n\nThe ImageCaptioningAgent has provided alternative text and generated captions for several images on the page. This is helpful for me as a color-blind user, as it provides additional context for the images that I may not be able to fully perceive due to my color blindness. However, some of the generated captions do not seem to accurately describe the images based on their alternative text, which could potentially lead to confusion. \n\nIn conclusion, the main color-related problem on this page is the low contrast ratio of the li elements, which should be addressed to improve accessibility for color-blind users like me.",
+        "name": "ColorBlindAgent",
+        "role": "user"
+    },
+    {
+        "content": "Based on the findings from the SemanticAgent, ContrastAgent, AxeViolationsAgent, ImageCaptioningAgent, VisuallyImpairedAgent, MotorImpairedAgent, and ColorBlindAgent, the following code-level fixes are recommended:\n\n1. **Heading Order Violation** (SemanticAgent): Ensure that heading levels only increase by one. The heading \"What is GNU?\" is currently marked as an h4, which may not follow a semantically correct order of headings. \n\n```html\n<!-- Incorrect -->\n<h4>What is GNU?</h4>\n\n<!-- Correct -->\n<h2>What is GNU?</h2>\n```\n\n2. **Contrast Ratio Violation** (ContrastAgent): Adjust the color of the li elements to meet the WCAG recommended minimum contrast ratio of 4.5:1 for normal text.\n\n```css\n/* Incorrect */\nli {\n  color: rgb(34,34,34);\n  background-color: rgb(163,45,42);\n}\n\n/* Correct */\nli {\n  color: #ffffff; /* Adjusted to white for example */\n  background-color: rgb(163,45,42);\n}\n```\n\n3. **Landmark Uniqueness Violation** (AxeViolationsAgent): Ensure landmarks are unique by providing a unique aria-label, aria-labelledby, or title to each landmark.\n\n```html\n<!-- Incorrect -->\n<nav aria-label=\"Main Navigation\"></nav>\n<nav aria-label=\"Main Navigation\"></nav>\n\n<!-- Correct -->\n<nav aria-label=\"Main Navigation\"></nav>\n<nav aria-label=\"Secondary Navigation\"></nav>\n```\n\n4. **Missing Level-One Heading** (AxeViolationsAgent): Ensure that the page contains a level-one heading.\n\n```html\n<!-- Correct -->\n<h1>Main Page Title</h1>\n```\n\n5. **Content Not Contained by Landmarks** (AxeViolationsAgent): Ensure all page content is contained by landmarks.\n\n```html\n<!-- Correct -->\n<main>\n  <!-- All page content goes here -->\n</main>\n```\n\n6. **Inaccurate Image Captions** (ImageCaptioningAgent): Ensure that the alt text accurately describes the images.\n\n```html\n<!-- Incorrect -->\n<img src=\"image.jpg\" alt=\"[Screenshot of Dragora 3.0-beta2 with TDE desktop]\">\n\n<!-- Correct -->\n<img src=\"image.jpg\" alt=\"Screenshot of Dragora 3.0-beta2 with TDE desktop showing a shark\">\n```",
+        "name": "FixingAgent",
+        "role": "user"
+    }
+],
+"Harvard": [
+    {
+        "content": "No semantic violations found in page",
+        "name": "semantic-agent",
+        "role": "user"
+    },
+    {
+        "content": "The a, fg:255,255 and bg:243,244,244) resulting in a contrast ratio of 1.10. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(255,255,255) and background color of RGB(243,244,244) resulting in a contrast ratio of 1.10. This is below the WCAG recommended minimum of 4.5:1 for normal text. The label element has a foreground color of RGB(30,30,30) and background color of RGB(14,14,14) resulting in a contrast ratio of 1.16. This is below the WCAG recommended minimum of 4.5:1 for normal text. The a, fg:30,30, and bg:14,14 reflects a contrast ratio of 1.16. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(101,111,119) and background color of RGB(14,14,14) resulting in a contrast ratio of 3.76. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(30,30,30) and background color of RGB(14,14,14) resulting in a contrast ratio of 1.16. This is below the WCAG recommended minimum of 4.5:1 for normal text. The a, fg:30,30, and bg:14,14 reflects a contrast ratio of 1.16. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(30,30,30) and background color of RGB(14,14,14) resulting in a contrast ratio of 1.16. This is below the WCAG recommended minimum of 4.5:1 for normal text. The a, fg:30,30, and bg:14,14 reflects a contrast ratio of 1.16. This is below the WCAG recommended minimum of 4.5:1 for normal text.",
+        "name": "contrast-agent",
+        "role": "user"
+    },
+    {
+        "content": "- color-contrast (impact: serious)\n    Categories: cat.color\n    Description: Ensure the contrast between foreground and background colors meets WCAG 2 AA minimum contrast ratio thresholds\n    Help: Elements must meet minimum color contrast ratio thresholds\n    FailureSummary: Fix any of the following:; Element has insufficient color contrast of 1.01 (foreground color: #101010, background color: #0e0e0e, font size: 0.0pt (0px), font weight: normal). Expected contrast ratio of 4.5:1 | Fix any of the following:; Element has insufficient color contrast of 1.01 (foreground color: #101010, background color: #0e0e0e, font size: 0.0pt (0px), font weight: normal). Expected contrast ratio of 4.5:1 | Fix any of the following:; Element has insufficient color contrast of 1.01 (foreground color: #101010, background color: #0e0e0e, font size: 0.0pt (0px), font weight: normal). Expected contrast ratio of 4.5:1 | Fix any of the following:; Element has insufficient color contrast of 1.01 (foreground color: #101010, background color: #0e0e0e, font size: 10.5pt (14px), font weight: normal). Expected contrast ratio of 4.5:1 | Fix any of the following:; Element has insufficient color contrast of 1.01 (foreground color: #101010, background color: #0e0e0e, font size: 42.0pt (56px), font weight: normal). Expected contrast ratio of 3:1",
+        "name": "axe-violations-agent",
+        "role": "user"
+    },
+    {
+        "content": "For nodeId img-4, the alt image text is 'A dropper going into a test tube', and the generated caption is 'a black background with a white border'. For nodeId img-5, the alt image text is 'A man wears a robotic vest while two researchers look on', and the generated caption is 'a pair of black and white shoes'. For nodeId img-6, the alt text is missing and the generated caption is 'a white refrigerator with a door open'. For nodeId img-7, the alt text is missing and the generated caption is 'a black and white photo frame with a white background'. For nodeId img-8, the alt image text is 'A father and son stand together outside', and the generated caption is 'a pair of black and white shoes'. For nodeId img-9, the alt image text is 'A dentist works on a patient in an exam room', and the generated caption is 'a man in a dentist chair'. For nodeId img-10, the alt image text is 'Two people running at dawn', and the generated caption is 'a man running in the dark'. For nodeId img-11, the alt image text is 'Butter on a plate and oil in a glass', and the generated caption is 'a pill pill pill pill pill pill pill pill pill pill pill pill pill pill pill pill pill pill pill pill'. For nodeId img-12, the alt image text is 'A person wears a full protective suit while assessing patients in a car', and the generated caption is 'a police officer is standing in front of a car'. For nodeId img-13, the alt image text is 'Gloved hands handling a test tube in a lab', and the generated caption is 'a person in a lab holding a red liquid bottle'. For nodeId img-14, the alt image text is 'an ear.', and the generated caption is 'a pair of black and white shoes'. For nodeId img-15, the alt image text is 'Illustration of neurons', and the generated caption is 'neurons are the most important organs in the body'. For nodeId img-16, the alt image text is 'Orange and yellow particles on a green background representing the bacterium that causes TB', and the generated caption is 'a pair of black and white shoes'. For nodeId img-17, the alt image text is 'A model of a heart', and the generated caption is 'a pair of black and white shoes'. For nodeId img-18, the alt image text is 'human cells seen under a microscope.', and the generated caption is 'a pair of black and white shoes'. For nodeId img-19, the alt image text is 'Three researchers in a lab', and the generated caption is 'a pair of black and white shoes'. For nodeId img-20, the alt image text is 'Students wearing backpacks walk down a corridor', and the generated caption is 'a pair of black and white shoes'. For nodeId img-21, the alt image text is 'A trail through a forest', and the generated caption is 'a white and black background with a black border'. For nodeId img-22, the alt text is missing and the generated caption is 'a large, colorful, black and yellow neurons with a white background'. For nodeId img-23, the alt text is missing and the generated caption is 'a black background with a white and red flower'. For nodeId img-24, the alt text is missing and the generated caption is 'a black background with a white and red flower'. For nodeId img-25, the alt text is missing and the generated caption is 'a black background with a white and red flower'. For nodeId img-26, the alt text is missing and the generated caption is 'a black background with a white and red flower'. For nodeId img-27, the alt text is missing and the generated caption is 'a black background with a white and red flower'. For nodeId img-28, the alt text is missing and the generated caption is 'a black background with a white and red flower'. For nodeId img-29, the alt text is missing and the generated caption is 'a black background with a white and red flower'. For nodeId img-31, the alt image text is 'Harvard University', and the generated caption is 'harvard logo'. For nodeId img-32, the alt image text is 'Instagram', and the generated caption is 'the ins ins logo'. For nodeId img-33, the alt image text is 'TikTok', and the generated caption is 'the logo for the new business'. For nodeId img-34, the alt image text is 'LinkedIn', and the generated caption is 'the linked logo'. For nodeId img-35, the alt image text is 'Facebook', and the generated caption is 'the facebook logo'. For nodeId img-36, the alt image text is 'YouTube', and the generated caption is 'the youtube logo'.",
+        "name": "image-captioning-agent",
+        "role": "user"
+    },
+    {
+        "content": "The page has several accessibility issues related to color contrast and image alt text.\n\n1. Color Contrast: The ContrastAgent has identified multiple instances where the contrast ratio between the foreground and background colors is below the WCAG recommended minimum of 4.5:1 for normal text. This includes the 'a' element with foreground color RGB(255,255,255) and background color RGB(243,244,244) resulting in a contrast ratio of 1.10, the 'span' element with foreground color RGB(101,111,119) and background color RGB(14,14,14) resulting in a contrast ratio of 3.76, and the 'label' element with foreground color RGB(30,30,30) and background color RGB(14,14,14) resulting in a contrast ratio of 1.16. These low contrast ratios can make the text difficult to read for users with low vision or color vision deficiencies. The AxeViolationsAgent also identified serious color-contrast issues, further validating these findings.\n\n2. Image Alt Text: The ImageCaptioningAgent has identified several images where the alt text is missing or does not accurately describe the image. For example, nodeId img-6 and img-7 have missing alt text, and nodeId img-5 has alt text 'A man wears a robotic vest while two researchers look on', but the generated caption is 'a pair of black and white shoes'. This discrepancy suggests that the alt text may not accurately represent the image content. Alt text is important for screen reader users to understand the content of images.\n\nIn conclusion, to improve the accessibility of this page, it is recommended to adjust the color contrast of the identified elements to meet the WCAG guidelines and to provide accurate and descriptive alt text for all images.",
+        "name": "VisuallyImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The page has several accessibility issues related to color contrast and image alt text.\n\n1. Color Contrast: The ContrastAgent has identified multiple instances where the contrast ratio between the foreground and background colors is below the WCAG recommended minimum of 4.5:1 for normal text. This includes the 'a' element with foreground color RGB(255,255,255) and background color RGB(243,244,244) resulting in a contrast ratio of 1.10, the 'span' element with foreground color RGB(101,111,119) and background color RGB(14,14,14) resulting in a contrast ratio of 3.76, and the 'label' element with foreground color RGB(30,30,30) and background color RGB(14,14,14) resulting in a contrast ratio of 1.16. These low contrast ratios can make the text difficult to read for users with low vision or color vision deficiencies. The AxeViolationsAgent also identified serious color-contrast issues, further validating these findings.\n\n2. Image Alt Text: The ImageCaptioningAgent has identified several images where the alt text is missing or does not accurately describe the image. For example, nodeId img-6 and img-7 have missing alt text, and nodeId img-5 has alt text 'A man wears a robotic vest while two researchers look on', but the generated caption is 'a pair of black and white shoes'. This discrepancy suggests that the alt text may not accurately represent the image content. Alt text is important for screen reader users to understand the content of images.\n\nIn conclusion, to improve the accessibility of this page, it is recommended to adjust the color contrast of the identified elements to meet the WCAG guidelines and to provide accurate and descriptive alt text for all images.",
+        "name": "MotorImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The page has several accessibility issues related to color contrast and image alt text.\n\n1. Color Contrast: The ContrastAgent has identified multiple instances where the contrast ratio between the foreground and background colors is below the WCAG recommended minimum of 4.5:1 for normal text. This includes the 'a' element with foreground color RGB(255,255,255) and background color RGB(243,244,244) resulting in a contrast ratio of 1.10, the 'span' element with foreground color RGB(101,111,119) and background color RGB(14,14,14) resulting in a contrast ratio of 3.76, and the 'label' element with foreground color RGB(30,30,30) and background color RGB(14,14,14) resulting in a contrast ratio of 1.16. These low contrast ratios can make the text difficult to read for users with low vision or color vision deficiencies. The AxeViolationsAgent also identified serious color-contrast issues, further validating these findings.\n\n2. Image Alt Text: The ImageCaptioningAgent has identified several images where the alt text is missing or does not accurately describe the image. For example, nodeId img-6 and img-7 have missing alt text, and nodeId img-5 has alt text 'A man wears a robotic vest while two researchers look on', but the generated caption is 'a pair of black and white shoes'. This discrepancy suggests that the alt text may not accurately represent the image content. Alt text is important for screen reader users to understand the content of images.\n\nIn conclusion, to improve the accessibility of this page, it is recommended to adjust the color contrast of the identified elements to meet the WCAG guidelines and to provide accurate and descriptive alt text for all images.",
+        "name": "ColorBlindAgent",
+        "role": "user"
+    },
+    {
+        "content": "\n\n1. Color Contrast Issues (Raised by ContrastAgent and AxeViolationsAgent):\n\n- For 'a' elements with foreground color RGB(255,255,255) and background color RGB(243,244,244), adjust the color contrast to meet the WCAG recommended minimum of 4.5:1 for normal text.\n\n```css\na {\n    color: #000000; /* or any other color with sufficient contrast */\n    background-color: #F3F4F4; /* or any other color with sufficient contrast */\n}\n```\n\n- For 'span' elements with foreground color RGB(101,111,119) and background color RGB(14,14,14), adjust the color contrast to meet the WCAG recommended minimum of 4.5:1 for normal text.\n\n```css\nspan {\n    color: #FFFFFF; /* or any other color with sufficient contrast */\n    background-color: #0E0E0E; /* or any other color with sufficient contrast */\n}\n```\n\n- For 'label' elements with foreground color RGB(30,30,30) and background color RGB(14,14,14), adjust the color contrast to meet the WCAG recommended minimum of 4.5:1 for normal text.\n\n```css\nlabel {\n    color: #FFFFFF; /* or any other color with sufficient contrast */\n    background-color: #0E0E0E; /* or any other color with sufficient contrast */\n}\n```\n\n2. Image Alt Text Issues (Raised by ImageCaptioningAgent):\n\n- For images with nodeId img-6 and img-7, add descriptive alt text.\n\n```html\n<img id=\"img-6\" src=\"image6.jpg\" alt=\"Descriptive text for image 6\">\n<img id=\"img-7\" src=\"image7.jpg\" alt=\"Descriptive text for image 7\">\n```\n\n- For image with nodeId img-5, adjust the alt text to accurately represent the image content.\n\n```html\n<img id=\"img-5\" src=\"image5.jpg\" alt=\"Accurate description of image 5\">\n```\n\nPlease replace \"Descriptive text for image X\" and \"Accurate description of image X\" with actual descriptions of the images.",
+        "name": "FixingAgent",
+        "role": "user"
+    }
+],
+"IETF": [
+    {
+        "content": "No semantic violations found in page",
+        "name": "semantic-agent",
+        "role": "user"
+    },
+    {
+        "content": "The a, fg: 248,249,250, and bg: 249,249,249) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The role has a foreground color of RGB(255,255,255) and background color of RGB(243,245,246) resulting in a contrast ratio of 1.09. This is below the WCAG recommended minimum of 4.5:1 for normal text. The p, fg:255,255,255 bg:243,245,246) and contrast ratio is below the WCAG recommended minimum of 4.5:1 for normal text. The p, fg:255,255,255 bg:243,245,246) and contrast ratio is below the WCAG recommended minimum of 4.5:1 for normal text. The a, fg:255,255 and bg:243,245,246) resulting in a contrast ratio of 1.09. This is below the WCAG recommended minimum of 4.5:1 for normal text.",
+        "name": "contrast-agent",
+        "role": "user"
+    },
+    {
+        "content": "- aria-allowed-role (impact: minor)\n    Categories: cat.aria\n    Description: Ensure role attribute has an appropriate value for the element\n    Help: ARIA role should be appropriate for the element\n    FailureSummary: Fix any of the following:; ARIA role button is not allowed for given element | Fix any of the following:; ARIA role button is not allowed for given element | Fix any of the following:; ARIA role button is not allowed for given element | Fix any of the following:; ARIA role button is not allowed for given element | Fix any of the following:; ARIA role button is not allowed for given element | Fix any of the following:; ARIA role button is not allowed for given element",
+        "name": "axe-violations-agent",
+        "role": "user"
+    },
+    {
+        "content": "For nodeId img-0, the alt image text is 'IETF logo', and the generated caption is 'the logo for the new life'. For nodeId img-5, the alt image text is 'IETF 123 Madrid', and the generated caption is 'a tv with a picture of a city in the background'. For nodeId img-6, the alt image text is 'Montreal skyline', and the generated caption is 'the city skyline at night from the top of the hill'.",
+        "name": "image-captioning-agent",
+        "role": "user"
+    },
+    {
+        "content": "The page has several accessibility issues that need to be addressed. \n\nFirstly, the ContrastAgent has identified multiple instances where the contrast ratio is below the WCAG recommended minimum of 4.5:1 for normal text. This includes the 'a' element with foreground color RGB(248,249,250) and background color RGB(249,249,249) resulting in a contrast ratio of 1.00, and the 'p' and 'role' elements with foreground color RGB(255,255,255) and background color RGB(243,245,246) resulting in a contrast ratio of 1.09. This low contrast ratio can make the text difficult to read for users with visual impairments.\n\nSecondly, the AxeViolationsAgent has found that the ARIA role attribute has not been used appropriately in several instances. The role 'button' has been used for elements where it is not allowed. This can cause confusion for screen reader users as the role attribute communicates the purpose of the element to assistive technologies.\n\nLastly, the ImageCaptioningAgent has identified some discrepancies between the alt text and the generated captions for several images. For example, the alt text for nodeId img-0 is 'IETF logo', but the generated caption is 'the logo for the new life'. Similarly, the alt text for nodeId img-5 is 'IETF 123 Madrid', but the generated caption is 'a tv with a picture of a city in the background'. These inconsistencies can cause confusion for screen reader users who rely on accurate and descriptive alt text to understand the content of images.\n\nIn conclusion, the page needs to improve its color contrast, use of ARIA roles, and accuracy of image alt text to enhance its accessibility.",
+        "name": "VisuallyImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The page structure presents several keyboard navigation barriers:\n\n1. Contrast: The low contrast ratio in several elements, as identified by the ContrastAgent, can pose a problem for keyboard-only users who rely on visual cues to navigate. If the contrast between the text and the background is too low, it can be difficult to see which element is currently in focus. This is particularly problematic for the 'a' and 'p' elements, which often serve as important navigation points.\n\n2. ARIA roles: The inappropriate use of the 'button' ARIA role, as reported by the AxeViolationsAgent, can also hinder keyboard navigation. If an element is not a button but is assigned a 'button' role, it may not behave as expected when navigated to and interacted with using a keyboard. This can lead to confusion and difficulty in navigating the page.\n\n3. Image alt text: The discrepancies between the alt text and the generated captions for several images, as noted by the ImageCaptioningAgent, can also impact keyboard navigation. Keyboard-only users often rely on screen readers, which use alt text to describe images. If the alt text is not accurate or descriptive, it can lead to confusion and difficulty in understanding the content of the page.\n\nTo improve keyboard navigation, the page should increase the contrast ratio for text, use appropriate ARIA roles, and ensure that image alt text accurately describes the image content.",
+        "name": "MotorImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The page has several color-related problems that affect my ability to distinguish page elements. The ContrastAgent has identified multiple instances where the contrast ratio is below the WCAG recommended minimum of 4.5:1 for normal text. This includes the 'a' element with foreground color RGB(248,249,250) and background color RGB(249,249,249) resulting in a contrast ratio of 1.00, and the 'p' and 'role' elements with foreground color RGB(255,255,255) and background color RGB(243,245,246) resulting in a contrast ratio of 1.09. This low contrast ratio can make the text difficult to read for me. Therefore, the reported contrast ratio is not sufficient.",
+        "name": "ColorBlindAgent",
+        "role": "user"
+    },
+    {
+        "content": "\n\n1. Issue: Low contrast ratio\n   Agent: ContrastAgent, VisuallyImpairedAgent, MotorImpairedAgent, ColorBlindAgent\n   Fix: Increase the contrast ratio for the text to at least 4.5:1. This can be done by adjusting the color of the text or the background. Here's an example of how to adjust the color in CSS:\n\n   ```css\n   a {\n     color: #000000; /* Adjust to a darker color */\n     background-color: #FFFFFF; /* Adjust to a lighter color */\n   }\n\n   p {\n     color: #000000; /* Adjust to a darker color */\n     background-color: #FFFFFF; /* Adjust to a lighter color */\n   }\n\n   .role {\n     color: #000000; /* Adjust to a darker color */\n     background-color: #FFFFFF; /* Adjust to a lighter color */\n   }\n   ```\n\n2. Issue: Inappropriate use of ARIA roles\n   Agent: AxeViolationsAgent, VisuallyImpairedAgent, MotorImpairedAgent\n   Fix: Use appropriate ARIA roles for each element. If an element is not a button, do not assign it a 'button' role. Here's an example of how to adjust the role in HTML:\n\n   ```html\n   <div role=\"navigation\">...</div> <!-- Use appropriate role -->\n   ```\n\n3. Issue: Inaccurate image alt text\n   Agent: ImageCaptioningAgent, VisuallyImpairedAgent, MotorImpairedAgent\n   Fix: Ensure that the alt text accurately describes the content of the image. Here's an example of how to adjust the alt text in HTML:\n\n   ```html\n   <img src=\"ietf-logo.jpg\" alt=\"IETF logo\"> <!-- Use accurate alt text -->\n   <img src=\"ietf-123-madrid.jpg\" alt=\"IETF 123 Madrid\"> <!-- Use accurate alt text -->\n   <img src=\"montreal-skyline.jpg\" alt=\"Montreal skyline\"> <!-- Use accurate alt text -->\n   ```",
+        "name": "FixingAgent",
+        "role": "user"
+    }
+],
+"Netflix": [
+    {
+        "content": "On page https://www.netflix.com/ (viewport 1920-1080) we detected the following semantic violations: Violation 1 \u2014 **heading-order** (impact: moderate) \u2022 Description: Heading levels should only increase by one. \u2022 Recommendation: Heading levels should only increase by one. See https://dequeuniversity.com/rules/axe/3.5/heading-order?application=axe-puppeteer \u2022 Detail: Element \"h3>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h4>/h3>/h3>/h3>/h3>/h3>/h3>/",
+        "name": "semantic-agent",
+        "role": "user"
+    },
+    {
+        "content": "The button element has a foreground color of RGB(255,255,255) and background color of RGB(128,128,128) resulting in a contrast ratio of 3.95. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(65,65,65) and background color of RGB(35,35,35) resulting in a contrast ratio of 1.54. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(65,65,65) and background color of RGB(35,35,35) resulting in a contrast ratio of 1.54. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(65,65,65) and background color of RGB(35,35,35) resulting in a contrast ratio of 1.54. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(65,65,65) and background color of RGB(35,35,35) resulting in a contrast ratio of 1.54. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(65,65,65) and background color of RGB(35,35,35) resulting in a contrast ratio of 1.54. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(65,65,65) and background color of RGB(35,35,35) resulting in a contrast ratio of 1.54. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(65,65,65) and background color of RGB(35,35,35) resulting in a contrast ratio of 1.54. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(65,65,65) and background color of RGB(35,35,35) resulting in a contrast ratio of 1.54. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(65,65,65) and background color of RGB(35,35,35) resulting in a contrast ratio of 1.54. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(65,65,65) and background color of RGB(35,35,35) resulting in a contrast ratio of 1.54. This is below the WCAG recommended minimum of 4.5:1 for normal text. The button element has a foreground color of RGB(255,255,255) and background color of RGB(255,255,255) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(60,115,86) resulting in a contrast ratio of 3.78. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(0,0,0) and background color of RGB(60,115,86) resulting in a contrast ratio of 3.78. This is below the WCAG recommended minimum of 4.5:1 for normal text. The button element has a foreground color of RGB(85,85,85) and background color of RGB(56,96,190) resulting in a contrast ratio of 1.27. This is below the WCAG recommended minimum of 4.5:1 for normal text.",
+        "name": "contrast-agent",
+        "role": "user"
+    },
+    {
+        "content": "- heading-order (impact: moderate)\n    Categories: cat.semantics\n    Description: Ensure the order of headings is semantically correct\n    Help: Heading levels should only increase by one\n    FailureSummary: Fix any of the following:; Heading order invalid\n- landmark-unique (impact: moderate)\n    Categories: cat.semantics\n    Description: Ensure landmarks are unique\n    Help: Landmarks should have a unique role or role/label/title (i.e. accessible name) combination\n    FailureSummary: Fix any of the following:; The landmark must have a unique aria-label, aria-labelledby, or title to make landmarks distinguishable\n- meta-viewport (impact: critical)\n    Categories: cat.sensory-and-visual-cues\n    Description: Ensure <meta name=\"viewport\"> does not disable text scaling and zooming\n    Help: Zooming and scaling must not be disabled\n    FailureSummary: Fix any of the following:; maximum-scale on <meta> tag disables zooming on mobile devices\n- region (impact: moderate)\n    Categories: cat.keyboard\n    Description: Ensure all page content is contained by landmarks\n    Help: All page content should be contained by landmarks\n    FailureSummary: Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks",
+        "name": "axe-violations-agent",
+        "role": "user"
+    },
+    {
+        "content": "For nodeId img-0, the alt text is missing and the generated caption is 'netflix tv app'. For nodeId svg-1, the alt text is missing and the generated caption is 'netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix netflix'. For nodeId svg-2, the alt text is missing and the generated caption is 'the word faith in white on a black background'. For nodeId svg-3, the alt text is missing and the generated caption is 'a black and white photo of a white light'. For nodeId svg-4, the alt text is missing and the generated caption is 'the red background with the white logo'. For nodeId svg-5, the alt text is missing and the generated caption is 'popcorn buckets - free vector vector'. For nodeId svg-6, the alt text is missing and the generated caption is 'the logo for the new app'. For nodeId svg-7, the alt text is missing and the generated caption is 'a computer monitor with a red light on it'. For nodeId svg-8, the alt text is missing and the generated caption is 'a clock with a tick tick tick tick tick tick tick tick tick tick tick tick tick tick tick tick tick'. For nodeId svg-9, the alt text is missing and the generated caption is 'a rocket with a red and white rocket on it'. For nodeId svg-10, the alt text is missing and the generated caption is 'a black background with a square and square icons'. For nodeId svg-11, the alt text is missing and the generated caption is 'the cross is a symbol of christianity'. For nodeId svg-13, the alt text is missing and the generated caption is 'the cross is a symbol of christianity'. For nodeId svg-15, the alt text is missing and the generated caption is 'the cross is a symbol of christianity'. For nodeId svg-17, the alt text is missing and the generated caption is 'the cross is a symbol of christianity'. For nodeId svg-19, the alt text is missing and the generated caption is 'the cross is a symbol of christianity'. For nodeId svg-21, the alt text is missing and the generated caption is 'the cross is a symbol of christianity'. For nodeId svg-23, the alt text is missing and the generated caption is 'the logo for the red cross'. For nodeId svg-24, the alt text is missing and the generated caption is 'the word faith in white on a black background'. For nodeId svg-25, the alt text is missing and the generated caption is 'a black background with a white spot'.",
+        "name": "image-captioning-agent",
+        "role": "user"
+    },
+    {
+        "content": "The analysis reveals several accessibility issues on the page. \n\nSemanticAgent identified a violation in the heading order. The heading levels should increase by one, but the page has multiple h4 headings following an h3 heading, which is not semantically correct. This could make it difficult for screen reader users to understand the structure of the content.\n\nContrastAgent found numerous contrast issues. Many span elements and some button elements have a contrast ratio below the WCAG recommended minimum of 4.5:1 for normal text. This could make the text difficult to read for users with low vision or color vision deficiencies.\n\nAxeViolationsAgent reported several violations. The page has issues with unique landmarks, which could make it difficult for screen reader users to navigate the page. The meta viewport tag disables text scaling and zooming, which could make the page less accessible for users with low vision. Some page content is not contained by landmarks, which could make it difficult for screen reader users to understand the structure of the page.\n\nImageCaptioningAgent found that many images and SVG elements are missing alt text. This could make it difficult for screen reader users to understand the content of these images. The generated captions provide some context, but they may not fully convey the intended meaning of the images. For example, the caption 'netflix tv app' for img-0 does not provide information about what is shown in the image. \n\nIn conclusion, the page has several accessibility issues that could make it difficult for users with disabilities to access and understand the content. The issues should be addressed to improve the accessibility of the page.",
+        "name": "VisuallyImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The analysis reveals several accessibility issues on the page. \n\nSemanticAgent identified a violation in the heading order. The heading levels should increase by one, but the page has multiple h4 headings following an h3 heading, which is not semantically correct. This could make it difficult for screen reader users to understand the structure of the content.\n\nContrastAgent found numerous contrast issues. Many span elements and some button elements have a contrast ratio below the WCAG recommended minimum of 4.5:1 for normal text. This could make the text difficult to read for users with low vision or color vision deficiencies.\n\nAxeViolationsAgent reported several violations. The page has issues with unique landmarks, which could make it difficult for screen reader users to navigate the page. The meta viewport tag disables text scaling and zooming, which could make the page less accessible for users with low vision. Some page content is not contained by landmarks, which could make it difficult for screen reader users to understand the structure of the page.\n\nImageCaptioningAgent found that many images and SVG elements are missing alt text. This could make it difficult for screen reader users to understand the content of these images. The generated captions provide some context, but they may not fully convey the intended meaning of the images. For example, the caption 'netflix tv app' for img-0 does not provide information about what is shown in the image. \n\nIn conclusion, the page has several accessibility issues that could make it difficult for users with disabilities to access and understand the content. The issues should be addressed to improve the accessibility of the page.",
+        "name": "MotorImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "As a color-blind user, the reported contrast ratios are concerning. Many elements on the page, including buttons and span elements, have contrast ratios below the WCAG recommended minimum of 4.5:1 for normal text. This could make it difficult for me to distinguish these elements on the page. The issues should be addressed to improve the accessibility of the page.",
+        "name": "ColorBlindAgent",
+        "role": "user"
+    },
+    {
+        "content": "Based on the findings from the SemanticAgent, ContrastAgent, AxeViolationsAgent, ImageCaptioningAgent, VisuallyImpairedAgent, MotorImpairedAgent, and ColorBlindAgent, the following code-level fixes are recommended:\n\n1. **Heading Order Violation** (SemanticAgent)\n   - Issue: Heading levels should only increase by one, but the page has multiple h4 headings following an h3 heading.\n   - Fix: Adjust the heading levels to ensure they increase by one. For example, if an h3 is followed by an h4, any subsequent headings should be h5, not h4.\n   ```html\n   <h3>Heading Level 3</h3>\n   <h4>Heading Level 4</h4>\n   <h5>Heading Level 5</h5>\n   ```\n\n2. **Contrast Issues** (ContrastAgent, ColorBlindAgent)\n   - Issue: Many span elements and some button elements have a contrast ratio below the WCAG recommended minimum of 4.5:1 for normal text.\n   - Fix: Adjust the foreground and background colors to meet the minimum contrast ratio. This can be done in CSS.\n   ```css\n   .low-contrast-element {\n     color: #000000; /* Adjust as needed */\n     background-color: #FFFFFF; /* Adjust as needed */\n   }\n   ```\n\n3. **Unique Landmarks Violation** (AxeViolationsAgent)\n   - Issue: The page has issues with unique landmarks.\n   - Fix: Ensure landmarks have a unique role or role/label/title (i.e., accessible name) combination. This can be done with ARIA attributes in HTML.\n   ```html\n   <nav aria-label=\"Primary Navigation\"></nav>\n   <nav aria-label=\"Secondary Navigation\"></nav>\n   ```",
+        "name": "FixingAgent",
+        "role": "user"
+    }
+],
+"Quora": [
+    {
+        "content": "No semantic violations found in page",
+        "name": "semantic-agent",
+        "role": "user"
+    },
+    {
+        "content": "The button element has a foreground color of RGB(40,40,41) and background color of RGB(46,105,255) resulting in a contrast ratio of 3.21. This is below the WCAG recommended minimum of 4.5:1 for normal text.",
+        "name": "contrast-agent",
+        "role": "user"
+    },
+    {
+        "content": "- color-contrast (impact: serious)\n    Categories: cat.color\n    Description: Ensure the contrast between foreground and background colors meets WCAG 2 AA minimum contrast ratio thresholds\n    Help: Elements must meet minimum color contrast ratio thresholds\n    FailureSummary: Fix any of the following:; Element has insufficient color contrast of 3 (foreground color: #939598, background color: #ffffff, font size: 9.8pt (13px), font weight: normal). Expected contrast ratio of 4.5:1 | Fix any of the following:; Element has insufficient color contrast of 3 (foreground color: #939598, background color: #ffffff, font size: 9.8pt (13px), font weight: normal). Expected contrast ratio of 4.5:1\n- link-in-text-block (impact: serious)\n    Categories: cat.color\n    Description: Ensure links are distinguished from surrounding text in a way that does not rely on color\n    Help: Links must be distinguishable without relying on color\n    FailureSummary: Fix any of the following:; The link has insufficient color contrast of 2.14:1 with the surrounding text. (Minimum contrast is 3:1, link text: #195faa, surrounding text: #939598); The link has no styling (such as underline) to distinguish it from the surrounding text | Fix any of the following:; The link has insufficient color contrast of 2.14:1 with the surrounding text. (Minimum contrast is 3:1, link text: #195faa, surrounding text: #939598); The link has no styling (such as underline) to distinguish it from the surrounding text\n- region (impact: moderate)\n    Categories: cat.keyboard\n    Description: Ensure all page content is contained by landmarks\n    Help: All page content should be contained by landmarks\n    FailureSummary: Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks | Fix any of the following:; Some page content is not contained by landmarks\n- tabindex (impact: serious)\n    Categories: cat.keyboard\n    Description: Ensure tabindex attribute values are not greater than 0\n    Help: Elements should not have tabindex greater than zero\n    FailureSummary: Fix any of the following:; Element has a tabindex greater than 0 | Fix any of the following:; Element has a tabindex greater than 0 | Fix any of the following:; Element has a tabindex greater than 0",
+        "name": "axe-violations-agent",
+        "role": "user"
+    },
+    {
+        "content": "For nodeId svg-1, the alt text is missing and the generated caption is 'the logo for the quo quo quo quo quo quo quo quo quo quo quo quo quo quo quo quo quo quo quo quo quo'. For nodeId svg-2, the alt text is missing and the generated caption is 'google logo'. For nodeId svg-3, the alt text is missing and the generated caption is 'the facebook logo'. For nodeId svg-4, the alt text is missing and the generated caption is 'a white background with a white background and a white background'. For nodeId svg-5, the alt text is missing and the generated caption is 'a woman in a white dress and a black hat'.",
+        "name": "image-captioning-agent",
+        "role": "user"
+    },
+    {
+        "content": "The page has several accessibility issues that need to be addressed:\n\n1. Contrast Issues: The ContrastAgent and AxeViolationsAgent both identified issues with color contrast. The button element has a foreground color of RGB(40,40,41) and background color of RGB(46,105,255) resulting in a contrast ratio of 3.21, which is below the WCAG recommended minimum of 4.5:1 for normal text. Additionally, there are elements with insufficient color contrast of 3 (foreground color: #939598, background color: #ffffff, font size: 9.8pt (13px), font weight: normal). The link also has insufficient color contrast of 2.14:1 with the surrounding text (link text: #195faa, surrounding text: #939598).\n\n2. Link Styling: The AxeViolationsAgent found that links are not distinguishable from the surrounding text without relying on color. This is a serious violation as it can make navigation difficult for users with color vision deficiencies.\n\n3. Landmark Issues: The AxeViolationsAgent reported that some page content is not contained by landmarks. This can make it difficult for screen reader users to understand the structure of the page and navigate through it.\n\n4. Tabindex Issues: The AxeViolationsAgent found elements with a tabindex greater than 0. This can disrupt the natural tab order and make navigation confusing for keyboard users.\n\n5. Image Alt Text: The ImageCaptioningAgent found that several SVG elements are missing alt text. This can make it difficult for screen reader users to understand the content of these images. The generated captions can be used as a starting point for creating appropriate alt text.\n\nIn conclusion, while the SemanticAgent did not find any semantic violations, there are several accessibility issues related to contrast, link styling, landmarks, tabindex, and image alt text that need to be addressed to improve the accessibility of the page.",
+        "name": "VisuallyImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The page has several accessibility issues that need to be addressed:\n\n1. Contrast Issues: The ContrastAgent and AxeViolationsAgent both identified issues with color contrast. The button element has a foreground color of RGB(40,40,41) and background color of RGB(46,105,255) resulting in a contrast ratio of 3.21, which is below the WCAG recommended minimum of 4.5:1 for normal text. Additionally, there are elements with insufficient color contrast of 3 (foreground color: #939598, background color: #ffffff, font size: 9.8pt (13px), font weight: normal). The link also has insufficient color contrast of 2.14:1 with the surrounding text (link text: #195faa, surrounding text: #939598).\n\n2. Link Styling: The AxeViolationsAgent found that links are not distinguishable from the surrounding text without relying on color. This is a serious violation as it can make navigation difficult for users with color vision deficiencies.\n\n3. Landmark Issues: The AxeViolationsAgent reported that some page content is not contained by landmarks. This can make it difficult for screen reader users to understand the structure of the page and navigate through it.\n\n4. Tabindex Issues: The AxeViolationsAgent found elements with a tabindex greater than 0. This can disrupt the natural tab order and make navigation confusing for keyboard users.\n\n5. Image Alt Text: The ImageCaptioningAgent found that several SVG elements are missing alt text. This can make it difficult for screen reader users to understand the content of these images. The generated captions can be used as a starting point for creating appropriate alt text.\n\nIn conclusion, while the SemanticAgent did not find any semantic violations, there are several accessibility issues related to contrast, link styling, landmarks, tabindex, and image alt text that need to be addressed to improve the accessibility of the page.",
+        "name": "MotorImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "As a color-blind user, the reported contrast ratios and semantic issues do affect my ability to distinguish page elements. The button element has a contrast ratio of 3.21, which is below the recommended minimum of 4.5:1 for normal text. This could make it difficult for me to see the button against its background.\n\nAdditionally, there are elements with a color contrast of 3 (foreground color: #939598, background color: #ffffff), which is also below the recommended contrast ratio. This could make it hard for me to read the text against its background.\n\nThe link has a color contrast of 2.14:1 with the surrounding text, which is below the minimum contrast of 3:1. This could make it difficult for me to distinguish the link from the surrounding text.\n\nThe AxeViolationsAgent also reported that links are not distinguishable from the surrounding text without relying on color. As a color-blind user, this could make it hard for me to identify links within the text.\n\nIn conclusion, the reported contrast ratios and semantic issues do pose color-related problems for me as a color-blind user.",
+        "name": "ColorBlindAgent",
+        "role": "user"
+    },
+    {
+        "content": "\n\n1. Contrast Issues (Raised by ContrastAgent and AxeViolationsAgent)\n   - Button Element: The button element has a foreground color of RGB(40,40,41) and background color of RGB(46,105,255) resulting in a contrast ratio of 3.21. This is below the WCAG recommended minimum of 4.5:1 for normal text. To fix this, adjust the color values to meet the minimum contrast ratio.\n     ```css\n     .button {\n       background-color: #2C69FF; /* Adjust to meet 4.5:1 contrast ratio */\n       color: #282829; /* Adjust to meet 4.5:1 contrast ratio */\n     }\n     ```\n   - Other Elements: There are elements with insufficient color contrast of 3 (foreground color: #939598, background color: #ffffff). Adjust the color values to meet the minimum contrast ratio.\n     ```css\n     .element {\n       background-color: #ffffff; /* Adjust to meet 4.5:1 contrast ratio */\n       color: #939598; /* Adjust to meet 4.5:1 contrast ratio */\n     }\n     ```\n\n2. Link Styling (Raised by AxeViolationsAgent)\n   - The link has insufficient color contrast of 2.14:1 with the surrounding text (link text: #195faa, surrounding text: #939598). The link also lacks styling to distinguish it from the surrounding text. To fix this, adjust the color values and add styling such as underline.\n     ```css\n     a {\n       color: #195faa; /* Adjust to meet 3:1 contrast ratio */\n       text-decoration: underline;\n     }\n     ```\n\n3. Landmark Issues (Raised by AxeViolationsAgent)\n   - Some page content is not contained by landmarks. To fix this, ensure all content is contained within appropriate landmark elements (e.g., `<main>`, `<header>`, `<footer>`, `<nav>`, `<aside>`, `<section>`, `<article>`).\n\n4. Tabindex Issues (Raised by AxeViolationsAgent)\n   - Elements have a tabindex greater than 0. To fix this, ensure all interactive elements have a tabindex of 0 or -1.\n     ```html\n     <button tabindex=\"0\">Button</button>\n     ```\n\n5. Image Alt Text (Raised by ImageCaptioningAgent)\n   - Several SVG elements are missing alt text. To fix this, add appropriate alt text to each image.\n     ```html\n     <img src=\"logo.svg\" alt=\"The logo for the company\">\n     <img src=\"google-logo.svg\" alt=\"Google logo\">\n     <img src=\"facebook-logo.svg\" alt=\"Facebook logo\">\n     <img src=\"background.svg\" alt=\"White background\">\n     <img src=\"woman.svg\" alt=\"A woman in a white dress and a black hat\">\n     ```",
+        "name": "FixingAgent",
+        "role": "user"
+    }
+],
+"Reddit" : [
+    {
+        "content": "On page https://www.reddit.com//viewport 1920-1080 (viewport 1920-1080) we detected the following semantic violations: Violation 1 \u2014 **landmark-one-main** (impact: moderate) \u2022 Description: Ensures the document has a main landmark. \u2022 Recommendation: Document must have one main landmark. See https://dequeuniversity.com/rules/axe/4.10/landmark-one-main?application=axeAPI?application=axe>, \"html>\" at html failed: Document does not have a main landmark. Violation 2 \u2014 **page-has-heading-one** (impact: moderate) \u2022 Description: Ensure that the page, or at least one of its frames contains a level-one heading. \u2022 Recommendation: Page must contain a level-one heading. See https://dequeuniversity.com/rules/axe/4.10/page-has-heading-one?application=axeAPI. \u2022 Recommendation: Page must contain a level-one heading. See https://",
+        "name": "semantic-agent",
+        "role": "user"
+    },
+    {
+        "content": "No contrast violations found on the page.",
+        "name": "contrast-agent",
+        "role": "user"
+    },
+    {
+        "content": "- document-title (impact: serious)\n    Categories: cat.text-alternatives\n    Description: Ensure each HTML document contains a non-empty <title> element\n    Help: Documents must have <title> element to aid in navigation\n    FailureSummary: Fix any of the following:; Document does not have a non-empty <title> element\n- html-has-lang (impact: serious)\n    Categories: cat.language\n    Description: Ensure every HTML document has a lang attribute\n    Help: <html> element must have a lang attribute\n    FailureSummary: Fix any of the following:; The <html> element does not have a lang attribute\n- image-alt (impact: critical)\n    Categories: cat.text-alternatives\n    Description: Ensure <img> elements have alternative text or a role of none or presentation\n    Help: Images must have alternative text\n    FailureSummary: Fix any of the following:; Element does not have an alt attribute; aria-label attribute does not exist or is empty; aria-labelledby attribute does not exist, references elements that do not exist or references elements that are empty; Element has no title attribute; Element's default semantics were not overridden with role=\"none\" or role=\"presentation\"\n- landmark-one-main (impact: moderate)\n    Categories: cat.semantics\n    Description: Ensure the document has a main landmark\n    Help: Document should have one main landmark\n    FailureSummary: Fix all of the following:; Document does not have a main landmark\n- page-has-heading-one (impact: moderate)\n    Categories: cat.semantics\n    Description: Ensure that the page, or at least one of its frames contains a level-one heading\n    Help: Page should contain a level-one heading\n    FailureSummary: Fix all of the following:; Page must have a level-one heading\n- region (impact: moderate)\n    Categories: cat.keyboard\n    Description: Ensure all page content is contained by landmarks\n    Help: All page content should be contained by landmarks\n    FailureSummary: Fix any of the following:; Some page content is not contained by landmarks",
+        "name": "axe-violations-agent",
+        "role": "user"
+    },
+    {
+        "content": "For nodeId img-0, the alt text is missing and the generated caption is 'a 3d character with a hat and a red eye'.",
+        "name": "image-captioning-agent",
+        "role": "user"
+    },
+    {
+        "content": "The page has several accessibility issues that need to be addressed. \n\n1. Semantic Violations: The SemanticAgent identified two violations. The first is the lack of a main landmark (**landmark-one-main**). This is important for screen reader users to understand the layout and navigate the page. The second violation is the absence of a level-one heading (**page-has-heading-one**). This is crucial for understanding the page's main content.\n\n2. Axe Violations: The AxeViolationsAgent detected several violations. The page lacks a non-empty <title> element (**document-title**), which is essential for navigation and understanding the page's purpose. The <html> element does not have a lang attribute (**html-has-lang**), which is necessary for screen readers to correctly pronounce content. There are also images without alternative text (**image-alt**), making it difficult for screen reader users to understand the content of the images. The page also lacks a main landmark (**landmark-one-main**) and a level-one heading (**page-has-heading-one**), which are both important for understanding the page layout and main content. Lastly, some page content is not contained by landmarks (**region**), which can make navigation difficult for screen reader users.\n\n3. Image Captioning: The ImageCaptioningAgent identified an image (nodeId img-0) that lacks alt text. The generated caption is 'a 3d character with a hat and a red eye', which should be used as the alt text to provide context for screen reader users.\n\n4. Contrast: The ContrastAgent did not find any contrast violations, which is good for readability.\n\nIn summary, while the page does well in terms of contrast, it has several accessibility issues related to semantics, document structure, and image descriptions that need to be addressed to improve the experience for screen reader users.",
+        "name": "VisuallyImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The page structure presents several keyboard navigation barriers:\n\n1. Lack of a main landmark: The absence of a main landmark (**landmark-one-main**) can make it difficult for keyboard-only users to understand the layout and navigate the page. This is because landmarks provide a way to identify and navigate to large sections of the page.\n\n2. Absence of a level-one heading: The page does not contain a level-one heading (**page-has-heading-one**). Headings are important for keyboard navigation as they allow users to understand the page's structure and content, and to skip to different sections.\n\n3. Missing document title: The page lacks a non-empty <title> element (**document-title**). The title is the first thing announced by screen readers and is used by keyboard-only users to understand the purpose of the page and to navigate between tabs or windows.\n\n4. Missing language attribute: The <html> element does not have a lang attribute (**html-has-lang**). This can affect how assistive technologies, like screen readers, interpret and pronounce the content, which can impact keyboard-only users who rely on these technologies.\n\n5. Images without alternative text: There are images on the page that do not have alternative text (**image-alt**). This can be a barrier for keyboard-only users who use screen readers, as the alternative text provides a description of the image content.\n\n6. Content not contained by landmarks: Some page content is not contained by landmarks (**region**). This can make it difficult for keyboard-only users to navigate the page, as landmarks provide a way to identify and navigate to large sections of the page.\n\nIn summary, the page has several keyboard navigation barriers related to missing landmarks, headings, document title, language attribute, and alternative text for images. These issues need to be addressed to improve the accessibility of the page for keyboard-only users.",
+        "name": "MotorImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "As a color-blind user, the reported contrast ratio is sufficient as there are no contrast violations found on the page. This means that the text and images on the page have sufficient contrast with the background, making them distinguishable. However, there are several semantic and accessibility issues that need to be addressed, but these are not related to color contrast.",
+        "name": "ColorBlindAgent",
+        "role": "user"
+    },
+    {
+        "content": "Based on the findings from the SemanticAgent, AxeViolationsAgent, ImageCaptioningAgent, VisuallyImpairedAgent, MotorImpairedAgent, and ColorBlindAgent, the following code-level fixes are recommended:\n\n1. **landmark-one-main** (SemanticAgent, AxeViolationsAgent, VisuallyImpairedAgent, MotorImpairedAgent): The document lacks a main landmark. To fix this, wrap the main content of the page in a `<main>` element.\n\n```html\n<main>\n  <!-- main content goes here -->\n</main>\n```\n\n2. **page-has-heading-one** (SemanticAgent, AxeViolationsAgent, VisuallyImpairedAgent, MotorImpairedAgent): The page lacks a level-one heading. To fix this, add a `<h1>` element that describes the main content of the page.\n\n```html\n<h1>Page Title</h1>\n```\n\n3. **document-title** (AxeViolationsAgent, VisuallyImpairedAgent, MotorImpairedAgent): The document lacks a non-empty `<title>` element. To fix this, add a `<title>` element inside the `<head>` element.\n\n```html\n<head>\n  <title>Page Title</title>\n</head>\n```\n\n4. **html-has-lang** (AxeViolationsAgent, VisuallyImpairedAgent, MotorImpairedAgent): The `<html>` element lacks a `lang` attribute. To fix this, add a `lang` attribute to the `<html>` element.\n\n```html\n<html lang=\"en\">\n  <!-- rest of the document -->\n</html>\n```\n\n5. **image-alt** (AxeViolationsAgent, ImageCaptioningAgent, VisuallyImpairedAgent, MotorImpairedAgent): There are images without alternative text. To fix this, add an `alt` attribute to the `<img>` elements. For the image identified by ImageCaptioningAgent, use the generated caption as the `alt` text.\n\n```html\n<img src=\"image.jpg\" alt=\"a 3d character with a hat and a red eye\">\n```\n\n6. **region** (AxeViolationsAgent, VisuallyImpairedAgent, MotorImpairedAgent): Some page content is not contained by landmarks. To fix this, ensure all content is contained within appropriate landmark elements (`<header>`, `<nav>`, `<main>`, `<aside>`, `<footer>`).\n\n```html\n<header>\n  <!-- header content -->\n</header>\n<nav>\n  <!-- navigation content -->\n</nav>\n<main>\n  <!-- main content -->\n</main>\n<aside>\n  <!-- sidebar content -->\n</aside>\n<footer>\n  <!-- footer content -->\n</footer>\n```",
+        "name": "FixingAgent",
+        "role": "user"
+    }
+],
+"Stackoverflow" : [
+    {
+        "content": "On page https://stackoverflow.com/questions/viewport 1920-1080 (viewport 1920-1080) we detected the following semantic violations: Violation 1 \u2014 **heading-order** (impact: moderate) \u2022 Description: Ensures the order of headings is semantically correct. \u2022 Recommendation: Heading levels should only increase by one. See https://stackoverflow.com/rules/axe/3.5/heading-order?application=axe-puppeteer \u2022 Detail: Element \"\" at \">aside failed: Heading order invalid. Violation 2 \u2014 **landmark-complementary-is-top-level** (impact: moderate) \u2022 Description: Landmarks must have a unique role or role/label/title (i.e. accessible name) combination. \u2022 Recommendation: Ensures landmarks are unique. See https://stackoverflow.com/rules/axe/3.5/landmark-complementary-is-top-level?application=axe-puppeteer \u2022 Detail:",
+        "name": "semantic-agent",
+        "role": "user"
+    },
+    {
+        "content": "The a, fg: 27,117,208, and background color of RGB(237,245,253) resulting in a contrast ratio of 4.24. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(12,13,14) and background color of RGB(99,107,116) resulting in a contrast ratio of 3.60. This is below the WCAG recommended minimum of 4.5:1 for normal text. The a, fg:255,255,255 bg: 231,112,13. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(59,64,69) and background color of RGB(21,92,162) resulting in a contrast ratio of 1.54. This is below the WCAG recommended minimum of 4.5:1 for normal text. The span element has a foreground color of RGB(167,173,180) and background color of RGB(255,255,255) resulting in a contrast ratio of 2.26. This is below the WCAG recommended minimum of 4.5:1 for normal text. The button element has a foreground color of RGB(27,117,208) and background color of RGB(241,242,243) resulting in a contrast ratio of 4.16. This is below the WCAG recommended minimum of 4.5:1 for normal text. The a, fg:255,255,255 bg: 231,112,13. This is below the WCAG recommended minimum of 4.5:1 for normal text. The a, fg: 27,117,208, and background color of RGB(12,13,14) resulting in a contrast ratio of 4.17. This is below the WCAG recommended minimum of 4.5:1 for normal text.",
+        "name": "contrast-agent",
+        "role": "user"
+    },
+    {
+        "content": "- color-contrast (impact: serious)\n    Categories: cat.color\n    Description: Ensure the contrast between foreground and background colors meets WCAG 2 AA minimum contrast ratio thresholds\n    Help: Elements must meet minimum color contrast ratio thresholds\n    FailureSummary: Fix any of the following:; Element has insufficient color contrast of 3.12 (foreground color: #ffffff, background color: #e7700d, font size: 8.3pt (11px), font weight: normal). Expected contrast ratio of 4.5:1 | Fix any of the following:; Element has insufficient color contrast of 3.12 (foreground color: #ffffff, background color: #e7700d, font size: 9.8pt (13px), font weight: normal). Expected contrast ratio of 4.5:1\n- heading-order (impact: moderate)\n    Categories: cat.semantics\n    Description: Ensure the order of headings is semantically correct\n    Help: Heading levels should only increase by one\n    FailureSummary: Fix any of the following:; Heading order invalid | Fix any of the following:; Heading order invalid\n- link-name (impact: serious)\n    Categories: cat.name-role-value\n    Description: Ensure links have discernible text\n    Help: Links must have discernible text\n    FailureSummary: Fix all of the following:; Element is in tab order and does not have accessible text\n\nFix any of the following:; Element does not have text that is visible to screen readers; aria-label attribute does not exist or is empty; aria-labelledby attribute does not exist, references elements that do not exist or references elements that are empty; Element has no title attribute | Fix all of the following:; Element is in tab order and does not have accessible text\n\nFix any of the following:; Element does not have text that is visible to screen readers; aria-label attribute does not exist or is empty; aria-labelledby attribute does not exist, references elements that do not exist or references elements that are empty; Element has no title attribute",
+        "name": "axe-violations-agent",
+        "role": "user"
+    },
+    {
+        "content": "For nodeId img-0, the alt image text is 'site logo', and the generated caption is 'a white and black box with a black lid'. For nodeId img-1, the alt text is missing and the generated caption is 'the four different colors of the logo'. For nodeId img-2, the alt image text is 'Thiru Kumaran's user avatar', and the generated caption is 'a white background with many squares'. For nodeId img-3, the alt image text is 'healthcare healthcare's user avatar', and the generated caption is 'a white background with black squares'. For nodeId img-4, the alt image text is 'kdeepak's user avatar', and the generated caption is 'a white and green square pattern'. For nodeId img-5, the alt image text is 'Parama Artha's user avatar', and the generated caption is 'a man in a suit and tie standing in front of a white background'. For nodeId img-6, the alt image text is 'Abid Fakhrealam's user avatar', and the generated caption is 'a blue man with a white background'. For nodeId img-7, the alt image text is 'ApENg's user avatar', and the generated caption is 'a white and brown square pattern'. For nodeId img-8, the alt image text is 'arubaito's user avatar', and the generated caption is 'a pink and white checkered pattern'. For nodeId img-9, the alt image text is 'Tareq's user avatar', and the generated caption is 'a man with a beard and a beard'. For nodeId img-10, the alt image text is 'Tumuruu Enkhl's user avatar', and the generated caption is 'a green leaf on a white background'. For nodeId img-11, the alt image text is 'h\u01b0\u01a1ng tr\u00e0 \u0111\u1ed7's user avatar', and the generated caption is 'a brown and white square pattern'. For nodeId img-12, the alt image text is 'Peter's user avatar', and the generated caption is 'a white and black square pattern'. For nodeId img-13, the alt image text is 'Chapo's user avatar', and the generated caption is 'a red and white checkered pattern'. For nodeId img-14, the alt image text is 'pushpak kollisetty's user avatar', and the generated caption is 'a green and white abstract background'. For nodeId img-15, the alt image text is 'Justi's user avatar', and the generated caption is 'a green and white background with a small square pattern'. For nodeId img-16, the alt image text is 'Drew Ashley's user avatar', and the generated caption is 'a black and white pattern with squares'. For nodeId svg-0, the alt text is missing and the generated caption is 'a white background with a blur effect'. For nodeId svg-1, the alt text is missing and the generated caption is 'a black and white photo of a man with a beard'. For nodeId svg-2, the alt text is missing and the generated caption is 'a pair of black and white shoes'. For nodeId svg-3, the alt text is missing and the generated caption is 'a white and black striped rug with a white border'. For nodeId svg-4, the alt text is missing and the generated caption is 'a magnit with a magnit on it'. For nodeId svg-7, the alt text is missing and the generated caption is 'a white background with a black and white image'. For nodeId svg-8, the alt text is missing and the generated caption is 'a white and black striped rug with a white border'. For nodeId svg-9, the alt text is missing and the generated caption is 'a house with a roof and a chimney'. For nodeId svg-10, the alt text is missing and the generated caption is 'a black and white square icon with a white q'. For nodeId svg-11, the alt text is missing and the generated caption is 'a black plastic hex hex hex hex hex hex hex hex hex hex hex'. For nodeId svg-12, the alt text is missing and the generated caption is 'a black and white photo of a square frame'. For nodeId svg-13, the alt text is missing and the generated caption is 'the logo for the new app'. For nodeId svg-14, the alt text is missing and the generated caption is 'a blue icon with a white background and a white text'. For nodeId svg-15, the alt text is missing and the generated caption is 'a pair of black plastic headphones'. For nodeId svg-16, the alt text is missing and the generated caption is 'a black briefcase with a handle'. For nodeId svg-17, the alt text is missing and the generated caption is 'the logo for the new logo for the new logo'. For nodeId svg-18, the alt text is missing and the generated caption is 'a cross with a white background'. For nodeId svg-22, the alt text is missing and the generated caption is 'the logo for the new yorks'. For nodeId svg-23, the alt text is missing and the generated caption is 'a black object with a white background'. For nodeId svg-24, the alt text is missing and the generated caption is 'a black object is seen in this image'. For nodeId svg-25, the alt text is missing and the generated caption is 'a black and orange logo with a white background'. For nodeId svg-26, the alt text is missing and the generated caption is 'the logo for the new app'.",
+        "name": "image-captioning-agent",
+        "role": "user"
+    },
+    {
+        "content": "The page has several accessibility issues that need to be addressed. \n\nSemanticAgent identified two semantic violations. The first is related to the order of headings. The order of headings is not semantically correct, which can make the page difficult to navigate for users who rely on screen readers. The recommendation is to ensure that heading levels only increase by one. The second violation is related to landmarks. Landmarks must have a unique role or role/label/title (i.e., accessible name) combination. The recommendation is to ensure landmarks are unique.\n\nContrastAgent and AxeViolationsAgent identified several color contrast issues. The contrast between foreground and background colors in several elements does not meet the WCAG 2 AA minimum contrast ratio thresholds. This can make the text difficult to read for users with low vision or color vision deficiencies. The recommendation is to adjust the color of these elements to meet the minimum contrast ratio of 4.5:1 for normal text.\n\nAxeViolationsAgent also identified a serious issue with link names. Some links do not have discernible text, which can make them difficult to understand for users who rely on screen readers. The recommendation is to ensure all links have discernible text.\n\nImageCaptioningAgent identified several images and SVGs with missing alt text. Alt text is essential for users who rely on screen readers as it provides a description of the image content. The recommendation is to add meaningful alt text to all images and SVGs.\n\nIn conclusion, the page needs several improvements to meet accessibility standards. These include adjusting the order of headings, ensuring landmarks are unique, improving color contrast, adding discernible text to links, and adding alt text to images and SVGs.",
+        "name": "VisuallyImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The page structure presents several keyboard navigation barriers:\n\n1. **Heading Order**: The semantic violation related to heading order can create confusion for keyboard-only users who navigate content using headings. If the heading levels do not increase by one, it can be difficult for these users to understand the structure and hierarchy of the content.\n\n2. **Landmarks**: The violation related to landmarks can also pose a barrier for keyboard navigation. Landmarks provide a way for keyboard-only users to navigate to different sections of a page. If landmarks are not unique, it can be difficult for these users to understand where they are on the page.\n\n3. **Color Contrast**: The color contrast issues identified can make it difficult for keyboard-only users to see and navigate to different elements on the page. If the contrast between foreground and background colors is too low, these users may struggle to see the elements clearly, making navigation difficult.\n\n4. **Link Names**: The issue with link names can also pose a barrier for keyboard navigation. If links do not have discernible text, keyboard-only users may not understand the purpose of the link, making it difficult for them to decide whether to navigate to it.\n\n5. **Missing Alt Text**: The missing alt text for images and SVGs can pose a barrier for keyboard-only users who rely on screen readers. Without alt text, these users will not receive a description of the image content, making it difficult for them to understand the content of the page.\n\nTo improve keyboard navigation, the page should correct the heading order, ensure landmarks are unique, improve color contrast, add discernible text to links, and add alt text to images and SVGs.",
+        "name": "MotorImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "As a color-blind user, the reported contrast ratios and semantic issues do affect my ability to distinguish page elements. The contrast ratios for several elements are below the WCAG recommended minimum of 4.5:1 for normal text. This includes elements with foreground colors of RGB(27,117,208), RGB(12,13,14), RGB(255,255,255), RGB(59,64,69), RGB(167,173,180), and background colors of RGB(237,245,253), RGB(99,107,116), RGB(231,112,13), RGB(21,92,162), RGB(255,255,255), and RGB(241,242,243). \n\nThese low contrast ratios can make it difficult for me to read the text, especially if the text is small. The color contrast issues identified by the AxeViolationsAgent further confirm these problems. \n\nThe semantic issues reported, such as the incorrect order of headings and non-unique landmarks, do not directly relate to my color-blindness, but they can affect the overall accessibility of the page. \n\nIn conclusion, the page has several color-related problems that need to be addressed to improve accessibility for color-blind users like me.",
+        "name": "ColorBlindAgent",
+        "role": "user"
+    },
+    {
+        "content": "Based on the findings from the SemanticAgent, ContrastAgent, AxeViolationsAgent, ImageCaptioningAgent, VisuallyImpairedAgent, MotorImpairedAgent, and ColorBlindAgent, the following code-level fixes are recommended:\n\n1. **Heading Order** (SemanticAgent, VisuallyImpairedAgent, MotorImpairedAgent): Ensure that heading levels only increase by one. For example, if you have an `<h2>` element, the next heading should be `<h3>`, not `<h4>`.\n   ```html\n   <h1>Main Title</h1>\n   <h2>Subheading</h2>\n   <h3>Sub-subheading</h3>\n   ```\n\n2. **Landmarks** (SemanticAgent, VisuallyImpairedAgent, MotorImpairedAgent): Ensure landmarks are unique by providing unique role or role/label/title combinations. For example, if you have multiple navigation landmarks, distinguish them using `aria-label`.\n   ```html\n   <nav aria-label=\"Primary navigation\"></nav>\n   <nav aria-label=\"Secondary navigation\"></nav>\n   ```\n\n3. **Color Contrast** (ContrastAgent, AxeViolationsAgent, VisuallyImpairedAgent, MotorImpairedAgent, ColorBlindAgent): Adjust the color of elements to meet the minimum contrast ratio of 4.5:1 for normal text. This can be done in CSS.\n   ```css\n   .example {\n     color: #000000; /* foreground color */\n     background-color: #FFFFFF; /* background color */\n   }\n   ```\n\n4. **Link Names** (AxeViolationsAgent, VisuallyImpairedAgent, MotorImpairedAgent): Ensure all links have discernible text. This can be done by providing inner text to anchor tags or using the `aria-label` attribute.\n   ```html\n   <a href=\"example.html\">Example Link</a>\n   <!-- or -->\n   <a href=\"example.html\" aria-label=\"Example Link\"></a>\n   ```\n\n5. **Alt Text** (ImageCaptioningAgent, VisuallyImpairedAgent, MotorImpairedAgent): Add meaningful alt text to all images and SVGs. This can be done by adding the `alt` attribute to `img` tags and `desc` tags to SVGs.\n   ```html\n   <img src=\"example.jpg\" alt=\"Example image description\">\n   <!-- or -->\n   <svg>\n     <desc>Example SVG description</desc>\n   </svg>\n   ```",
+        "name": "FixingAgent",
+        "role": "user"
+    }
+],
+"Stanford" : [
+    {
+        "content": "No semantic violations found in page",
+        "name": "semantic-agent",
+        "role": "user"
+    },
+    {
+        "content": "The li element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The li element has a foreground color of RGB(0,0,0) and background color of RGB(0,0,0) resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The p, fg:255,255,255 bg:255,255 resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The a, fg:255,255,255 bg:255,255 resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The p, fg:255,255,255 bg:255,255 resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text. The a, fg:255,255,255 bg:255,255 resulting in a contrast ratio of 1.00. This is below the WCAG recommended minimum of 4.5:1 for normal text.",
+        "name": "contrast-agent",
+        "role": "user"
+    },
+    {
+        "content": "- aria-allowed-role (impact: minor)\n    Categories: cat.aria\n    Description: Ensure role attribute has an appropriate value for the element\n    Help: ARIA role should be appropriate for the element\n    FailureSummary: Fix any of the following:; ARIA role presentation is not allowed for given element | Fix any of the following:; ARIA role presentation is not allowed for given element | Fix any of the following:; ARIA role presentation is not allowed for given element",
+        "name": "axe-violations-agent",
+        "role": "user"
+    },
+    {
+        "content": "For nodeId img-0, the alt text is missing and the generated caption is 'stanford university website'. For nodeId img-1, the alt text is missing and the generated caption is 'a man and woman in lab coats standing next to each other people'. For nodeId img-2, the alt text is missing and the generated caption is 'a woman is holding a bottle of liquid'. For nodeId img-3, the alt text is missing and the generated caption is 'a woman in a hospital bed with a nurse'. For nodeId img-4, the alt text is missing and the generated caption is 'a view of the ocean and buildings from a balcony'. For nodeId img-5, the alt text is missing and the generated caption is 'a typewriter sitting on a table with a red chair in the background'. For nodeId img-6, the alt text is missing and the generated caption is 'a man in a lab with a white coat'. For nodeId img-7, the alt image text is 'Three students work together in a robotics lab', and the generated caption is 'a man holding a camera in an office'. For nodeId img-8, the alt text is missing and the generated caption is 'a man and woman working in a factory'. For nodeId img-9, the alt text is missing and the generated caption is 'a woman in yellow jacket talking to another woman'. For nodeId img-10, the alt text is missing and the generated caption is 'a woman in black shirt and gloves is writing on a table'. For nodeId img-11, the alt text is missing and the generated caption is 'a person is walking down a dark hallway'. For nodeId img-12, the alt text is missing and the generated caption is 'art of science at the museum of science'. For nodeId img-13, the alt image text is 'music department logo on red background', and the generated caption is 'music at stanford'. For nodeId img-14, the alt text is missing and the generated caption is 'a field of orange flowers with a barn in the background'. For nodeId img-15, the alt text is missing and the generated caption is 'a woman in a brown jacket and black shirt'. For nodeId img-16, the alt text is missing and the generated caption is 'a group of people working in a laboratory'. For nodeId img-17, the alt text is missing and the generated caption is 'a man walking through a glass ceiling'. For nodeId img-18, the alt text is missing and the generated caption is 'a group of people working on a project'. For nodeId img-19, the alt text is missing and the generated caption is 'a woman using a virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual'. For nodeId img-20, the alt text is missing and the generated caption is 'a woman wearing a virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual virtual'. For nodeId img-21, the alt text is missing and the generated caption is 'a crowd of people walking around a campus'. For nodeId img-22, the alt image text is 'Visitors look at an installation in the Cantor Arts Center', and the generated caption is 'a man and woman looking at a large map'. For nodeId img-23, the alt text is missing and the generated caption is 'two girls are sitting on the ground while one girl is tying her shoes'. For nodeId img-24, the alt image text is 'Stanford Men's Gymnastics celebrates a third consecutive NCAA championship', and the generated caption is 'the boys wrestling team is holding up their trophy'. For nodeId img-25, the alt text is missing and the generated caption is 'a swimmer in the pool'. For nodeId img-26, the alt text is missing and the generated caption is 'a little girl is running to first base'. For nodeId img-27, the alt image text is 'Stanford student Maya Guzdar and friends walk through an archway on Main Quad', and the generated caption is 'a group of women walking down a sidewalk'. For nodeId img-28, the alt text is missing and the generated caption is 'a screen shot of a screen shot of a mountain'.",
+        "name": "image-captioning-agent",
+        "role": "user"
+    },
+    {
+        "content": "The page seems to have several accessibility issues. \n\nFrom the SemanticAgent, there are no semantic violations, which means the HTML elements are used correctly and in a way that supports accessibility.\n\nHowever, the ContrastAgent has identified multiple contrast issues. The li elements, p elements, and a elements all have a contrast ratio of 1.00, which is significantly below the WCAG recommended minimum of 4.5:1 for normal text. This could make the text difficult to read for users with visual impairments.\n\nThe AxeViolationsAgent has identified minor ARIA role violations. The role attribute on some elements is not appropriate, which could cause confusion for screen reader users.\n\nThe ImageCaptioningAgent has identified multiple images with missing alt text. Alt text is crucial for visually impaired users as it provides a description of the image content. Some of the generated captions do not match the provided alt text, suggesting that the alt text may not accurately represent the image content. For example, for nodeId img-7, the alt text is 'Three students work together in a robotics lab', but the generated caption is 'a man holding a camera in an office'. This discrepancy could be confusing for users who rely on alt text to understand the image content.\n\nIn conclusion, while the page has no semantic violations, it has several contrast, ARIA role, and alt text issues that could negatively impact accessibility. These issues should be addressed to improve the user experience for all users, particularly those with visual impairments.",
+        "name": "VisuallyImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The page structure seems to have several keyboard navigation barriers:\n\n1. Contrast Issues: The ContrastAgent has identified multiple contrast issues with the li, p, and a elements. These elements have a contrast ratio of 1.00, which is significantly below the WCAG recommended minimum of 4.5:1 for normal text. This could make the text difficult to read for users with visual impairments and could also make it difficult for keyboard-only users to see where their focus is on the page if these elements are focusable.\n\n2. ARIA Role Violations: The AxeViolationsAgent has identified minor ARIA role violations. Some elements have an inappropriate role attribute. This could cause confusion for keyboard-only users who rely on ARIA roles to understand the functionality of different elements on the page.\n\n3. Missing Alt Text: The ImageCaptioningAgent has identified multiple images with missing alt text. Alt text is crucial for keyboard-only users who rely on screen readers, as it provides a description of the image content. Without alt text, keyboard-only users may not be able to understand the content or purpose of these images.\n\n4. Inaccurate Alt Text: Some of the generated captions do not match the provided alt text. For example, for nodeId img-7, the alt text is 'Three students work together in a robotics lab', but the generated caption is 'a man holding a camera in an office'. This discrepancy could be confusing for keyboard-only users who rely on alt text to understand the image content.\n\nIn conclusion, the page has several keyboard navigation barriers that could negatively impact the user experience for keyboard-only users. These barriers should be addressed to improve accessibility.",
+        "name": "MotorImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "As a color-blind user, the reported contrast ratios are a significant issue. The li, p, and a elements all have a contrast ratio of 1.00, which is far below the WCAG recommended minimum of 4.5:1 for normal text. This means that the text in these elements would be very difficult for me to read, as the foreground and background colors are too similar. \n\nThe semantic issues reported do not directly relate to color, but they could still affect my overall experience of the page. The ARIA role violations could make the page more confusing to navigate if I were using a screen reader.\n\nThe missing or inaccurate alt text for images is also a concern. While this doesn't directly relate to my color blindness, it could still affect my understanding of the page content if I were using a screen reader. \n\nIn conclusion, the color contrast issues are a significant barrier for me as a color-blind user. The other issues reported could also affect my experience if I were using assistive technologies like a screen reader.",
+        "name": "ColorBlindAgent",
+        "role": "user"
+    },
+    {
+        "content": "\n\n1. Contrast Issues (Raised by ContrastAgent)\n   - Issue: The li, p, and a elements have a contrast ratio of 1.00, which is below the WCAG recommended minimum of 4.5:1 for normal text.\n   - Fix: Adjust the color of the text or the background to increase the contrast ratio. Here's an example of how to do this in CSS:\n\n```css\nli, p, a {\n    color: #000000; /* or any other color with sufficient contrast */\n    background-color: #FFFFFF; /* or any other color with sufficient contrast */\n}\n```\n\n2. ARIA Role Violations (Raised by AxeViolationsAgent)\n   - Issue: Some elements have an inappropriate ARIA role attribute.\n   - Fix: Ensure that the role attribute has an appropriate value for the element. Here's an example of how to do this in HTML:\n\n```html\n<div role=\"appropriateRole\"> <!-- replace \"appropriateRole\" with the correct role -->\n    <!-- element content -->\n</div>\n```\n\n3. Missing Alt Text (Raised by ImageCaptioningAgent)\n   - Issue: Multiple images are missing alt text.\n   - Fix: Add alt text to each image that accurately describes the image content. Here's an example of how to do this in HTML:\n\n```html\n<img src=\"image.jpg\" alt=\"accurate description of image\"> <!-- replace \"image.jpg\" with the image source and \"accurate description of image\" with the correct description -->\n```\n\n4. Inaccurate Alt Text (Raised by ImageCaptioningAgent)\n   - Issue: The alt text for some images does not accurately represent the image content.\n   - Fix: Update the alt text to accurately describe the image content. Here's an example of how to do this in HTML:\n\n```html\n<img src=\"image.jpg\" alt=\"accurate description of image\"> <!-- replace \"image.jpg\" with the image source and \"accurate description of image\" with the correct description -->\n```",
+        "name": "FixingAgent",
+        "role": "user"
+    }
+],
+"Wikipedia": [
+    {
+        "content": "No semantic violations found in page",
+        "name": "semantic-agent",
+        "role": "user"
+    },
+    {
+        "content": "No contrast violations found on the page.",
+        "name": "contrast-agent",
+        "role": "user"
+    },
+    {
+        "content": "No axe violations found.",
+        "name": "axe-violations-agent",
+        "role": "user"
+    },
+    {
+        "content": "For nodeId img-0, the alt text is missing and the generated caption is 'a white puzzle ball with letters on it'.",
+        "name": "image-captioning-agent",
+        "role": "user"
+    },
+    {
+        "content": "Based on the reports from the SemanticAgent, ContrastAgent, and AxeViolationsAgent, the page seems to be well-structured and accessible in terms of semantics, contrast, and common accessibility issues. However, the ImageCaptioningAgent has identified an issue with an image (nodeId img-0) on the page. The image lacks alt text, which is crucial for screen-reader users to understand the content of the image. The generated caption is 'a white puzzle ball with letters on it', which should ideally be included as the alt text for the image to improve its accessibility.",
+        "name": "VisuallyImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "The page structure seems to be well-organized with no semantic, contrast, or common accessibility issues. However, there is a keyboard navigation barrier identified by the ImageCaptioningAgent. The image with nodeId img-0 lacks alt text. This is a barrier for keyboard-only users who rely on screen readers, as the screen reader cannot provide a description of the image without alt text. The generated caption 'a white puzzle ball with letters on it' should be included as the alt text for this image to improve keyboard navigation.",
+        "name": "MotorImpairedAgent",
+        "role": "user"
+    },
+    {
+        "content": "As a color-blind user, I can confirm that the reported contrast ratio is sufficient since the ContrastAgent found no contrast violations on the page. This means that the text and background colors on the page have enough contrast, making it easier for me to distinguish between different page elements. However, the ImageCaptioningAgent reported a missing alt text for an image (nodeId img-0). While this is not a color-related issue, it's worth noting for overall accessibility.",
+        "name": "ColorBlindAgent",
+        "role": "user"
+    },
+    {
+        "content": "\n\n1. Missing alt text for image (nodeId img-0)\n   - Raised by: ImageCaptioningAgent, VisuallyImpairedAgent, MotorImpairedAgent, ColorBlindAgent\n   - Fix: Add an alt attribute to the image tag with the generated caption as its value. This will provide a description of the image for screen-reader users and improve keyboard navigation.\n\nHTML snippet:\n```html\n<img id=\"img-0\" src=\"image-source.jpg\" alt=\"a white puzzle ball with letters on it\">\n```\nThis fix ensures that the image is accessible to all users, including those who rely on screen readers or keyboard navigation.",
+        "name": "FixingAgent",
+        "role": "user"
+    }
+]
+}